@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark copying of records.
+
+Compares :func:`copy.deepcopy` with
+:func:`invenio_records.dictutils.deepcopy_json` on the MARC21 sample data.
+
+Usage::
+
+    python benchmarks/bench_copy.py
+"""
+
+import os
+import timeit
+from copy import deepcopy
+from xml.etree import ElementTree
+
+from invenio_records.dictutils import deepcopy_json
+
+MARC21 = os.path.join(
+    os.path.dirname(__file__), "..", "invenio_records", "data", "marc21"
+)
+NS = "{http://www.loc.gov/MARC21/slim}"
+
+
+def load_records(filename):
+    """Load MARCXML records as JSON documents."""
+    tree = ElementTree.parse(os.path.join(MARC21, filename))
+    records = []
+    for record in tree.getroot().iter(f"{NS}record"):
+        fields = []
+        for field in record:
+            tag = field.get("tag")
+            if field.tag == f"{NS}controlfield":
+                fields.append({"tag": tag, "value": field.text})
+            else:
+                fields.append(
+                    {
+                        "tag": tag,
+                        "ind1": field.get("ind1"),
+                        "ind2": field.get("ind2"),
+                        "subfields": [
+                            {"code": s.get("code"), "value": s.text} for s in field
+                        ],
+                    }
+                )
+        records.append({"fields": fields})
+    return records
+
+
+def main():
+    """Run the benchmark."""
+    records = load_records("bibliographic.xml") + load_records("authority.xml")
+    number = 20
+    for name, func in (("copy.deepcopy", deepcopy), ("deepcopy_json", deepcopy_json)):
+        seconds = timeit.timeit(lambda: [func(r) for r in records], number=number)
+        print(f"{name:>15}: {seconds / number * 1000:8.2f} ms per pass")
+    print(f"({len(records)} records per pass)")
+
+
+if __name__ == "__main__":
+    main()
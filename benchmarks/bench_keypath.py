@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark lookups by dot-notation keys.
+
+Compares :func:`invenio_records.dictutils.dict_lookup` and
+:func:`invenio_records.dictutils.dict_set` with a compiled
+:class:`invenio_records.dictutils.KeyPath`.
+
+Usage::
+
+    python benchmarks/bench_keypath.py
+"""
+
+import timeit
+
+from invenio_records.dictutils import KeyPath, dict_lookup, dict_set
+
+RECORD = {
+    "metadata": {
+        "title": "A title",
+        "creators": [{"person": {"name": "Doe, John", "affiliation": {"id": "cern"}}}],
+        "languages": [{"id": "eng"}, {"id": "fra"}],
+    }
+}
+KEYS = [
+    "metadata",
+    "metadata.title",
+    "metadata.languages.1.id",
+    "metadata.creators.0.person.affiliation.id",
+]
+
+
+def main():
+    """Run the benchmark."""
+    number = 200000
+    for key in KEYS:
+        path = KeyPath(key)
+        results = {
+            "dict_lookup": timeit.timeit(
+                lambda: dict_lookup(RECORD, key), number=number
+            ),
+            "KeyPath.get": timeit.timeit(lambda: path.get(RECORD), number=number),
+            "dict_set": timeit.timeit(lambda: dict_set({}, key, 1), number=number),
+            "KeyPath.set": timeit.timeit(lambda: path.set({}, 1), number=number),
+        }
+        print(key)
+        for name, seconds in results.items():
+            print(f"{name:>15}: {seconds / number * 1e9:8.1f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
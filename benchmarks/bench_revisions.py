@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Benchmark the delta-compressed storage of revisions.
+
+Edits a large record (the MARC21 sample records merged in one document)
+many times, with and without ``RECORDS_REVISIONS_DELTA``, and compares the
+size of the stored versions and the time to reconstruct the revisions.
+
+Usage::
+
+    python benchmarks/bench_revisions.py
+
+Set ``SQLALCHEMY_DATABASE_URI`` to run it against another database than an
+in-memory SQLite database.
+"""
+
+import json
+import os
+import timeit
+
+from bench_copy import load_records
+from flask import Flask
+from invenio_db import InvenioDB, db
+
+from invenio_records import InvenioRecords, Record
+
+
+def create_app():
+    """Create a minimal application."""
+    app = Flask("bench")
+    app.config.update(
+        {
+            "SQLALCHEMY_DATABASE_URI": os.environ.get(
+                "SQLALCHEMY_DATABASE_URI", "sqlite://"
+            ),
+            "SQLALCHEMY_TRACK_MODIFICATIONS": False,
+        }
+    )
+    InvenioDB(app)
+    InvenioRecords(app)
+    return app
+
+
+def edit_record(data, revisions):
+    """Create a record and commit small changes to it."""
+    record = Record.create(data)
+    db.session.commit()
+    for i in range(revisions):
+        record["fields"][i % len(record["fields"])]["tag"] = f"{i:03}"
+        record.commit()
+        db.session.commit()
+    return record
+
+
+def main():
+    """Run the benchmark."""
+    app = create_app()
+    records = load_records("bibliographic.xml")
+    data = {"fields": [f for r in records for f in r["fields"]]}
+    revisions = 100
+
+    with app.app_context():
+        db.create_all()
+        for delta in (False, True):
+            app.config["RECORDS_REVISIONS_DELTA"] = delta
+            record = edit_record(data, revisions)
+            versions = list(record.model.versions)
+            size = sum(len(json.dumps(v.json)) for v in versions)
+
+            def load_revisions():
+                db.session.expire_all()
+                return [r.revision_id for r in record.revisions]
+
+            seconds = timeit.timeit(load_revisions, number=3) / 3
+            print(
+                f"delta={delta!s:>5}: {size / 1024:9.1f} KiB stored, "
+                f"{seconds / len(versions) * 1000:6.2f} ms per revision loaded"
+            )
+        print(
+            f"({revisions} revisions of a {len(json.dumps(data)) // 1024} KiB record)"
+        )
+        db.drop_all()
+
+
+if __name__ == "__main__":
+    main()
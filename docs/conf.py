@@ -344,4 +344,6 @@ nitpick_ignore = [
     ("py:class", "jsonschema.exceptions.ValidationError"),
     ("py:class", "jsonschema.validate"),
     ("py:class", "jsonschema.exceptions.ValidationError"),
+    ("py:func", "copy.deepcopy"),
+    ("py:mod", "json"),
 ]
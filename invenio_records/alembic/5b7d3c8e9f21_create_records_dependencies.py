@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Create records dependencies table."""
+
+import sqlalchemy as sa
+import sqlalchemy_utils
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b7d3c8e9f21"
+down_revision = "66db9c49c699"
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "records_dependencies",
+        sa.Column("record_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("related_id", sqlalchemy_utils.types.uuid.UUIDType(), nullable=False),
+        sa.Column("related_revision", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "record_id", "related_id", name=op.f("pk_records_dependencies")
+        ),
+    )
+    op.create_index(
+        op.f("ix_records_dependencies_related_id"),
+        "records_dependencies",
+        ["related_id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_records_dependencies_related_id"),
+        table_name="records_dependencies",
+    )
+    op.drop_table("records_dependencies")
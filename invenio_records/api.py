@@ -6,22 +6,26 @@
 
 """Record API."""
 
-import inspect
+import uuid
 import warnings
-from copy import deepcopy
+from itertools import islice
 
 from flask import current_app
 from invenio_db import db
 from jsonpatch import apply_patch
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.orm.exc import NoResultFound
-from sqlalchemy_continuum.utils import parent_class
+from sqlalchemy_continuum.utils import option, parent_class, version_class
 from werkzeug.local import LocalProxy
 
-from .dictutils import clear_none, dict_lookup
+from .dictutils import KeyPath, clear_none, deepcopy_json, dict_lookup
 from .dumpers import Dumper
-from .errors import MissingModelError
-from .models import RecordMetadata
+from .errors import MissingModelError, ReadOnlyRecordError, StaleRecordsError
+from .extensions import _hook_takes_data
+from .models import PartialRecordModel, RecordMetadata
+from .revisions import version_json
 from .signals import (
     after_record_delete,
     after_record_insert,
@@ -36,6 +40,35 @@ from .signals import (
 _records_state = LocalProxy(lambda: current_app.extensions["invenio-records"])
 
 
+def _as_uuid(id_):
+    """Convert a record ID to a UUID (``None`` if it is not a valid UUID)."""
+    if isinstance(id_, uuid.UUID):
+        return id_
+    try:
+        return uuid.UUID(str(id_))
+    except ValueError:
+        return None
+
+
+def _chunked(iterable, size):
+    """Split an iterable into lists of at most ``size`` items."""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _projection_paths(fields):
+    """Parse dot-notation fields, skipping fields included in another one."""
+    paths = []
+    for path in sorted({tuple(f.split(".")) for f in fields}, key=len):
+        if not any(path[: len(p)] == p for p in paths):
+            paths.append(path)
+    return paths
+
+
 class RecordBase(dict):
     """Base class for Record and RecordRevision to share common features."""
 
@@ -172,17 +205,27 @@ class RecordBase(dict):
         # 2) We ignore **kwargs (but keep it for backward compatibility) as
         # the jsonschema.protocols.Validator only takes the two keyword
         # arguments formater_checker and cls (i.e. validator).
-        self._validate(format_checker=format_checker, validator=validator)
+        # 3) Without an encoder the dictionary is already a JSON document, and
+        # since nothing is persisted, we can validate it without a copy.
+        self._validate(
+            format_checker=format_checker,
+            validator=validator,
+            encode=self.model_cls.encoder is not None,
+        )
 
-    def _validate(self, format_checker=None, validator=None, use_model=False):
+    def _validate(
+        self, format_checker=None, validator=None, use_model=False, encode=True
+    ):
         """Implementation of the JSONSchema validation."""
         # Use the encoder to transform Python dictionary into JSON document
         # prior to validation unless we explicitly ask to use the already
         # encoded JSON in the model.
         if use_model:
             json = self.model.json
-        else:
+        elif encode:
             json = self.model_cls.encode(dict(self))
+        else:
+            json = self
 
         if "$schema" in self and self["$schema"] is not None:
             # Validate (an error will raise an exception)
@@ -224,22 +267,9 @@ class RecordBase(dict):
         dumper = dumper or self.dumper
 
         data = {}
+        self._pre_dump(data, dumper)
 
-        # Run pre dump extensions
-        for e in self._extensions:
-            pre_dump_params = inspect.signature(e.pre_dump).parameters
-            if "data" in pre_dump_params:
-                e.pre_dump(self, data, dumper=dumper)
-            else:
-                # TODO: Remove in v1.6.0 or later
-                warnings.warn(
-                    "The pre_dump hook must take a positional argument data.",
-                    DeprecationWarning,
-                )
-                e.pre_dump(self, dumper=dumper)
-
-        dump_params = inspect.signature(dumper.dump).parameters
-        if "data" in dump_params:
+        if _hook_takes_data(dumper, "dump"):
             # Execute the dump - for backwards compatibility we use the default
             # dumper which returns a deepcopy.
             data = dumper.dump(self, data)
@@ -251,10 +281,26 @@ class RecordBase(dict):
             )
             data = dumper.dump(self)
 
+        self._post_dump(data, dumper)
+        return data
+
+    def _pre_dump(self, data, dumper):
+        """Run the pre dump extensions."""
         for e in self._extensions:
-            e.post_dump(self, data, dumper=dumper)
+            if _hook_takes_data(e, "pre_dump"):
+                e.pre_dump(self, data, dumper=dumper)
+            else:
+                # TODO: Remove in v1.6.0 or later
+                warnings.warn(
+                    "The pre_dump hook must take a positional argument data.",
+                    DeprecationWarning,
+                )
+                e.pre_dump(self, dumper=dumper)
 
-        return data
+    def _post_dump(self, data, dumper):
+        """Run the post dump extensions."""
+        for e in self._extensions:
+            e.post_dump(self, data, dumper=dumper)
 
     @classmethod
     def loads(cls, data, loader=None):
@@ -268,17 +314,23 @@ class RecordBase(dict):
         # instead.
         loader = loader or cls.dumper
 
-        data = deepcopy(data)  # avoid mutating the original object
-        # Run pre load extensions
+        data = deepcopy_json(data)  # avoid mutating the original object
+        cls._pre_load(data, loader)
+        record = loader.load(data, cls)
+        cls._post_load(record, data, loader)
+        return record
+
+    @classmethod
+    def _pre_load(cls, data, loader):
+        """Run the pre load extensions."""
         for e in cls._extensions:
             e.pre_load(data, loader=loader)
 
-        record = loader.load(data, cls)
-
-        # Run post load extensions
+    @classmethod
+    def _post_load(cls, record, data, loader):
+        """Run the post load extensions."""
         for e in cls._extensions:
-            post_load_params = inspect.signature(e.post_load).parameters
-            if "data" in post_load_params:
+            if _hook_takes_data(e, "post_load"):
                 e.post_load(record, data, loader=loader)
             else:
                 # TODO: Remove in v1.6.0 or later
@@ -288,8 +340,6 @@ class RecordBase(dict):
                 )
                 e.post_load(record, loader=loader)
 
-        return record
-
 
 class Record(RecordBase):
     """Define API for metadata creation and manipulation."""
@@ -362,6 +412,101 @@ class Record(RecordBase):
 
         return record
 
+    @classmethod
+    def create_many(cls, data, chunk_size=500, return_errors=False, **kwargs):
+        r"""Create many new records and store them in the database.
+
+        Works like :meth:`create`, but processes the records in chunks. Each
+        chunk is validated, added to the session and flushed inside a single
+        savepoint, so that all rows of a chunk are inserted with one
+        ``executemany`` statement instead of one savepoint and one ``INSERT``
+        per record.
+
+        Signals and extension hooks are sent/called for each record, exactly
+        like for :meth:`create`.
+
+        :Keyword Arguments:
+          * **format_checker** --
+            An instance of the class :class:`jsonschema.FormatChecker`, which
+            contains validation rules for formats. See
+            :func:`~invenio_records.api.RecordBase.validate` for more details.
+
+          * **validator** --
+            A :class:`jsonschema.protocols.Validator` class that will be used
+            to validate the records. See
+            :func:`~invenio_records.api.RecordBase.validate` for more details.
+
+        :param data: Iterable of dicts with the records metadata.
+        :param chunk_size: Number of records inserted per statement.
+        :param return_errors: If ``True``, exceptions raised while preparing or
+            validating a record are collected instead of raised, and the record
+            is skipped.
+        :returns: A list of new :class:`Record` instances. If ``return_errors``
+            is set, a tuple of the list of records and a list of
+            ``(index, exception)`` tuples, where ``index`` is the position of
+            the failing item in ``data``.
+        """
+        # For backward compatibility we pop them here.
+        format_checker = kwargs.pop("format_checker", None)
+        validator = kwargs.pop("validator", None)
+
+        records = []
+        errors = []
+        for chunk in _chunked(enumerate(data), chunk_size):
+            created = []
+            with db.session.begin_nested():
+                for index, item in chunk:
+                    try:
+                        # The id is set upfront, so that the database does not
+                        # have to return generated keys for the batch insert.
+                        record = cls(
+                            item,
+                            model=cls.model_cls(id=uuid.uuid4(), data=item),
+                            **kwargs,
+                        )
+
+                        if cls.send_signals:
+                            before_record_insert.send(
+                                current_app._get_current_object(), record=record
+                            )
+
+                        # Run pre create extensions
+                        for e in cls._extensions:
+                            e.pre_create(record)
+
+                        # Validate also encodes the data
+                        record._validate(
+                            format_checker=format_checker,
+                            validator=validator,
+                            use_model=True,
+                        )
+                    except Exception as e:
+                        if not return_errors:
+                            raise
+                        errors.append((index, e))
+                        continue
+                    created.append(record)
+
+                db.session.add_all([record.model for record in created])
+                # Flush the whole chunk at once (i.e. a single executemany).
+                db.session.flush()
+
+            for record in created:
+                if cls.send_signals:
+                    after_record_insert.send(
+                        current_app._get_current_object(), record=record
+                    )
+
+                # Run post create extensions
+                for e in cls._extensions:
+                    e.post_create(record)
+
+            records.extend(created)
+
+        if return_errors:
+            return records, errors
+        return records
+
     @classmethod
     def get_record(cls, id_, with_deleted=False):
         """Retrieve the record by id.
@@ -380,19 +525,167 @@ class Record(RecordBase):
             return cls(obj.data, model=obj)
 
     @classmethod
-    def get_records(cls, ids, with_deleted=False):
+    def get_records(
+        cls, ids, with_deleted=False, fields=None, ordered=False, chunk_size=500
+    ):
         """Retrieve multiple records by id.
 
+        Large lists of IDs are split in chunks, queried one after the other
+        in the current database session, to stay below the limits of the
+        databases on the number of query parameters.
+
         :param ids: List of record IDs.
         :param with_deleted: If `True` then it includes deleted records.
+        :param fields: List of keys in dot notation to load (see
+            :class:`~invenio_records.dictutils.KeyPath`). If given, only these
+            parts of the JSON documents are loaded (extracted by the database
+            on PostgreSQL), and the records are read-only (i.e. they cannot be
+            committed, deleted or reverted). The keys of a field are always
+            loaded as dictionary keys, on all databases: a list item (e.g.
+            ``"metadata.titles.0"``) is loaded under its index as a string
+            key (i.e. ``{"metadata": {"titles": {"0": ...}}}``), not as a list.
+        :param ordered: If `True`, the list of records is aligned with the
+            list of IDs, with ``None`` for the IDs which were not found (or
+            are deleted, or are not valid UUIDs). Otherwise, the records are
+            in no particular order and these IDs are skipped.
+        :param chunk_size: Maximum number of IDs per query.
         :returns: A list of :class:`Record` instances.
         """
-        with db.session.no_autoflush:
-            query = db.session.query(cls.model_cls).filter(cls.model_cls.id.in_(ids))
-            if not with_deleted:
-                query = query.filter(cls.model_cls.is_deleted != True)  # noqa
+        # Invalid IDs are handled like the IDs of missing records, and the
+        # same ID given as a string and as a UUID is fetched only once.
+        uuids = [_as_uuid(id_) for id_ in ids]
+
+        records = []
+        # Skip duplicated IDs, like a single ``IN`` clause would.
+        chunks = _chunked(dict.fromkeys(u for u in uuids if u is not None), chunk_size)
+        for chunk in chunks:
+            if fields is not None:
+                records.extend(cls._get_partial_records(chunk, fields, with_deleted))
+                continue
+            with db.session.no_autoflush:
+                query = db.session.query(cls.model_cls).filter(
+                    cls.model_cls.id.in_(chunk)
+                )
+                if not with_deleted:
+                    query = query.filter(cls.model_cls.is_deleted != True)  # noqa
+
+                records.extend(cls(obj.data, model=obj) for obj in query.all())
+
+        if not ordered:
+            return records
+        by_id = {r.id: r for r in records}
+        return [by_id.get(id_) for id_ in uuids]
+
+    @classmethod
+    def iter_records(cls, filter=None, batch_size=1000, with_deleted=False):
+        """Iterate over all the records.
+
+        The records are fetched by batches ordered by ID with keyset
+        pagination (i.e. ``WHERE id > <last ID>``), so that each batch costs
+        one indexed query wherever it is in the table. The records of a batch
+        are all initialized before the first one is returned, and their
+        models are expunged from the session (unless they have been modified)
+        before the next batch is fetched, which keeps the memory usage
+        constant over large tables.
+
+        :param filter: SQLAlchemy expression filtering the models (e.g.
+            ``RecordMetadata.created > date``).
+        :param batch_size: Number of records fetched by each query.
+        :param with_deleted: If `True` then it includes deleted records.
+        :returns: A generator of :class:`Record` instances.
+        """
+        model_cls = cls.model_cls
+        query = select(model_cls).order_by(model_cls.id).limit(batch_size)
+        if filter is not None:
+            query = query.where(filter)
+        if not with_deleted:
+            query = query.where(model_cls.is_deleted != True)  # noqa
+
+        last_id = None
+        while True:
+            batch_query = query
+            if last_id is not None:
+                batch_query = query.where(model_cls.id > last_id)
+            with db.session.no_autoflush:
+                models = db.session.scalars(batch_query).all()
+                records = [cls(obj.data, model=obj) for obj in models]
+            if not models:
+                return
+            # Read before returning the records, which may be modified.
+            last_id = models[-1].id
+
+            yield from records
+
+            for obj in models:
+                state = sa_inspect(obj)
+                if state.persistent and not state.modified:
+                    db.session.expunge(obj)
+            if len(models) < batch_size:
+                return
+
+    @classmethod
+    def _get_partial_records(cls, ids, fields, with_deleted):
+        """Retrieve multiple records with a projection of their JSON documents.
 
-            return [cls(obj.data, model=obj) for obj in query.all()]
+        On PostgreSQL each field is extracted from the JSONB column with the
+        ``#>`` operator, while on other databases the same paths are looked
+        up in the JSON documents in Python (without loading the models in the
+        session), so that both give the same projections.
+        """
+        model_cls = cls.model_cls
+        paths = _projection_paths(fields)
+        key_paths = [KeyPath(list(path)) for path in paths]
+        in_db = db.engine.dialect.name == "postgresql"
+
+        columns = [
+            model_cls.id,
+            model_cls.version_id,
+            model_cls.created,
+            model_cls.updated,
+            model_cls.is_deleted,
+        ]
+        if in_db:
+            for path in paths:
+                value = model_cls.json[path]
+                # A JSON null is not an SQL NULL, while a missing path is.
+                columns.extend((value, value.is_not(None)))
+        else:
+            columns.append(model_cls.json)
+
+        query = select(*columns).where(model_cls.id.in_(ids))
+        if not with_deleted:
+            query = query.where(model_cls.is_deleted != True)  # noqa
+        with db.session.no_autoflush:
+            rows = db.session.execute(query).all()
+
+        records = []
+        for row in rows:
+            model = PartialRecordModel(*row[:5])
+            if model.is_deleted:
+                data = None
+            elif in_db:
+                data = {}
+                values = row[5:]
+                for i, path in enumerate(key_paths):
+                    if values[2 * i + 1]:
+                        path.set(data, values[2 * i])
+            else:
+                data = {}
+                for path in key_paths:
+                    try:
+                        value = path.get(row[5])
+                    except KeyError:
+                        continue
+                    path.set(data, value)
+            if data is not None:
+                data = model_cls.decode(data)
+            records.append(cls(data, model=model))
+        return records
+
+    def _check_writable(self):
+        """Raise an error if the record has a read-only model."""
+        if isinstance(self.model, PartialRecordModel):
+            raise ReadOnlyRecordError()
 
     def patch(self, patch):
         """Patch record metadata.
@@ -432,6 +725,7 @@ class Record(RecordBase):
 
         :returns: The :class:`Record` instance.
         """
+        self._check_writable()
         if self.model is None or self.model.is_deleted:
             raise MissingModelError()
 
@@ -464,6 +758,134 @@ class Record(RecordBase):
 
         return self
 
+    @classmethod
+    def commit_many(
+        cls, records, chunk_size=500, format_checker=None, validator=None, **kwargs
+    ):
+        r"""Store changes of many record instances in the database.
+
+        Works like :meth:`commit`, but processes the records in chunks. Only
+        the version check is batched: for each chunk, the version counters of
+        all records are checked (and their rows locked) with a single
+        ``SELECT ... FOR UPDATE`` query, before the chunk is flushed inside a
+        single savepoint. Records are attached to the session without
+        ``merge()``, which avoids a ``SELECT`` per record.
+
+        The ``UPDATE`` statements are not batched: the flush emits one
+        ``UPDATE ... WHERE id = ? AND version_id = ?`` per record. The ORM
+        never batches the updates of a model with a version counter, and a
+        batched update bypassing the ORM would not be recorded as revisions
+        by SQLAlchemy-Continuum.
+
+        The optimistic concurrency control described in
+        :doc:`concurrency` is preserved: if any record in a chunk was
+        modified by another transaction since it was read, nothing is written
+        for that chunk and a :class:`~invenio_records.errors.StaleRecordsError`
+        listing the stale records is raised.
+
+        .. note::
+
+            Like for :meth:`commit`, the version counter checked is the one
+            of the model. Models which are expired (e.g. by a
+            ``db.session.commit()`` since the records were read) are loaded
+            again with the current version counter, so concurrent changes
+            made before that are not detected. Read and commit the records
+            in the same transaction to detect them.
+
+        Signals and extension hooks are sent/called for each record, exactly
+        like for :meth:`commit`.
+
+        :param records: Iterable of :class:`Record` instances.
+        :param chunk_size: Number of records updated per flush.
+        :param format_checker: See :meth:`commit`.
+        :param validator: See :meth:`commit`.
+        :returns: A list of the committed :class:`Record` instances.
+        """
+        committed = []
+        for chunk in _chunked(records, chunk_size):
+            with db.session.begin_nested():
+                cls._check_versions(chunk)
+
+                for record in chunk:
+                    if record.send_signals:
+                        before_record_update.send(
+                            current_app._get_current_object(), record=record
+                        )
+
+                    # Run pre commit extensions
+                    for e in record._extensions:
+                        e.pre_commit(record, **kwargs)
+
+                    # Validate also encodes the data
+                    record.model.json = record._validate(
+                        format_checker=format_checker, validator=validator
+                    )
+                    flag_modified(record.model, "json")
+
+                    state = sa_inspect(record.model)
+                    if state.detached:
+                        db.session.add(record.model)
+                    elif not state.persistent:
+                        db.session.merge(record.model)
+
+                # Flush the whole chunk at once.
+                db.session.flush()
+
+            for record in chunk:
+                if record.send_signals:
+                    after_record_update.send(
+                        current_app._get_current_object(), record=record
+                    )
+
+                # Run post commit extensions
+                for e in record._extensions:
+                    e.post_commit(record)
+
+            committed.extend(chunk)
+
+        return committed
+
+    @classmethod
+    def _check_versions(cls, records):
+        """Check the version counters of the records against the database.
+
+        Raises :class:`~invenio_records.errors.StaleRecordsError` with all the
+        records that were modified by a concurrent transaction. Expired models
+        are refreshed first, i.e. they are compared with the current version
+        counter (see :meth:`commit_many`).
+        """
+        model_cls = cls.model_cls
+        for record in records:
+            record._check_writable()
+            if record.model is None:
+                raise MissingModelError()
+
+        with db.session.no_autoflush:
+            # Refresh expired models (e.g. after a session commit) with one
+            # query instead of one query per model on attribute access.
+            expired_ids = [
+                sa_inspect(r.model).identity[0]
+                for r in records
+                if sa_inspect(r.model).expired_attributes
+            ]
+            if expired_ids:
+                db.session.query(model_cls).filter(model_cls.id.in_(expired_ids)).all()
+
+            if any(r.model.is_deleted for r in records):
+                raise MissingModelError()
+
+            # Lock the rows so no one can change them until we are done.
+            query = (
+                select(model_cls.id, model_cls.version_id)
+                .where(model_cls.id.in_([r.id for r in records]))
+                .with_for_update()
+            )
+            versions = dict(db.session.execute(query).all())
+
+        stale = [r for r in records if versions.get(r.id) != r.model.version_id]
+        if stale:
+            raise StaleRecordsError(stale)
+
     def delete(self, force=False):
         """Delete a record.
 
@@ -485,6 +907,7 @@ class Record(RecordBase):
                the database, otherwise soft-deletes it.
         :returns: The deleted :class:`Record` instance.
         """
+        self._check_writable()
         if self.model is None:
             raise MissingModelError()
 
@@ -515,6 +938,7 @@ class Record(RecordBase):
 
     def undelete(self):
         """Undelete a soft-deleted record."""
+        self._check_writable()
         if self.model is None:
             raise MissingModelError()
 
@@ -542,6 +966,7 @@ class Record(RecordBase):
         :param revision_id: Specify the record revision id
         :returns: The :class:`Record` instance corresponding to the revision id
         """
+        self._check_writable()
         if self.model is None:
             raise MissingModelError()
 
@@ -560,7 +985,7 @@ class Record(RecordBase):
 
             # Here we explicitly set the json column in order to not
             # encode/decode the json data via the ``data`` property.
-            self.model.json = revision.model.json
+            self.model.json = version_json(revision.model)
             flag_modified(self.model, "json")
 
             db.session.merge(self.model)
@@ -581,7 +1006,7 @@ class Record(RecordBase):
     @property
     def revisions(self):
         """Get revisions iterator."""
-        if self.model is None:
+        if self.model is None or isinstance(self.model, PartialRecordModel):
             raise MissingModelError()
 
         return RevisionsIterator(self.model)
@@ -596,19 +1021,81 @@ class RecordRevision(RecordBase):
             # The version model class does not have the properties of the
             # parent model class, and thus ``model.data`` won't work (which is
             # a Python property on RecordMetadataBase).
-            parent_class(model.__class__).decode(model.json),
+            parent_class(model.__class__).decode(version_json(model)),
             model=model,
         )
 
 
+class RevisionInfo:
+    """Lightweight description of a record revision.
+
+    Holds the identifiers and timestamps of a revision. The JSON document of
+    the revision is only loaded and decoded when :attr:`revision` is
+    accessed. See :meth:`RevisionsIterator.page`.
+    """
+
+    __slots__ = (
+        "revision_id",
+        "transaction_id",
+        "created",
+        "updated",
+        "_revisions",
+        "_revision",
+    )
+
+    def __init__(self, revisions, version_id, transaction_id, created, updated):
+        """Initialize the revision description."""
+        self.revision_id = version_id - 1
+        self.transaction_id = transaction_id
+        self.created = created
+        self.updated = updated
+        self._revisions = revisions
+        self._revision = None
+
+    @property
+    def revision(self):
+        """The :class:`RecordRevision` (loaded on first access)."""
+        if self._revision is None:
+            column = self._revisions._transaction_column()
+            version = self._revisions.model.versions.filter(
+                column == self.transaction_id
+            ).one()
+            self._revision = RecordRevision(version)
+        return self._revision
+
+    def __repr__(self):
+        """Representation of the revision description."""
+        return (
+            f"<RevisionInfo revision_id={self.revision_id} "
+            f"transaction_id={self.transaction_id}>"
+        )
+
+
 class RevisionsIterator(object):
     """Iterator for record revisions."""
 
+    batch_size = 100
+    """Number of revisions fetched by each query when iterating in reverse."""
+
     def __init__(self, model):
         """Initialize instance with the SQLAlchemy model."""
         self._it = None
         self.model = model
 
+    def _transaction_column(self):
+        """Get the column ordering the versions (i.e. the transaction ID)."""
+        version_cls = version_class(self.model.__class__)
+        return getattr(version_cls, option(self.model, "transaction_column_name"))
+
+    def _latest_first(self):
+        """Query of the versions ordered from the latest to the oldest.
+
+        Uses the primary key of the version table, i.e. the ID of the record
+        and the transaction ID.
+        """
+        column = self._transaction_column()
+        return self.model.versions.order_by(None).order_by(column.desc())
+
     def __len__(self):
         """Get number of revisions."""
         return self.model.versions.count()
@@ -636,7 +1123,10 @@ class RevisionsIterator(object):
         instances having to be updated.)
         """
         if revision_id < 0:
-            return RecordRevision(list(self.model.versions)[revision_id])
+            version = self._latest_first().offset(-revision_id - 1).limit(1).first()
+            if version is None:
+                raise IndexError
+            return RecordRevision(version)
         try:
             return RecordRevision(
                 self.model.versions.filter_by(version_id=revision_id + 1).one()
@@ -644,6 +1134,41 @@ class RevisionsIterator(object):
         except NoResultFound:
             raise IndexError
 
+    def page(self, after=None, size=25):
+        """Get a page of revisions, from the oldest to the latest.
+
+        Only the identifiers and timestamps of the revisions are loaded (see
+        :class:`RevisionInfo`), with keyset pagination on the transaction ID:
+
+        .. code-block:: python
+
+            page = record.revisions.page(size=10)
+            while page:
+                ...
+                page = record.revisions.page(after=page[-1].transaction_id)
+
+        :param after: Transaction ID of the last revision of the previous
+            page, or ``None`` for the first page.
+        :param size: Maximum number of revisions in the page.
+        :returns: A list of :class:`RevisionInfo`.
+        """
+        version_cls = version_class(self.model.__class__)
+        column = self._transaction_column()
+        query = (
+            select(
+                version_cls.version_id,
+                column,
+                version_cls.created,
+                version_cls.updated,
+            )
+            .where(version_cls.id == self.model.id)
+            .order_by(column)
+            .limit(size)
+        )
+        if after is not None:
+            query = query.where(column > after)
+        return [RevisionInfo(self, *row) for row in db.session.execute(query)]
+
     def __contains__(self, revision_id):
         """Test if revision exists."""
         try:
@@ -653,11 +1178,19 @@ class RevisionsIterator(object):
             return False
 
     def __reversed__(self):
-        """Allows to use reversed operator."""
-        for version_index in range(self.model.versions.count()):
-            versions = (
-                list(self.model.versions)
-                if -(version_index + 1) < 0
-                else self.model.versions
-            )
-            yield RecordRevision(versions[-(version_index + 1)])
+        """Allows to use reversed operator.
+
+        The versions are fetched by batches with keyset pagination on the
+        transaction ID.
+        """
+        column = self._transaction_column()
+        query = self._latest_first()
+        last = None
+        while True:
+            batch_query = query if last is None else query.filter(column < last)
+            versions = batch_query.limit(self.batch_size).all()
+            for version in versions:
+                yield RecordRevision(version)
+            if len(versions) < self.batch_size:
+                return
+            last = getattr(versions[-1], column.key)
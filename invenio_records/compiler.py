@@ -0,0 +1,345 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Ahead-of-time compilation of JSONSchemas into Python code.
+
+The compiler turns a resolved JSONSchema into a Python function which only
+answers if a document is valid or not. The function is used as a fast path:
+documents accepted by it are valid, while documents rejected by it are
+validated again by the regular ``jsonschema`` validator in order to produce
+exactly the same errors as without compilation.
+
+Only a subset of JSONSchema is supported. If a schema uses any other
+keyword (or a validator class overriding one of the supported keywords), the
+schema is not compiled and the regular ``jsonschema`` validator is used.
+"""
+
+import re
+from itertools import count
+
+from flask import current_app
+from jsonschema.validators import validator_for
+
+from .validators import JSONSchemaBackend
+
+_ANNOTATIONS = {
+    "$comment",
+    "$defs",
+    "$schema",
+    "default",
+    "definitions",
+    "deprecated",
+    "description",
+    "examples",
+    "readOnly",
+    "title",
+    "writeOnly",
+}
+"""Keywords without any effect on validation."""
+
+_IDS = {"$id", "id"}
+
+_SUPPORTED = {
+    "$ref",
+    "additionalProperties",
+    "allOf",
+    "anyOf",
+    "const",
+    "enum",
+    "items",
+    "maxItems",
+    "maxLength",
+    "maxProperties",
+    "maximum",
+    "minItems",
+    "minLength",
+    "minProperties",
+    "minimum",
+    "not",
+    "oneOf",
+    "pattern",
+    "properties",
+    "required",
+    "type",
+}
+
+
+class _Unsupported(Exception):
+    """The schema uses a feature not supported by the compiler."""
+
+
+class SchemaCompiler:
+    """Compile a JSONSchema into a Python function returning a boolean.
+
+    Each (sub)schema is compiled into its own function. References are
+    resolved at compile time using the ref resolver, and recursive schemas are
+    supported.
+    """
+
+    def __init__(self, validator_cls, resolver, format_checker=None):
+        """Initialize the compiler.
+
+        :param validator_cls: The :class:`jsonschema.protocols.Validator`
+            class which would be used to validate the schema. Its type checker
+            is used for type checks.
+        :param resolver: The ref resolver used to resolve ``$ref``.
+        :param format_checker: The format checker. Schemas with ``format``
+            are only compiled if no format checker is used.
+        """
+        self.validator_cls = validator_cls
+        self.resolver = resolver
+        self.format_checker = format_checker
+        self._standard = validator_for(validator_cls.META_SCHEMA).VALIDATORS
+        self._namespace = {"_is": validator_cls.TYPE_CHECKER.is_type}
+        self._lines = []
+        self._functions = {}
+        self._counter = count()
+
+    def compile(self, schema):
+        """Compile the schema.
+
+        :returns: A function taking a document and returning if it is valid.
+        :raises: ``Exception`` if the schema cannot be compiled.
+        """
+        name = self._compile_node(schema, root=True)
+        source = "\n".join(self._lines)
+        exec(compile(source, "<compiled jsonschema>", "exec"), self._namespace)
+        return self._namespace[name]
+
+    def _const(self, value):
+        """Store a constant in the namespace of the generated code."""
+        name = f"_c{next(self._counter)}"
+        self._namespace[name] = value
+        return name
+
+    def _compile_node(self, schema, root=False):
+        """Compile a (sub)schema into a function and return its name."""
+        key = id(schema)
+        if key in self._functions:
+            return self._functions[key][0]
+        name = f"_v{next(self._counter)}"
+        # Keep a reference on the schema, so that its id is not reused.
+        self._functions[key] = (name, schema)
+
+        if schema is True:
+            body = []
+        elif schema is False:
+            body = ["return False"]
+        elif isinstance(schema, dict):
+            body = self._compile_keywords(schema, root)
+        else:
+            raise _Unsupported(schema)
+
+        self._lines.append(f"def {name}(x):")
+        self._lines.extend(f"    {line}" for line in body)
+        self._lines.append("    return True")
+        return name
+
+    def _check_keyword(self, keyword):
+        """Make sure the validator class uses the standard implementation."""
+        if keyword not in _SUPPORTED:
+            raise _Unsupported(keyword)
+        implementation = self.validator_cls.VALIDATORS.get(keyword)
+        if implementation is None or implementation is not self._standard.get(keyword):
+            raise _Unsupported(keyword)
+
+    def _compile_keywords(self, schema, root):
+        """Compile the keywords of a schema into lines of code."""
+        keywords = set(schema) - _ANNOTATIONS
+        if keywords & _IDS:
+            # A nested identifier changes the resolution scope.
+            if not root:
+                raise _Unsupported("$id")
+            keywords -= _IDS
+        if "format" in keywords:
+            # Without a format checker, format is only an annotation.
+            if self.format_checker is not None:
+                raise _Unsupported("format")
+            keywords.remove("format")
+        for keyword in keywords:
+            self._check_keyword(keyword)
+
+        if "$ref" in keywords:
+            # Keywords next to a reference are ignored by older drafts.
+            if len(keywords) > 1:
+                raise _Unsupported("$ref")
+            return self._compile_ref(schema["$ref"])
+
+        lines = []
+        if "type" in keywords:
+            types = schema["type"]
+            if isinstance(types, str):
+                types = [types]
+            cond = " or ".join(f"_is(x, {t!r})" for t in types)
+            lines.append(f"if not ({cond}): return False")
+        if "enum" in keywords:
+            lines.append(self._compile_enum(schema["enum"]))
+        if "const" in keywords:
+            lines.append(self._compile_enum([schema["const"]]))
+        for keyword in ("allOf", "anyOf", "oneOf"):
+            if keyword in keywords:
+                lines.extend(self._compile_combinator(keyword, schema[keyword]))
+        if "not" in keywords:
+            name = self._compile_node(schema["not"])
+            lines.append(f"if {name}(x): return False")
+
+        self._guarded(lines, "object", self._compile_object(schema, keywords))
+        self._guarded(lines, "array", self._compile_array(schema, keywords))
+        self._guarded(lines, "string", self._compile_string(schema, keywords))
+        self._guarded(lines, "number", self._compile_number(schema, keywords))
+        return lines
+
+    def _guarded(self, lines, type_, body):
+        """Add lines only executed if the document is of the given type."""
+        if body:
+            lines.append(f"if _is(x, {type_!r}):")
+            lines.extend(f"    {line}" for line in body)
+
+    def _compile_ref(self, ref):
+        """Resolve a reference and compile the referenced schema."""
+        url, resolved = self.resolver.resolve(ref)
+        self.resolver.push_scope(url)
+        try:
+            name = self._compile_node(resolved, root=True)
+        finally:
+            self.resolver.pop_scope()
+        return [f"if not {name}(x): return False"]
+
+    def _compile_enum(self, values):
+        """Compile an enum (only strings are supported)."""
+        if not all(isinstance(v, str) for v in values):
+            raise _Unsupported("enum")
+        name = self._const(frozenset(values))
+        return f"if not (isinstance(x, str) and x in {name}): return False"
+
+    def _compile_combinator(self, keyword, subschemas):
+        """Compile allOf, anyOf and oneOf."""
+        if not isinstance(subschemas, list) or not subschemas:
+            raise _Unsupported(keyword)
+        calls = [f"{self._compile_node(s)}(x)" for s in subschemas]
+        if keyword == "allOf":
+            return [f"if not {call}: return False" for call in calls]
+        elif keyword == "anyOf":
+            return [f"if not ({' or '.join(calls)}): return False"]
+        return [f"if [{', '.join(calls)}].count(True) != 1: return False"]
+
+    def _compile_object(self, schema, keywords):
+        """Compile the keywords applying to objects."""
+        lines = []
+        for name in schema.get("required", []) if "required" in keywords else []:
+            lines.append(f"if {name!r} not in x: return False")
+        if "minProperties" in keywords:
+            lines.append(f"if len(x) < {int(schema['minProperties'])}: return False")
+        if "maxProperties" in keywords:
+            lines.append(f"if len(x) > {int(schema['maxProperties'])}: return False")
+        properties = schema.get("properties", {}) if "properties" in keywords else {}
+        for prop, subschema in properties.items():
+            name = self._compile_node(subschema)
+            lines.append(f"if {prop!r} in x and not {name}(x[{prop!r}]): return False")
+        if "additionalProperties" in keywords:
+            additional = schema["additionalProperties"]
+            known = self._const(frozenset(properties))
+            if additional is False:
+                lines.append(f"if any(k not in {known} for k in x): return False")
+            elif additional is not True:
+                name = self._compile_node(additional)
+                lines.append("for k in x:")
+                lines.append(
+                    f"    if k not in {known} and not {name}(x[k]): return False"
+                )
+        return lines
+
+    def _compile_array(self, schema, keywords):
+        """Compile the keywords applying to arrays."""
+        lines = []
+        if "minItems" in keywords:
+            lines.append(f"if len(x) < {int(schema['minItems'])}: return False")
+        if "maxItems" in keywords:
+            lines.append(f"if len(x) > {int(schema['maxItems'])}: return False")
+        if "items" in keywords:
+            items = schema["items"]
+            if not isinstance(items, (dict, bool)):
+                # Tuple validation (items as a list of schemas).
+                raise _Unsupported("items")
+            name = self._compile_node(items)
+            lines.append("for v in x:")
+            lines.append(f"    if not {name}(v): return False")
+        return lines
+
+    def _compile_string(self, schema, keywords):
+        """Compile the keywords applying to strings."""
+        lines = []
+        if "minLength" in keywords:
+            lines.append(f"if len(x) < {int(schema['minLength'])}: return False")
+        if "maxLength" in keywords:
+            lines.append(f"if len(x) > {int(schema['maxLength'])}: return False")
+        if "pattern" in keywords:
+            name = self._const(re.compile(schema["pattern"]))
+            lines.append(f"if {name}.search(x) is None: return False")
+        return lines
+
+    def _compile_number(self, schema, keywords):
+        """Compile the keywords applying to numbers."""
+        lines = []
+        for keyword, op in (("minimum", "<"), ("maximum", ">")):
+            if keyword in keywords:
+                value = schema[keyword]
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise _Unsupported(keyword)
+                lines.append(f"if x {op} {self._const(value)}: return False")
+        return lines
+
+
+class CompiledValidator:
+    """Validator running compiled code, with a ``jsonschema`` fallback.
+
+    Implements the subset of :class:`jsonschema.protocols.Validator` used for
+    validating records.
+    """
+
+    def __init__(self, check, fallback):
+        """Initialize the validator.
+
+        :param check: The compiled function.
+        :param fallback: The ``jsonschema`` validator used to report errors.
+        """
+        self.check = check
+        self.fallback = fallback
+
+    def is_valid(self, instance):
+        """Check if the instance is valid."""
+        return self.check(instance)
+
+    def iter_errors(self, instance):
+        """Iterate over the validation errors of the instance."""
+        if self.check(instance):
+            return iter(())
+        return self.fallback.iter_errors(instance)
+
+
+class CompiledBackend(JSONSchemaBackend):
+    """Validation backend compiling schemas into Python code.
+
+    Schemas which cannot be compiled are validated by ``jsonschema`` (with a
+    warning logged if the compilation failed for another reason than an
+    unsupported keyword).
+    """
+
+    def build(self, schema, validator_cls, resolver, **kwargs):
+        """Build a validator for the schema."""
+        fallback = super().build(schema, validator_cls, resolver, **kwargs)
+        compiler = SchemaCompiler(
+            validator_cls, resolver, format_checker=kwargs.get("format_checker")
+        )
+        try:
+            check = compiler.compile(schema)
+        except _Unsupported:
+            return fallback
+        except Exception:
+            # E.g. an unresolvable reference, which jsonschema reports the
+            # usual way, or a bug of the compiler.
+            current_app.logger.warning(
+                "Could not compile the schema %s", schema, exc_info=True
+            )
+            return fallback
+        return CompiledValidator(check, fallback)
@@ -9,6 +9,15 @@ For more details, see:
 `<https://python-jsonschema.readthedocs.io/en/latest/validate/#validating-types>`_.
 """
 
+RECORDS_VALIDATION_BACKEND = None
+"""Backend building the validators for schemas given by URL.
+
+Defaults to :class:`invenio_records.validators.JSONSchemaBackend`. Set to
+``"invenio_records.compiler.CompiledBackend"`` to compile schemas into Python
+code (with a fallback to ``jsonschema`` for unsupported features and for
+reporting errors).
+"""
+
 RECORDS_REFRESOLVER_CLS = None
 """Custom JSONSchemas ref resolver class.
 
@@ -22,3 +31,48 @@ RECORDS_REFRESOLVER_STORE = None
 Used together with ``RECORDS_REFRESOLVER_CLS`` to provide a specific
 ref resolver store.
 """
+
+RECORDS_VALIDATOR_CACHE_SIZE = 128
+"""Maximum number of JSONSchema validators cached per thread.
+
+Validators are cached per ``$schema`` URL, validator class, format checker
+and validation types. Set to ``0`` to disable the cache.
+"""
+
+RECORDS_RELATIONS_CACHE_SIZE = 0
+"""Maximum number of related records kept in the process-wide relations cache.
+
+Records resolved by primary key relations are cached across records, e.g. to
+avoid fetching the same vocabulary entries for each record while indexing.
+Set to ``0`` (the default) to disable the cache.
+"""
+
+RECORDS_RELATIONS_CACHE_TTL = 300
+"""Number of seconds after which a related record expires from the cache.
+
+Updates made by the current process invalidate the cached records
+immediately, while updates made by other processes are only seen after the
+entry has expired. Set to ``None`` to never expire entries.
+"""
+
+RECORDS_RELATIONS_TRACK_DEPENDENCIES = False
+"""Track the related records of each record in the dependencies table.
+
+When enabled, relations fields store the revision of the related records in
+the ``records_dependencies`` table each time a record is created or committed.
+See :mod:`invenio_records.systemfields.relations.dependencies`.
+"""
+
+RECORDS_REVISIONS_DELTA = False
+"""Store the revisions of records as JSON patches against a snapshot.
+
+Reduces the size of the versions table for large records edited many times,
+at the cost of a few queries per commit. It must be enabled when the
+application is initialized. See :mod:`invenio_records.revisions`.
+"""
+
+RECORDS_REVISIONS_SNAPSHOT_INTERVAL = 10
+"""Number of revisions after which a full copy of a record is stored again.
+
+Only used if ``RECORDS_REVISIONS_DELTA`` is enabled.
+"""
@@ -3,45 +3,132 @@
 
 """Dictionary utilities."""
 
+from copy import deepcopy
 
-def clear_none(d):
-    """Clear None values and empty dicts from a dict."""
-    del_keys = []
-    for k, v in d.items():
-        if v is None:
-            del_keys.append(k)
-        elif isinstance(v, dict):
-            clear_none(v)
-            if v == {}:
-                del_keys.append(k)
-        elif isinstance(v, list):
-            clear_none_list(v)
-            if v == []:
-                del_keys.append(k)
-
-    # Delete the keys (cannot be done during the dict iteration)
-    for k in del_keys:
-        del d[k]
-
-
-def clear_none_list(ls):
-    """Clear values from a list (in-place)."""
-    del_idx = []
-    for i, v in enumerate(ls):
-        if v is None:
-            del_idx.append(i)
-        elif isinstance(v, list):
-            clear_none_list(v)
-            if v == []:
-                del_idx.append(i)
-        elif isinstance(v, dict):
-            clear_none(v)
-            if v == {}:
-                del_idx.append(i)
-
-    # Delete the keys (reverse so index stays stable).
-    for i in reversed(del_idx):
-        del ls[i]
+_IMMUTABLE_JSON_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def deepcopy_json(value):
+    """Deep copy a JSON document (i.e. a tree of dicts and lists).
+
+    Specialised for the JSON data types (``dict``, ``list``, ``str``, ``int``,
+    ``float``, ``bool`` and ``None``) and considerably faster than
+    :func:`copy.deepcopy` for those. Any other object (including subclasses
+    of ``dict`` and ``list``) is copied with :func:`copy.deepcopy`.
+
+    Contrary to :func:`copy.deepcopy`, an object referenced several times in
+    the tree is copied several times (recursive trees are not supported).
+    """
+    cls = value.__class__
+    if cls is dict:
+        return {
+            k: v if v.__class__ in _IMMUTABLE_JSON_TYPES else deepcopy_json(v)
+            for k, v in value.items()
+        }
+    elif cls is list:
+        return [
+            v if v.__class__ in _IMMUTABLE_JSON_TYPES else deepcopy_json(v)
+            for v in value
+        ]
+    elif cls in _IMMUTABLE_JSON_TYPES:
+        return value
+    return deepcopy(value)
+
+
+def _clear_none(root, copy):
+    """Clear ``None`` values and empty dicts/lists from a dict or list.
+
+    The tree is traversed breadth-first without recursion, so the depth of
+    the document is not limited by the recursion limit. ``None`` values are
+    removed during the traversal, while the nested containers are recorded
+    and removed afterwards (in reverse order, i.e. each container after its
+    children) if they ended up empty.
+
+    :param root: The dict or list to clean.
+    :param copy: If ``True``, clean a copy of ``root`` built in the same
+        traversal instead of ``root`` itself.
+    :returns: The cleaned dict or list.
+    """
+    dst_root = ({} if isinstance(root, dict) else []) if copy else root
+    # Queue of (source, destination) containers to traverse.
+    queue = [(root, dst_root)]
+    # Nested containers as (parent, key or index, container).
+    nested = []
+    for src, dst in queue:
+        if isinstance(src, dict):
+            del_keys = None
+            for k, v in src.items():
+                if v is None:
+                    if not copy:
+                        # Keys cannot be deleted during the dict iteration.
+                        if del_keys is None:
+                            del_keys = []
+                        del_keys.append(k)
+                    continue
+                if isinstance(v, (dict, list)):
+                    if copy:
+                        c = {} if isinstance(v, dict) else []
+                        dst[k] = c
+                    else:
+                        c = v
+                    queue.append((v, c))
+                    nested.append((dst, k, c))
+                elif copy:
+                    dst[k] = v
+            if del_keys is not None:
+                for k in del_keys:
+                    del dst[k]
+        else:
+            # Compact the list (in-place or into the copy).
+            i = 0
+            for v in src:
+                if v is None:
+                    continue
+                if isinstance(v, (dict, list)):
+                    if copy:
+                        c = {} if isinstance(v, dict) else []
+                    else:
+                        c = v
+                    queue.append((v, c))
+                    nested.append((dst, i, c))
+                    v = c
+                if copy:
+                    dst.append(v)
+                else:
+                    dst[i] = v
+                i += 1
+            if not copy:
+                del dst[i:]
+
+    # The containers of a list are recorded by increasing index, so removing
+    # them in reverse order does not shift the indexes still to be removed.
+    for parent, key, c in reversed(nested):
+        if not c:
+            del parent[key]
+    return dst_root
+
+
+def clear_none(d, copy=False):
+    """Clear None values and empty dicts/lists from a dict.
+
+    :param d: The dictionary to clean (in-place by default).
+    :param copy: If ``True``, ``d`` is left untouched and a cleaned copy is
+        built in the same traversal. Nested dicts and lists are copied (as
+        plain ``dict`` and ``list``), other values are shared.
+    :returns: The cleaned dictionary.
+    """
+    return _clear_none(d, copy)
+
+
+def clear_none_list(ls, copy=False):
+    """Clear values from a list (in-place by default).
+
+    :param ls: The list to clean.
+    :param copy: If ``True``, return a cleaned copy instead (see
+        :func:`clear_none`).
+    :returns: The cleaned list.
+    """
+    return _clear_none(ls, copy)
 
 
 def parse_lookup_key(lookup_key):
@@ -52,14 +139,116 @@ def parse_lookup_key(lookup_key):
     # Parse the list of keys
     if isinstance(lookup_key, str):
         keys = lookup_key.split(".")
-    elif isinstance(lookup_key, list):
+    elif isinstance(lookup_key, (list, tuple)):
         keys = lookup_key
+    elif isinstance(lookup_key, KeyPath):
+        keys = list(lookup_key.keys)
     else:
         raise TypeError("lookup must be string or list")
 
     return keys
 
 
+def _as_index(key):
+    """Convert a key to a list index (``None`` if it is not an integer)."""
+    try:
+        return int(key)
+    except (TypeError, ValueError):
+        return None
+
+
+class KeyPath:
+    """Compiled lookup key.
+
+    The key is parsed once, and the list indexes are computed in advance, so
+    that the same key can be looked up in many dictionaries faster than with
+    :func:`dict_lookup` and :func:`dict_set`, which parse the key on each
+    call. The lookups behave exactly like these functions:
+
+    .. code-block:: python
+
+        path = KeyPath("metadata.titles.0.title")
+        path.get(record)  # dict_lookup(record, "metadata.titles.0.title")
+        path.get(record, parent=True)  # the first title
+        path.set(record, "A title")  # dict_set(record, ..., "A title")
+
+    :param lookup_key: A string using dot notation, or a list of keys.
+    """
+
+    __slots__ = ("key", "keys", "_segments", "_parent_segments", "_parent", "_last")
+
+    def __init__(self, lookup_key):
+        """Parse the lookup key."""
+        keys = parse_lookup_key(lookup_key)
+        if isinstance(lookup_key, KeyPath):
+            lookup_key = lookup_key.key
+        self.key = lookup_key
+        self.keys = tuple(keys)
+        self._segments = tuple((k, _as_index(k)) for k in self.keys)
+        self._parent_segments = self._segments[:-1]
+        self._parent = None
+        self._last = self.keys[-1]
+
+    @property
+    def parent(self):
+        """Path of the parent node (raises ``KeyError`` for a single key)."""
+        if self._parent is None:
+            self._parent = KeyPath(list(self.keys[:-1]))
+        return self._parent
+
+    def get(self, source, parent=False):
+        """Lookup the key in a dictionary (see :func:`dict_lookup`).
+
+        :param source: The dictionary object to perform the lookup in.
+        :param parent: If ``True``, returns the parent node of the matched
+                       object.
+        """
+        value = source
+        try:
+            for key, index in self._parent_segments if parent else self._segments:
+                if isinstance(value, list):
+                    # ``None`` if the key is not an integer, which raises a
+                    # ``TypeError`` like a non-integer key for a list.
+                    value = value[index]
+                else:
+                    value = value[key]
+        except (TypeError, IndexError, ValueError) as exc:
+            raise KeyError(self.key) from exc
+        return value
+
+    def set(self, source, value):
+        """Set a value in a dictionary (see :func:`dict_set`).
+
+        :param source: The dictionary object to set the value in.
+        :param value: The value to be set.
+        """
+        parent = source
+        for key, _ in self._parent_segments:
+            if isinstance(key, int):
+                parent = parent[key]
+            else:
+                parent = parent.setdefault(key, {})
+        parent[self._last] = value
+
+    def __eq__(self, other):
+        """Compare the keys of two paths."""
+        if isinstance(other, KeyPath):
+            return self.keys == other.keys
+        return NotImplemented
+
+    def __hash__(self):
+        """Hash of the keys."""
+        return hash(self.keys)
+
+    def __str__(self):
+        """Dot notation of the path."""
+        return ".".join(str(k) for k in self.keys)
+
+    def __repr__(self):
+        """Representation of the path."""
+        return f"KeyPath({self.key!r})"
+
+
 def dict_lookup(source, lookup_key, parent=False):
     """Make a lookup into a dict based on a dot notation.
 
@@ -78,8 +267,12 @@ def dict_lookup(source, lookup_key, parent=False):
     :param source: The dictionary object to perform the lookup in.
     :param parent: If parent argument is True, returns the parent node of
                    matched object.
-    :param lookup_key: A string using dot notation, or a list of keys.
+    :param lookup_key: A string using dot notation, a list of keys or a
+                       :class:`KeyPath`.
     """
+    if isinstance(lookup_key, KeyPath):
+        return lookup_key.get(source, parent=parent)
+
     # Copied from dictdiffer (CERN contributed part) and slightly modified.
     keys = parse_lookup_key(lookup_key)
 
@@ -116,9 +309,13 @@ def dict_set(source, key, value):
     - ``['a','b', 0]``
 
     :param source: The dictionary object to set the value in.
-    :param key: A string using dot notation, or a list of keys.
+    :param key: A string using dot notation, a list of keys or a
+                :class:`KeyPath`.
     :param value: The value to be set.
     """
+    if isinstance(key, KeyPath):
+        return key.set(source, value)
+
     keys = parse_lookup_key(key)
     parent = source
     for key in keys[:-1]:
@@ -3,7 +3,7 @@
 
 """Base class for dumpers."""
 
-from copy import deepcopy
+from ..dictutils import deepcopy_json
 
 
 class Dumper:
@@ -28,7 +28,7 @@ class Dumper:
         # conflicting with any of the record's keys. pre_dump methods can be
         # used to preprocess the record before dumping (e.g. caching/fetching
         # things.
-        data.update(deepcopy(dict(record)))
+        data.update(deepcopy_json(dict(record)))
         return data
 
     def load(self, data, record_cls):
@@ -23,6 +23,12 @@ class IndexedAtDumperExt(SearchDumperExt):
         """Dump relations."""
         data[self.key] = datetime.now(timezone.utc).isoformat()
 
+    def dump_many(self, records, dumps):
+        """Dump the same indexed time for a batch of records."""
+        indexed_at = datetime.now(timezone.utc).isoformat()
+        for data in dumps:
+            data[self.key] = indexed_at
+
     def load(self, data, record_cls):
         """Load (remove) indexed data."""
         data.pop(self.key, None)
@@ -6,7 +6,6 @@
 Dumper used to dump/load relations to/from a search engine body.
 """
 
-from ..dictutils import dict_lookup, dict_set
 from .search import SearchDumperExt
 
 
@@ -22,11 +21,33 @@ class RelationDumperExt(SearchDumperExt):
         """Dump relations."""
         relations = getattr(record, self.key)
         relations.dereference(fields=self.fields)
+        self._copy(record, data, relations)
+
+    def dump_many(self, records, dumps):
+        """Dump relations of a batch of records.
+
+        The related records of the whole batch are resolved at once (see
+        :meth:`RelationsField.dereference_many`).
+        """
+        # Records of different classes may have different relations fields.
+        by_field = {}
+        for record in records:
+            field = getattr(type(record), self.key)
+            by_field.setdefault(field, []).append(record)
+        for field, field_records in by_field.items():
+            field.dereference_many(field_records, fields=self.fields)
+
+        for record, data in zip(records, dumps):
+            self._copy(record, data, getattr(record, self.key))
+
+    def _copy(self, record, data, relations):
+        """Copy the dereferenced relations to the dump."""
         relation_fields = self.fields or relations
         for rel_field_name in relation_fields:
             rel_field = getattr(relations, rel_field_name)
             try:
-                dict_set(data, rel_field.key, dict_lookup(record, rel_field.key))
+                path = rel_field.key_path
+                path.set(data, path.get(record))
             except KeyError:
                 pass
 
@@ -8,7 +8,9 @@ Dumper used to dump/load an the body of an Search document.
 """
 
 from datetime import datetime, timezone
+from itertools import islice
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 import arrow
 from invenio_db import db
@@ -16,6 +18,7 @@ from sqlalchemy.sql.sqltypes import JSON, Boolean, DateTime, Integer, String, Te
 from sqlalchemy.sql.type_api import Variant
 from sqlalchemy_utils.types.uuid import UUIDType
 
+from ..dictutils import deepcopy_json
 from ..systemfields.model import ModelField
 from .base import Dumper
 
@@ -32,6 +35,29 @@ class SearchDumperExt:
         Reverse the changes made by the dump method.
         """
 
+    def dump_many(self, records, dumps):
+        """Dump the data of a batch of records.
+
+        Extensions can override this method to share work between the records
+        of a batch. By default, ``dump()`` is called for each record.
+
+        :param records: The list of records being dumped.
+        :param dumps: The list of dumps, in the same order as the records.
+        """
+        for record, data in zip(records, dumps):
+            self.dump(record, data)
+
+    def load_many(self, dumps, record_cls):
+        """Load the data of a batch of dumps.
+
+        By default, ``load()`` is called for each dump.
+
+        :param dumps: The list of dumps being loaded.
+        :param record_cls: The record class being used for loading.
+        """
+        for data in dumps:
+            self.load(data, record_cls)
+
 
 class SearchDumper(Dumper):
     """Search source dumper."""
@@ -47,11 +73,15 @@ class SearchDumper(Dumper):
             # is_deleted is purposely not added (deleted record isnt indexed)
         }
         self._model_fields.update(model_fields or {})
+        self._plans = WeakKeyDictionary()
 
     @staticmethod
     def _sa_type(model_cls, model_field_name):
         """Introspection of SQLAlchemy column data type.
 
+        The data types are stored in the plan of each record class (see
+        :meth:`_plan`), so the columns are only introspected once.
+
         :param model_cls: The SQLALchemy model.
         :param model_field_name: The name of the field on the SQLAlchemy model.
         """
@@ -121,6 +151,10 @@ class SearchDumper(Dumper):
     def _dump_model_field(self, record, model_field_name, dump, dump_key, dump_type):
         """Helper method to dump model fields.
 
+        Only called for subclasses overriding it (the model fields are
+        otherwise dumped according to the plan of the record class, see
+        ``_plan()``).
+
         :param record: The record being dumped.
         :param model_field_name: The name of the SQLAlchemy model field on the
             record's model.
@@ -149,6 +183,9 @@ class SearchDumper(Dumper):
     ):
         """Helper method to load model fields from dump.
 
+        Only called for subclasses overriding it (see
+        ``_dump_model_field()``).
+
         :param record_cls: The record class being used for loading.
         :param model_field_name: The name of the SQLAlchemy model field on the
             record's model.
@@ -165,7 +202,6 @@ class SearchDumper(Dumper):
 
         # Determine dump data type if not provided
         if dump_type is None:
-            sa_field = getattr(record_cls.model_cls, model_field_name)
             dump_type = self._sa_type(record_cls.model_cls, model_field_name)
 
         # Deserialize the value
@@ -174,11 +210,40 @@ class SearchDumper(Dumper):
     @staticmethod
     def _iter_modelfields(record_cls):
         """Internal helper method to extract all model fields."""
-        for attr_name in dir(record_cls):
-            systemfield = getattr(record_cls, attr_name)
-            if isinstance(systemfield, ModelField):
-                if systemfield.dump:
-                    yield systemfield
+        return iter(_get_modelfields(record_cls))
+
+    def _overrides(self, method):
+        """Check if a subclass overrides a method of this class."""
+        return getattr(type(self), method) is not getattr(SearchDumper, method)
+
+    def _plan(self, record_cls):
+        """Get the plan for dumping/loading the model fields of a record class.
+
+        The plan is computed once per record class, so that dumping and
+        loading a record does not require any introspection.
+
+        :param record_cls: The record class being dumped or loaded.
+        :returns: A tuple of ``(model_field_name, dump_key, dump_type)``
+            tuples, with the data type resolved from the SQLAlchemy column if
+            it was not provided.
+        """
+        plan = self._plans.get(record_cls)
+        if plan is None:
+            fields = [(name, *spec) for name, spec in self._model_fields.items()]
+            # Model fields defined as system fields.
+            fields.extend(
+                (f.model_field_name, f.dump_key, f.dump_type)
+                for f in self._iter_modelfields(record_cls)
+            )
+            plan = []
+            for model_field_name, dump_key, dump_type in fields:
+                # Determine data type if not set.
+                if dump_type is None:
+                    dump_type = self._sa_type(record_cls.model_cls, model_field_name)
+                plan.append((model_field_name, dump_key, dump_type))
+            plan = tuple(plan)
+            self._plans[record_cls] = plan
+        return plan
 
     def dump(self, record, data):
         """Dump a record.
@@ -191,29 +256,7 @@ class SearchDumper(Dumper):
         - ``created`` - Creation timestamp in UTC.
         - ``updated`` - Modification timestamp in UTC.
         """
-        # Copy data first, otherwise we modify the record.
-        dump_data = super().dump(record, data)
-
-        # Dump model fields explicitly requested
-        it = self._model_fields.items()
-        for model_field_name, (dump_key, dump_type) in it:
-            self._dump_model_field(
-                record,
-                model_field_name,
-                dump_data,
-                dump_key,
-                dump_type,
-            )
-
-        # Dump model fields defined as system fields.
-        for systemfield in self._iter_modelfields(record.__class__):
-            self._dump_model_field(
-                record,
-                systemfield.model_field_name,
-                dump_data,
-                systemfield.dump_key,
-                systemfield.dump_type,
-            )
+        dump_data = self._dump(record, data, self._plan(record.__class__))
 
         # Allow extensions to integrate as well.
         for e in self._extensions:
@@ -221,6 +264,30 @@ class SearchDumper(Dumper):
 
         return dump_data
 
+    def _dump(self, record, data, plan):
+        """Dump a record without running the extensions."""
+        # Copy data first, otherwise we modify the record.
+        dump_data = super().dump(record, data)
+
+        # Dump model fields explicitly requested and model fields defined as
+        # system fields.
+        if self._overrides("_dump_model_field"):
+            for model_field_name, dump_key, dump_type in plan:
+                self._dump_model_field(
+                    record, model_field_name, dump_data, dump_key, dump_type
+                )
+        elif record.model is None:
+            # If model is not defined, we dump None into the field values.
+            for model_field_name, dump_key, dump_type in plan:
+                dump_data[dump_key] = None
+        else:
+            with db.session.no_autoflush:
+                for model_field_name, dump_key, dump_type in plan:
+                    dump_data[dump_key] = self._serialize(
+                        getattr(record.model, model_field_name), dump_type
+                    )
+        return dump_data
+
     def load(self, dump_data, record_cls):
         """Load a record from an Search document source.
 
@@ -239,23 +306,23 @@ class SearchDumper(Dumper):
         for e in self._extensions:
             e.load(dump_data, record_cls)
 
-        # Load explicitly defined model fields.
-        model_data = {}
-        it = self._model_fields.items()
-        for model_field_name, (dump_key, dump_type) in it:
-            model_data[model_field_name] = self._load_model_field(
-                record_cls, model_field_name, dump_data, dump_key, dump_type
-            )
+        return self._load(dump_data, record_cls, self._plan(record_cls))
 
-        # Load model fields defined as system fields
-        for systemfield in self._iter_modelfields(record_cls):
-            model_data[systemfield.model_field_name] = self._load_model_field(
-                record_cls,
-                systemfield.model_field_name,
-                dump_data,
-                systemfield.dump_key,
-                systemfield.dump_type,
-            )
+    def _load(self, dump_data, record_cls, plan):
+        """Load a record after the extensions have been run."""
+        # Load explicitly defined model fields and model fields defined as
+        # system fields.
+        model_data = {}
+        if self._overrides("_load_model_field"):
+            for model_field_name, dump_key, dump_type in plan:
+                model_data[model_field_name] = self._load_model_field(
+                    record_cls, model_field_name, dump_data, dump_key, dump_type
+                )
+        else:
+            for model_field_name, dump_key, dump_type in plan:
+                model_data[model_field_name] = self._deserialize(
+                    dump_data.pop(dump_key), dump_type
+                )
 
         # Initialize model if an id was provided.
         if model_data.get("id") is not None:
@@ -265,3 +332,97 @@ class SearchDumper(Dumper):
             model = None
 
         return record_cls(dump_data, model=model)
+
+    def dump_many(self, records, chunk_size=100):
+        """Dump a batch of records.
+
+        The dumps are the same as with ``record.dumps(dumper=dumper)`` for each
+        record, but the records are processed in chunks so that work can be
+        shared between the records of a chunk (e.g. the dump plan lookup,
+        resolution of relations or computation of timestamps by extensions).
+
+        If a subclass overrides :meth:`dump`, each record is dumped with
+        ``record.dumps(dumper=dumper)`` instead.
+
+        :param records: An iterable of records.
+        :param chunk_size: Number of records processed at once.
+        :returns: A generator of dumps, in the same order as the records.
+        """
+        if self._overrides("dump"):
+            for record in records:
+                yield record.dumps(dumper=self)
+            return
+
+        records = iter(records)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            dumps = []
+            for record in chunk:
+                data = {}
+                record._pre_dump(data, self)
+                dumps.append(self._dump(record, data, self._plan(record.__class__)))
+
+            # Allow extensions to integrate as well.
+            for e in self._extensions:
+                e.dump_many(chunk, dumps)
+
+            for record, data in zip(chunk, dumps):
+                record._post_dump(data, self)
+                yield data
+
+    def load_many(self, dumps, record_cls, chunk_size=100):
+        """Load a batch of records from search engine document sources.
+
+        The records are the same as with
+        ``record_cls.loads(dump, loader=dumper)`` for each dump. The dumps are
+        not modified.
+
+        If a subclass overrides :meth:`load`, each dump is loaded with
+        ``record_cls.loads(dump, loader=dumper)`` instead.
+
+        :param dumps: An iterable of dumps (e.g. the sources of search hits).
+        :param record_cls: The record class to be constructed.
+        :param chunk_size: Number of dumps processed at once.
+        :returns: A generator of records, in the same order as the dumps.
+        """
+        if self._overrides("load"):
+            for data in dumps:
+                yield record_cls.loads(data, loader=self)
+            return
+
+        plan = self._plan(record_cls)
+        dumps = iter(dumps)
+        while True:
+            chunk = [deepcopy_json(data) for data in islice(dumps, chunk_size)]
+            if not chunk:
+                return
+            for data in chunk:
+                record_cls._pre_load(data, self)
+
+            # First allow extensions to modify the data.
+            for e in self._extensions:
+                e.load_many(chunk, record_cls)
+
+            for data in chunk:
+                record = self._load(data, record_cls, plan)
+                record_cls._post_load(record, data, self)
+                yield record
+
+
+_modelfields_cache = WeakKeyDictionary()
+
+
+def _get_modelfields(record_cls):
+    """Get the dumped model fields of a record class (cached per class)."""
+    fields = _modelfields_cache.get(record_cls)
+    if fields is None:
+        fields = []
+        for attr_name in dir(record_cls):
+            systemfield = getattr(record_cls, attr_name)
+            if isinstance(systemfield, ModelField):
+                if systemfield.dump:
+                    fields.append(systemfield)
+        fields = _modelfields_cache[record_cls] = tuple(fields)
+    return fields
@@ -12,5 +12,26 @@ class MissingModelError(RecordsError):
     """Error raised when a record has no model."""
 
 
+class ReadOnlyRecordError(RecordsError):
+    """Error raised when writing a read-only record.
+
+    E.g. a record loaded with a projection, or returned by the related records
+    cache.
+    """
+
+
 class RecordsRefResolverConfigError(RecordsError):
     """Custom ref resolver configuration it not correct."""
+
+
+class StaleRecordsError(RecordsError):
+    """Error raised when records were modified by a concurrent transaction."""
+
+    def __init__(self, records):
+        """Initialize the error with the stale records."""
+        self.records = records
+        super().__init__(
+            "Records modified concurrently: {}".format(
+                ", ".join(str(r.id) for r in records)
+            )
+        )
@@ -12,12 +12,19 @@ from jsonresolver import JSONResolver
 from jsonresolver.contrib.jsonref import json_loader_factory
 from jsonresolver.contrib.jsonschema import ref_resolver_factory
 from jsonschema import validate
+from jsonschema.exceptions import best_match
 
 from invenio_records.errors import RecordsRefResolverConfigError
 from invenio_records.resolver import urljoin_with_custom_scheme
 
 from . import config
-from .validators import _create_validator
+from .revisions import listen_delta
+from .signals import after_record_delete, after_record_revert, after_record_update
+from .systemfields.relations.cache import (
+    RelatedRecordsCache,
+    invalidate_related_record,
+)
+from .validators import JSONSchemaBackend, ValidatorCache, _create_validator
 
 
 class _RecordsState(object):
@@ -29,6 +36,7 @@ class _RecordsState(object):
         self.resolver = JSONResolver(entry_point_group=entry_point_group)
         self.refresolver_cls = ref_resolver_factory(self.resolver)
         self.refresolver_store = None
+        self.refresolver_cls_kwargs = {}
         if self.app.config.get("RECORDS_REFRESOLVER_CLS"):
             self.refresolver_cls = obj_or_import_string(
                 self.app.config.get("RECORDS_REFRESOLVER_CLS"),
@@ -36,29 +44,86 @@ class _RecordsState(object):
             self.refresolver_store = obj_or_import_string(
                 self.app.config.get("RECORDS_REFRESOLVER_STORE")
             )
+            self.refresolver_cls_kwargs = {
+                "store": self.refresolver_store,
+                "urljoin_cache": lru_cache(1024)(urljoin_with_custom_scheme),
+            }
 
         self.loader_cls = json_loader_factory(self.resolver)
-
-    def validate(self, data, schema, **kwargs):
-        """Validate data using schema with ``JSONResolver``."""
-        if not isinstance(schema, dict):
-            schema = {"$ref": schema}
-        refresolver_cls_kwargs = {}
-        if self.refresolver_store:
-            refresolver_cls_kwargs["store"] = self.refresolver_store
-            refresolver_cls_kwargs["urljoin_cache"] = lru_cache(1024)(
-                urljoin_with_custom_scheme
+        self.validation_backend = obj_or_import_string(
+            self.app.config.get("RECORDS_VALIDATION_BACKEND"),
+            default=JSONSchemaBackend,
+        )()
+        self.validator_cache = ValidatorCache(
+            maxsize=self.app.config.get("RECORDS_VALIDATOR_CACHE_SIZE", 128)
+        )
+        self.related_records_cache = None
+        if self.app.config.get("RECORDS_RELATIONS_CACHE_SIZE"):
+            self.related_records_cache = RelatedRecordsCache(
+                maxsize=self.app.config["RECORDS_RELATIONS_CACHE_SIZE"],
+                ttl=self.app.config.get("RECORDS_RELATIONS_CACHE_TTL"),
             )
 
+    def _build_validator(self, schema, base_validator_cls, custom_checks, **kwargs):
+        """Build a validator instance including its ref resolver."""
         validator_cls = _create_validator(
             schema=schema,
-            base_validator_cls=kwargs.pop("cls", None),
-            custom_checks=self.app.config.get("RECORDS_VALIDATION_TYPES", {}),
+            base_validator_cls=base_validator_cls,
+            custom_checks=custom_checks,
+        )
+        validator_cls.check_schema(schema)
+        resolver = self.refresolver_cls.from_schema(
+            schema, **self.refresolver_cls_kwargs
         )
+        return self.validation_backend.build(schema, validator_cls, resolver, **kwargs)
 
-        resolver = self.refresolver_cls.from_schema(schema, **refresolver_cls_kwargs)
+    def validate(self, data, schema, **kwargs):
+        """Validate data using schema with ``JSONResolver``.
 
-        return validate(data, schema, cls=validator_cls, resolver=resolver, **kwargs)
+        Validators for schemas given by URL are cached, see
+        :meth:`invalidate_validators`.
+        """
+        base_validator_cls = kwargs.pop("cls", None)
+        custom_checks = self.app.config.get("RECORDS_VALIDATION_TYPES", {})
+
+        # Inline schemas are not cached.
+        if isinstance(schema, dict):
+            validator_cls = _create_validator(
+                schema=schema,
+                base_validator_cls=base_validator_cls,
+                custom_checks=custom_checks,
+            )
+            resolver = self.refresolver_cls.from_schema(
+                schema, **self.refresolver_cls_kwargs
+            )
+            return validate(
+                data, schema, cls=validator_cls, resolver=resolver, **kwargs
+            )
+
+        key = (
+            schema,
+            base_validator_cls,
+            tuple(sorted(custom_checks.items())),
+            tuple(sorted(kwargs.items())),
+        )
+        validator = self.validator_cache.get(
+            key,
+            lambda: self._build_validator(
+                {"$ref": schema}, base_validator_cls, custom_checks, **kwargs
+            ),
+        )
+        # Same error reporting as ``jsonschema.validate``.
+        error = best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
+
+    def invalidate_validators(self, schema=None):
+        """Invalidate cached validators, e.g. after schemas were redeployed.
+
+        :param schema: Only invalidate the validators of this schema URL. If
+            not given, all cached validators are invalidated.
+        """
+        self.validator_cache.invalidate(schema)
 
     def replace_refs(self, data):
         """Replace the JSON reference objects with ``JsonRef``."""
@@ -83,6 +148,10 @@ class InvenioRecords(object):
         self.init_config(app)
         state = _RecordsState(app, entry_point_group=entry_point_group)
         app.extensions["invenio-records"] = state
+        for signal in (after_record_update, after_record_delete, after_record_revert):
+            signal.connect(invalidate_related_record)
+        if app.config["RECORDS_REVISIONS_DELTA"]:
+            listen_delta()
         return state
 
     def init_config(self, app):
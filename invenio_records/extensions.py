@@ -8,6 +8,53 @@
 For instance, the system fields feature is built as an extension.
 """
 
+import inspect
+from weakref import WeakKeyDictionary
+
+_DATA_HOOKS = ("pre_dump", "post_dump", "pre_load", "post_load", "dump")
+"""Hooks which used to be called without the ``data`` argument."""
+
+_legacy_hooks_cache = WeakKeyDictionary()
+
+
+def _legacy_hooks(cls):
+    """Get the hooks of a class with the deprecated signature.
+
+    The signatures of the hooks are inspected once per class. The result is
+    cached with a weak reference to the class, so that dynamically created
+    classes can still be garbage collected.
+
+    :param cls: An extension, system field or dumper class.
+    :returns: A frozenset with the names of the hooks without a ``data``
+        argument.
+    """
+    try:
+        return _legacy_hooks_cache[cls]
+    except KeyError:
+        pass
+    legacy = frozenset(
+        name
+        for name in _DATA_HOOKS
+        if callable(getattr(cls, name, None))
+        and "data" not in inspect.signature(getattr(cls, name)).parameters
+    )
+    _legacy_hooks_cache[cls] = legacy
+    return legacy
+
+
+def _hook_takes_data(obj, name):
+    """Check if a hook of an object takes the positional argument ``data``.
+
+    Used to detect hooks with the deprecated signature.
+
+    :param obj: The extension, system field or dumper.
+    :param name: The name of the hook (e.g. ``"pre_dump"``).
+    """
+    if name in getattr(obj, "__dict__", ()):
+        # Hook set on the instance.
+        return "data" in inspect.signature(getattr(obj, name)).parameters
+    return name not in _legacy_hooks(type(obj))
+
 
 class ExtensionMixin:
     """Defines the methods needed by an extension."""
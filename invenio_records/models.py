@@ -6,6 +6,7 @@
 
 import uuid
 from copy import deepcopy
+from json import dumps, loads
 
 from invenio_db import db
 from sqlalchemy.dialects import postgresql
@@ -13,6 +14,13 @@ from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy_utils.types import JSONType, UUIDType
 
+from .dictutils import deepcopy_json
+
+
+def _json_copy(value):
+    """Copy a JSON document by serializing and parsing it."""
+    return loads(dumps(value))
+
 
 class RecordMetadataBase(db.Timestamp):
     """Represent a base class for record metadata.
@@ -29,6 +37,30 @@ class RecordMetadataBase(db.Timestamp):
     objects into Python datetime objects.
     """
 
+    copy_strategy = "tree"
+    """Class-level attribute to set how JSON documents are copied.
+
+    The record dictionary and the model's JSON are kept isolated from each
+    other by copying the data when encoding/decoding. Supported strategies:
+
+    - ``"tree"`` uses :func:`~invenio_records.dictutils.deepcopy_json`, which
+      is specialised for JSON data types and falls back to
+      :func:`copy.deepcopy` for other objects.
+    - ``"deepcopy"`` uses :func:`copy.deepcopy` and supports any Python
+      object, including objects referenced several times in the tree.
+    - ``"json"`` serializes and parses the data with the :mod:`json` module,
+      which is several times faster for large documents. Only use it if the
+      record dictionary holds JSON data types only (e.g. an encoder relying
+      on Python date objects in the dictionary is not supported, and tuples
+      are copied as lists).
+    """
+
+    _copiers = {
+        "tree": deepcopy_json,
+        "deepcopy": deepcopy,
+        "json": _json_copy,
+    }
+
     id = db.Column(
         UUIDType,
         primary_key=True,
@@ -111,19 +143,44 @@ class RecordMetadataBase(db.Timestamp):
         self.json = self.encode(value)
         flag_modified(self, "json")
 
+    @classmethod
+    def copy(cls, value):
+        """Copy a JSON document according to the copy strategy."""
+        return cls._copiers[cls.copy_strategy](value)
+
     @classmethod
     def encode(cls, value):
         """Encode a JSON document."""
-        data = deepcopy(value)
+        data = cls.copy(value)
         return cls.encoder.encode(data) if cls.encoder else data
 
     @classmethod
     def decode(cls, json):
         """Decode a JSON document."""
-        data = deepcopy(json)
+        data = cls.copy(json)
         return cls.encoder.decode(data) if cls.encoder else data
 
 
+class PartialRecordModel:
+    """Read-only model of a record.
+
+    Holds the identifier, version and timestamps of the record, but not its
+    JSON document. Used for records loaded with a projection (see
+    :meth:`~invenio_records.api.Record.get_records`) and for the records
+    returned by the related records cache.
+    """
+
+    __slots__ = ("id", "version_id", "created", "updated", "is_deleted")
+
+    def __init__(self, id, version_id, created, updated, is_deleted):
+        """Initialize the model from the selected columns."""
+        self.id = id
+        self.version_id = version_id
+        self.created = created
+        self.updated = updated
+        self.is_deleted = is_deleted
+
+
 class RecordMetadata(db.Model, RecordMetadataBase):
     """Represent a record metadata."""
 
@@ -133,7 +190,30 @@ class RecordMetadata(db.Model, RecordMetadataBase):
     __versioned__ = {}
 
 
+class RecordDependency(db.Model):
+    """Revision of a related record dereferenced in a record.
+
+    The table is maintained by
+    :class:`~invenio_records.systemfields.RelationsField` when
+    ``RECORDS_RELATIONS_TRACK_DEPENDENCIES`` is enabled. It allows finding
+    the records embedding an outdated version of a related record (i.e. with
+    an outdated ``@v`` in their dumps) without querying the search engine.
+    """
+
+    __tablename__ = "records_dependencies"
+
+    record_id = db.Column(UUIDType, primary_key=True)
+    """Identifier of the record."""
+
+    related_id = db.Column(UUIDType, primary_key=True, index=True)
+    """Identifier of the related record."""
+
+    related_revision = db.Column(db.Integer, nullable=False)
+    """Revision of the related record when the record was last committed."""
+
+
 __all__ = (
+    "RecordDependency",
     "RecordMetadata",
     "RecordMetadataBase",
 )
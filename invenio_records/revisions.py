@@ -0,0 +1,355 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Delta-compressed storage of record revisions.
+
+SQLAlchemy-Continuum stores a full copy of the JSON document of a record in
+the version table for each transaction changing it. If
+``RECORDS_REVISIONS_DELTA`` is enabled, a revision is instead stored as a
+JSON patch against the latest full copy (a *snapshot*) of the record:
+
+.. code-block:: text
+
+    {"$delta": {"snapshot": 42, "n": 3, "patch": [...]}}
+
+where ``snapshot`` is the transaction ID of the snapshot and ``n`` the
+number of revisions since the snapshot. A new snapshot is stored every
+``RECORDS_REVISIONS_SNAPSHOT_INTERVAL`` revisions, or when the patch is not
+much smaller than the document. Reconstructing a revision thus costs at most
+one extra row and one patch.
+
+:class:`~invenio_records.api.RecordRevision` and
+:meth:`~invenio_records.api.Record.revert` reconstruct the revisions
+transparently (whether the storage is enabled or not, so that it can be
+disabled again), while the features of SQLAlchemy-Continuum relying on the
+stored JSON (e.g. ``version.changeset``) see the patches.
+
+The history of records can also be bounded by pruning old revisions with
+:func:`prune_revisions` (see also the ``prune_revisions`` Celery task of
+:mod:`invenio_records.tasks.api`).
+"""
+
+import json
+from datetime import timezone
+from itertools import groupby
+
+from flask import current_app, has_app_context
+from invenio_db import db
+from jsonpatch import apply_patch, make_patch
+from sqlalchemy import Text, cast, delete, event, func
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select, update
+from sqlalchemy.orm import Mapper
+from sqlalchemy_continuum.utils import option, version_class
+
+from .models import RecordMetadata, RecordMetadataBase
+
+DELTA_KEY = "$delta"
+"""Key of the JSON documents of revisions stored as a patch."""
+
+CHUNK_SIZE = 500
+"""Maximum number of revisions deleted with one query."""
+
+
+def is_delta(json):
+    """Check if the JSON document of a version is stored as a patch."""
+    return isinstance(json, dict) and len(json) == 1 and DELTA_KEY in json
+
+
+def _transaction_column(version_cls):
+    """Get the transaction ID column of a version class."""
+    return getattr(version_cls, option(version_cls, "transaction_column_name"))
+
+
+def version_json(version):
+    """Get the full JSON document of a version (i.e. a revision).
+
+    :param version: The version model (e.g. from ``model.versions``).
+    :returns: The JSON document, as stored in the records table.
+    """
+    return _full_json(version.__class__, version.id, version.json)
+
+
+def _full_json(version_cls, record_id, data):
+    """Apply the patch of a JSON document stored as a patch."""
+    if not is_delta(data):
+        return data
+    delta = data[DELTA_KEY]
+    column = _transaction_column(version_cls)
+    snapshot = db.session.execute(
+        select(version_cls.json).where(
+            version_cls.id == record_id, column == delta["snapshot"]
+        )
+    ).scalar_one()
+    return apply_patch(snapshot, delta["patch"])
+
+
+def _json_size(value):
+    """Size of a JSON document once serialized."""
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def make_delta(connection, version_cls, record_id, transaction_id, data):
+    """Build the JSON document storing a revision as a patch.
+
+    :param connection: The database connection to query the previous
+        revisions with.
+    :param version_cls: The version class.
+    :param record_id: The ID of the record.
+    :param transaction_id: The transaction ID of the new revision.
+    :param data: The full JSON document of the new revision.
+    :returns: The delta document, or ``None`` if a snapshot must be stored.
+    """
+    column = _transaction_column(version_cls)
+    previous = connection.execute(
+        select(column, version_cls.json)
+        .where(version_cls.id == record_id, column < transaction_id)
+        .order_by(column.desc())
+        .limit(1)
+    ).first()
+    # First revision, or revision following a deletion.
+    if previous is None or previous[1] is None:
+        return None
+
+    snapshot_id, snapshot = previous
+    n = 1
+    if is_delta(snapshot):
+        delta = snapshot[DELTA_KEY]
+        n = delta["n"] + 1
+        if n >= current_app.config["RECORDS_REVISIONS_SNAPSHOT_INTERVAL"]:
+            return None
+        snapshot_id = delta["snapshot"]
+        snapshot = connection.execute(
+            select(version_cls.json).where(
+                version_cls.id == record_id, column == snapshot_id
+            )
+        ).scalar_one()
+
+    patch = make_patch(snapshot, data).patch
+    # Not worth it if the patch is not much smaller than the document.
+    if _json_size(patch) * 2 > _json_size(data):
+        return None
+    return {DELTA_KEY: {"snapshot": snapshot_id, "n": n, "patch": patch}}
+
+
+def store_delta(mapper, connection, target):
+    """Store the JSON document of a new version as a patch.
+
+    Mapper event listener (``before_insert`` and ``before_update``) for the
+    version classes of the records models (see :func:`listen_delta`).
+    """
+    if not has_app_context() or not current_app.config.get(
+        "RECORDS_REVISIONS_DELTA", False
+    ):
+        # E.g. another application of the process has enabled the storage.
+        return
+    data = target.json
+    if data is None or is_delta(data):
+        return
+    state = sa_inspect(target)
+    if state.persistent and not state.attrs.json.history.has_changes():
+        # E.g. only the end transaction ID of the version is updated.
+        return
+
+    delta = make_delta(
+        connection,
+        target.__class__,
+        target.id,
+        getattr(target, _transaction_column(target.__class__).key),
+        data,
+    )
+    if delta is not None:
+        target.json = delta
+
+
+def _listen_version_classes():
+    """Listen to the flushes of the built version classes of records models."""
+    for mapper in list(db.Model.registry.mappers):
+        model_cls = mapper.class_
+        if not issubclass(model_cls, RecordMetadataBase) or not hasattr(
+            model_cls, "__versioning_manager__"
+        ):
+            # Not a records model, or not versioned.
+            continue
+        version_cls = version_class(model_cls)
+        if version_cls is model_cls:
+            # The version class is not built yet.
+            continue
+        for identifier in ("before_insert", "before_update"):
+            if not event.contains(version_cls, identifier, store_delta):
+                event.listen(version_cls, identifier, store_delta)
+
+
+def listen_delta():
+    """Register :func:`store_delta` on the version classes of records models.
+
+    The version classes built later on (when the mappers are configured) are
+    registered as well. Called when initializing the application if
+    ``RECORDS_REVISIONS_DELTA`` is enabled.
+    """
+    _listen_version_classes()
+    if not event.contains(Mapper, "after_configured", _listen_version_classes):
+        event.listen(Mapper, "after_configured", _listen_version_classes)
+
+
+def select_pruned(versions, keep_last=10, keep_daily=False, before=None):
+    """Select the revisions of a record to prune.
+
+    :param versions: List of ``(transaction_id, updated)`` tuples of the
+        revisions of a record, from the oldest to the latest.
+    :param keep_last: Number of latest revisions always kept (at least the
+        current revision is kept).
+    :param keep_daily: If ``True``, keep the latest revision of each day.
+    :param before: If set, only prune revisions updated before this date.
+    :returns: A list of the transaction IDs of the revisions to prune.
+    """
+    candidates = versions[: -max(keep_last, 1)]
+    if before is not None:
+        candidates = [v for v in candidates if _as_utc(v[1]) < _as_utc(before)]
+    if not keep_daily:
+        return [tx for tx, _ in candidates]
+
+    # The latest revision of a day is kept, including when it is followed by
+    # revisions of the same day which are not candidates.
+    day_of = {tx: updated.date() for tx, updated in versions}
+    next_tx = {a[0]: b[0] for a, b in zip(versions, versions[1:])}
+    return [
+        tx
+        for tx, updated in candidates
+        if tx in next_tx and day_of[next_tx[tx]] == updated.date()
+    ]
+
+
+def _as_utc(value):
+    """Make a naive (UTC) datetime comparable with an aware one."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _record_ids_batches(version_cls, record_ids, batch_size):
+    """Iterate over batches of record IDs having revisions."""
+    if record_ids is not None:
+        record_ids = list(record_ids)
+        for i in range(0, len(record_ids), batch_size):
+            yield record_ids[i : i + batch_size]
+        return
+
+    last_id = None
+    while True:
+        query = (
+            select(version_cls.id).distinct().order_by(version_cls.id).limit(batch_size)
+        )
+        if last_id is not None:
+            query = query.where(version_cls.id > last_id)
+        batch = db.session.scalars(query).all()
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1]
+
+
+def _prune_record(version_cls, record_id, versions, pruned):
+    """Delete pruned revisions of a record and return the bytes reclaimed."""
+    column = _transaction_column(version_cls)
+    pruned_set = set(pruned)
+    kept = [tx for tx, _ in versions if tx not in pruned_set]
+
+    # Store the revisions stored as a patch against a pruned snapshot in
+    # full (only later revisions can be stored as a patch).
+    rows = db.session.execute(
+        select(column, version_cls.json).where(
+            version_cls.id == record_id,
+            column.in_(kept),
+            column > min(pruned),
+        )
+    )
+    for tx, data in rows.all():
+        if is_delta(data) and data[DELTA_KEY]["snapshot"] in pruned_set:
+            db.session.execute(
+                update(version_cls)
+                .where(version_cls.id == record_id, column == tx)
+                .values(json=_full_json(version_cls, record_id, data)),
+                execution_options={"synchronize_session": False},
+            )
+
+    reclaimed = 0
+    size = func.sum(func.length(cast(version_cls.json, Text)))
+    for i in range(0, len(pruned), CHUNK_SIZE):
+        chunk = pruned[i : i + CHUNK_SIZE]
+        condition = (version_cls.id == record_id) & column.in_(chunk)
+        reclaimed += db.session.execute(select(size).where(condition)).scalar() or 0
+        db.session.execute(
+            delete(version_cls).where(condition),
+            execution_options={"synchronize_session": False},
+        )
+
+    # The validity of a revision ends with the next kept revision.
+    if option(version_cls, "strategy") == "validity":
+        end_column = getattr(
+            version_cls, option(version_cls, "end_transaction_column_name")
+        )
+        following = {a[0]: b[0] for a, b in zip(versions, versions[1:])}
+        for tx, next_tx in zip(kept, kept[1:]):
+            if following[tx] != next_tx:
+                db.session.execute(
+                    update(version_cls)
+                    .where(version_cls.id == record_id, column == tx)
+                    .values({end_column.key: next_tx}),
+                    execution_options={"synchronize_session": False},
+                )
+    return reclaimed
+
+
+def prune_revisions(
+    model_cls=RecordMetadata,
+    keep_last=10,
+    keep_daily=False,
+    before=None,
+    record_ids=None,
+    batch_size=100,
+):
+    """Prune the old revisions of records.
+
+    Only the versions table is modified (the records table is neither
+    updated nor locked). The records are processed by batches, and the
+    statistics of each batch are returned once it is processed, so that the
+    caller can commit the changes in between:
+
+    .. code-block:: python
+
+        for stats in prune_revisions(keep_last=5, keep_daily=True):
+            db.session.commit()
+
+    The revision IDs of the kept revisions do not change (i.e. the revision
+    IDs have holes).
+
+    :param model_cls: The records model class.
+    :param keep_last: Number of latest revisions of each record to keep.
+    :param keep_daily: If ``True``, keep the latest revision of each day.
+    :param before: If set, only prune revisions updated before this date.
+    :param record_ids: IDs of the records to prune (defaults to all the
+        records of the model).
+    :param batch_size: Number of records per batch.
+    :returns: A generator of dictionaries with the number of ``records``
+        pruned, the number of ``rows`` deleted and the ``bytes`` of JSON
+        reclaimed in each batch.
+    """
+    version_cls = version_class(model_cls)
+    column = _transaction_column(version_cls)
+    for batch in _record_ids_batches(version_cls, record_ids, batch_size):
+        stats = {"records": 0, "rows": 0, "bytes": 0}
+        rows = db.session.execute(
+            select(version_cls.id, column, version_cls.updated)
+            .where(version_cls.id.in_(batch))
+            .order_by(version_cls.id, column)
+        ).all()
+        for record_id, group in groupby(rows, key=lambda row: row[0]):
+            versions = [(tx, updated) for _, tx, updated in group]
+            pruned = select_pruned(versions, keep_last, keep_daily, before)
+            if not pruned:
+                continue
+            stats["records"] += 1
+            stats["rows"] += len(pruned)
+            stats["bytes"] += _prune_record(version_cls, record_id, versions, pruned)
+        yield stats
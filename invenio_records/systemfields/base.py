@@ -8,8 +8,13 @@
 import inspect
 import warnings
 
-from ..dictutils import dict_lookup, parse_lookup_key
-from ..extensions import ExtensionMixin, RecordExtension, RecordMeta
+from ..dictutils import KeyPath
+from ..extensions import (
+    ExtensionMixin,
+    RecordExtension,
+    RecordMeta,
+    _hook_takes_data,
+)
 
 
 def _get_fields(attrs, field_class):
@@ -46,6 +51,26 @@ def _get_inherited_fields(class_, field_class):
     return fields
 
 
+_HOOKS = [
+    name
+    for name, value in vars(ExtensionMixin).items()
+    if name.startswith(("pre_", "post_")) and callable(value)
+]
+"""Names of the extension points."""
+
+
+def _overrides_hook(field, method, base=ExtensionMixin):
+    """Check if a field overrides the implementation of a hook in a base class.
+
+    :param field: The system field.
+    :param method: The name of the hook.
+    :param base: The class providing the default implementation.
+    """
+    if method in vars(field):
+        return True
+    return getattr(type(field), method) is not getattr(base, method)
+
+
 class SystemFieldContext:
     """Base class for a system field context.
 
@@ -92,6 +117,7 @@ class SystemField(ExtensionMixin):
         # The attribute is set by __set_name__ which is called by the metaclass
         # during construction.
         self._attr_name = None
+        self._key_path = None
 
     @property
     def attr_name(self):
@@ -110,6 +136,19 @@ class SystemField(ExtensionMixin):
         """
         return self._key or self._attr_name
 
+    @property
+    def key_path(self):
+        """Compiled :class:`~invenio_records.dictutils.KeyPath` of the key.
+
+        Built on first access from :attr:`key` (which subclasses may
+        override), and built again if the key changes.
+        """
+        key = self.key
+        path = getattr(self, "_key_path", None)
+        if path is None or path.key != key:
+            path = self._key_path = KeyPath(key)
+        return path
+
     #
     # Data descriptor definition
     #
@@ -187,15 +226,16 @@ class SystemField(ExtensionMixin):
         Assume the key have been set in ``self.key``
         """
         try:
-            return dict_lookup(instance, self.key)
+            return self.key_path.get(instance)
         except KeyError:
             return None
 
     def set_dictkey(self, instance, value, create_if_missing=False):
         """Helper to set value using a lookup key on a nested object."""
-        keys = parse_lookup_key(self.key)
+        path = self.key_path
+        keys = path.keys
         try:
-            parent = dict_lookup(instance, keys, parent=True)
+            parent = path.get(instance, parent=True)
         except KeyError as e:
             if not create_if_missing:
                 raise
@@ -236,14 +276,41 @@ class SystemFieldsExt(RecordExtension):
 
     This extension is responsible for iterating over all declared system fields
     on a class for each extension point.
+
+    A dispatch table is built once per record class with, for each extension
+    point, only the fields which override the no-op hook of
+    :py:class:`~invenio_records.extensions.ExtensionMixin`.
     """
 
     def __init__(self, declared_fields):
         """Save the declared fields on the extension."""
         self.declared_fields = declared_fields
+        self._hooks = {
+            method: [
+                field
+                for field in declared_fields.values()
+                if _overrides_hook(field, method)
+            ]
+            for method in _HOOKS
+        }
+        # SystemField.post_init() only sets the field data passed to the
+        # record constructor, so it can be skipped if there is none.
+        self._hooks["post_init"] = [
+            field
+            for field in declared_fields.values()
+            if _overrides_hook(field, "post_init", SystemField)
+        ]
+        # Whether the hooks take the data argument (deprecated signature).
+        self._data_hooks = {
+            method: [
+                (field, _hook_takes_data(field, method))
+                for field in self._hooks[method]
+            ]
+            for method in ("pre_dump", "post_dump", "pre_load", "post_load")
+        }
 
     def _run(self, method, *args, **kwargs):
-        for field in self.declared_fields.values():
+        for field in self._hooks[method]:
             getattr(field, method)(*args, **kwargs)
 
     def pre_init(self, *args, **kwargs):
@@ -254,15 +321,15 @@ class SystemFieldsExt(RecordExtension):
         """Called when a new record instance is initialized."""
         # Special treatment for post_init (also has special implementation
         # in SystemField)
-        for attr_name, field in self.declared_fields.items():
+        fields = self.declared_fields.values() if kwargs else self._hooks["post_init"]
+        for field in fields:
             field_data = kwargs.get(field.attr_name)
             field.post_init(record, data, model=model, field_data=field_data)
 
     def pre_dump(self, record, data, dumper=None):
         """Called before a record is dumped."""
-        for field in self.declared_fields.values():
-            pre_dump_params = inspect.signature(field.pre_dump).parameters
-            if "data" in pre_dump_params:
+        for field, takes_data in self._data_hooks["pre_dump"]:
+            if takes_data:
                 field.pre_dump(record, data, dumper=dumper)
             else:
                 # TODO: Remove in v1.6.0 or later
@@ -274,9 +341,8 @@ class SystemFieldsExt(RecordExtension):
 
     def post_dump(self, record, data, dumper=None):
         """Called after a record is dumped."""
-        for field in self.declared_fields.values():
-            post_dump_params = inspect.signature(field.post_dump).parameters
-            if "data" in post_dump_params:
+        for field, takes_data in self._data_hooks["post_dump"]:
+            if takes_data:
                 field.post_dump(record, data, dumper=dumper)
             else:
                 # TODO: Remove in v1.6.0 or later
@@ -288,9 +354,8 @@ class SystemFieldsExt(RecordExtension):
 
     def pre_load(self, data, loader=None):
         """Called before a record is loaded."""
-        for field in self.declared_fields.values():
-            pre_load_params = inspect.signature(field.pre_load).parameters
-            if "data" in pre_load_params:
+        for field, takes_data in self._data_hooks["pre_load"]:
+            if takes_data:
                 field.pre_load(data, loader=loader)
             else:
                 # TODO: Remove in v1.6.0 or later
@@ -302,9 +367,8 @@ class SystemFieldsExt(RecordExtension):
 
     def post_load(self, record, data, loader=None):
         """Called after a record is loaded."""
-        for field in self.declared_fields.values():
-            post_load_params = inspect.signature(field.post_load).parameters
-            if "data" in post_load_params:
+        for field, takes_data in self._data_hooks["post_load"]:
+            if takes_data:
                 field.post_load(record, data, loader=loader)
             else:
                 # TODO: Remove in v1.6.0 or later
@@ -4,7 +4,6 @@
 
 """Constant system field."""
 
-from ..dictutils import dict_lookup
 from .base import SystemField
 
 
@@ -27,7 +26,7 @@ class ConstantField(SystemField):
             # A deleted record.
             return
         try:
-            dict_lookup(data, self.key)
+            self.key_path.get(data)
         except KeyError:
             # Key is not present, so add it.
             data[self.key] = self.value
@@ -39,7 +38,7 @@ class ConstantField(SystemField):
         skips them and the constant key is missing. Repopulate it here.
         """
         try:
-            dict_lookup(record, self.key)
+            self.key_path.get(record)
         except KeyError:
             record[self.key] = self.value
 
@@ -50,6 +49,6 @@ class ConstantField(SystemField):
             return self
         # Instance access
         try:
-            return dict_lookup(record, self.key)
+            return self.key_path.get(record)
         except KeyError:
             return None
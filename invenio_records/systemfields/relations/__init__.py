@@ -14,6 +14,7 @@ The field consists of:
   ``record.relations.languages``).
 """
 
+from .cache import RelatedRecordsCache
 from .errors import InvalidCheckValue, InvalidRelationValue, RelationError
 from .field import MultiRelationsField, RelationsField
 from .mapping import RelationsMapping
@@ -38,6 +39,7 @@ __all__ = (
     "PKListRelation",
     "PKNestedListRelation",
     "PKRelation",
+    "RelatedRecordsCache",
     "RelationBase",
     "RelationError",
     "RelationListResult",
@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Process-wide cache of related records.
+
+The relations cache injected by a ``RelationsMapping`` only lives as long as
+the record it belongs to. The cache defined here is shared by all records
+of an application, which avoids fetching the same related records (e.g.
+vocabulary entries) again for each record when dumping many records.
+
+The cache is disabled by default, see ``RECORDS_RELATIONS_CACHE_SIZE``.
+Entries are removed when the related record is updated, deleted or reverted
+(see :mod:`invenio_records.signals`) and expire after
+``RECORDS_RELATIONS_CACHE_TTL`` seconds, which bounds how long changes made
+by other processes may go unnoticed.
+
+The cache stores a copy of the columns of the records models (including the
+JSON document). Each lookup builds a new record from it, with a read-only
+copy of the model: the records returned by the cache can be modified, but not
+committed, deleted or reverted (a
+:class:`~invenio_records.errors.ReadOnlyRecordError` is raised). The
+relationships of the models are not available.
+
+Records read in a transaction which has written to the database are only
+added to the cache when the transaction is committed (and discarded if it is
+rolled back), so that uncommitted changes are never shared with other
+transactions.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, has_app_context
+from invenio_db import db
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from ...dictutils import deepcopy_json
+from ...models import PartialRecordModel
+
+_PENDING = "invenio_records_related_records"
+"""Session info key of the records added to the cache on commit."""
+
+_WRITTEN = "invenio_records_written"
+"""Session info key set when the transaction of a session has written."""
+
+
+def _copy(value):
+    """Copy the value of a column if it is mutable (i.e. a JSON document)."""
+    return deepcopy_json(value) if isinstance(value, (dict, list)) else value
+
+
+class CachedRecordModel(PartialRecordModel):
+    """Read-only copy of a record model, returned by the cache.
+
+    Holds a copy of all the loaded columns of the model, so that e.g. the
+    system fields reading them see the same values as with the model.
+    """
+
+    __slots__ = ("_model_cls", "_columns")
+
+    def __init__(self, model_cls, columns):
+        """Initialize the model from the values of its columns."""
+        self._model_cls = model_cls
+        self._columns = columns
+        super().__init__(
+            columns["id"],
+            columns["version_id"],
+            columns["created"],
+            columns["updated"],
+            columns.get("json") is None,
+        )
+
+    def __getattr__(self, name):
+        """Get a copy of the value of another column (e.g. ``json``)."""
+        if name in CachedRecordModel.__slots__:
+            raise AttributeError(name)
+        try:
+            return _copy(self._columns[name])
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def data(self):
+        """Get a copy of the decoded JSON document."""
+        return self._model_cls.decode(self._columns["json"])
+
+
+class RelatedRecordsCache:
+    """Thread-safe LRU cache of related records with an optional TTL."""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        """Initialize the cache.
+
+        :param maxsize: Maximum number of records kept in the cache.
+        :param ttl: Number of seconds after which an entry expires. If
+            ``None``, entries only expire when they are invalidated.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        listen_transactions()
+
+    def get(self, record_cls, id_):
+        """Get a record from the cache.
+
+        :param record_cls: The class of the related record.
+        :param id_: The normalized UUID (as a string) of the record.
+        :returns: A new record (with a read-only model) or ``None`` if it is
+            not in the cache.
+        """
+        snapshot = None
+        with self._lock:
+            entry = self._entries.get(id_)
+            if entry is not None:
+                cached_cls, cached, revision_id, expires_at = entry
+                if expires_at is not None and expires_at < time.monotonic():
+                    del self._entries[id_]
+                elif cached is not None and cached_cls is record_cls:
+                    self._entries.move_to_end(id_)
+                    snapshot = cached
+            if snapshot is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        model = CachedRecordModel(record_cls.model_cls, snapshot)
+        return record_cls(model.data, model=model)
+
+    def set(self, record_cls, id_, record):
+        """Add a record to the cache.
+
+        The record is not added if a newer revision of it was invalidated in
+        the meantime (i.e. it was read before a concurrent update). A copy of
+        the record is stored, so it can still be modified afterwards.
+
+        If the transaction of the current session has written to the
+        database (or has pending changes), the record is only added when the
+        transaction is committed.
+        """
+        model = record.model
+        if model is None:
+            return
+        state = sa_inspect(model)
+        # Deferred columns which are not loaded are left out.
+        snapshot = {
+            key: _copy(state.dict[key])
+            for key in state.mapper.column_attrs.keys()
+            if key in state.dict
+        }
+
+        session = db.session() if has_app_context() else None
+        if session is not None and (
+            session.info.get(_WRITTEN)
+            or session.new
+            or session.dirty
+            or session.deleted
+        ):
+            pending = session.info.setdefault(_PENDING, [])
+            pending.append((self, record_cls, id_, snapshot, record.revision_id))
+        else:
+            self._add(record_cls, id_, snapshot, record.revision_id)
+
+    def _add(self, record_cls, id_, snapshot, revision_id):
+        """Add the snapshot of a record to the cache."""
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            entry = self._entries.get(id_)
+            if entry is not None and entry[1] is None:
+                if revision_id is None or revision_id < entry[2]:
+                    return
+            self._entries[id_] = (record_cls, snapshot, revision_id, expires_at)
+            self._entries.move_to_end(id_)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, id_=None, revision_id=None):
+        """Remove a record (or all records if no ID is given) from the cache.
+
+        :param id_: The normalized UUID (as a string) of the record.
+        :param revision_id: The revision of the record after the change. Older
+            revisions are not added to the cache anymore.
+        """
+        with self._lock:
+            if id_ is None:
+                self._entries.clear()
+            elif revision_id is None:
+                self._entries.pop(id_, None)
+            else:
+                expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+                self._entries[id_] = (None, None, revision_id, expires_at)
+                self._entries.move_to_end(id_)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def info(self):
+        """Get the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "currsize": sum(1 for e in self._entries.values() if e[1] is not None),
+        }
+
+
+def current_related_records_cache():
+    """Get the related records cache of the current application.
+
+    :returns: The cache or ``None`` if it is disabled.
+    """
+    if not has_app_context():
+        return None
+    state = current_app.extensions.get("invenio-records")
+    return getattr(state, "related_records_cache", None)
+
+
+def invalidate_related_record(sender, record=None, **kwargs):
+    """Signal receiver removing a changed record from the cache."""
+    state = getattr(sender, "extensions", {}).get("invenio-records")
+    cache = getattr(state, "related_records_cache", None)
+    if cache is not None and record is not None and record.id is not None:
+        cache.invalidate(str(record.id), revision_id=record.revision_id)
+
+
+def _after_flush(session, flush_context):
+    """Mark the transaction of a session as having written."""
+    session.info[_WRITTEN] = True
+
+
+def _after_commit(session):
+    """Add the records read during a committed transaction to the caches."""
+    if session.in_nested_transaction():
+        # Only a savepoint is released.
+        return
+    session.info.pop(_WRITTEN, None)
+    for cache, record_cls, id_, snapshot, revision_id in session.info.pop(_PENDING, ()):
+        cache._add(record_cls, id_, snapshot, revision_id)
+
+
+def _after_soft_rollback(session, previous_transaction):
+    """Discard the records read during a rolled back transaction."""
+    # Also after rolling back a savepoint, as the records may have been read
+    # after changes made inside it.
+    session.info.pop(_PENDING, None)
+    if not previous_transaction.nested:
+        session.info.pop(_WRITTEN, None)
+
+
+def listen_transactions():
+    """Track the transactions of the sessions (see :meth:`RelatedRecordsCache.set`).
+
+    Called when a cache is created.
+    """
+    for identifier, listener in (
+        ("after_flush", _after_flush),
+        ("after_commit", _after_commit),
+        ("after_soft_rollback", _after_soft_rollback),
+    ):
+        if not event.contains(Session, identifier, listener):
+            event.listen(Session, identifier, listener)
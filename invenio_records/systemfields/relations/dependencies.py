@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Reverse dependencies between records and their related records.
+
+Dumps of records embed a version counter ``"@v": "<id>::<revision_id>"`` for
+each dereferenced related record. When a related record (e.g. a vocabulary
+entry) changes, the records embedding it must be reindexed.
+
+If ``RECORDS_RELATIONS_TRACK_DEPENDENCIES`` is enabled, relations fields
+store the revisions of the related records in the
+:class:`~invenio_records.models.RecordDependency` table each time a record is
+created or committed. Outdated records can then be streamed with a single
+database query:
+
+.. code-block:: python
+
+    revisions = {}
+    for record_id in iter_stale_records(Vocabulary):
+        dump = reindex(record_id)
+        revisions[record_id] = dumped_revisions(dump)
+    mark_current(Vocabulary, revisions)
+
+Only primary key relations (i.e. relations with a ``record_cls``) are
+tracked. Related records which are hard-deleted are not reported.
+"""
+
+import uuid
+
+from flask import current_app
+from invenio_db import db
+from sqlalchemy import bindparam, delete, insert, select, update
+
+from ...models import RecordDependency
+from .relations import _normalize_id
+
+CHUNK_SIZE = 500
+"""Maximum number of IDs used in one query."""
+
+
+def _chunks(values):
+    """Split a list of values into lists of at most ``CHUNK_SIZE`` values."""
+    return (values[i : i + CHUNK_SIZE] for i in range(0, len(values), CHUNK_SIZE))
+
+
+def tracking_enabled():
+    """Check if the dependencies of records are tracked."""
+    return current_app.config.get("RECORDS_RELATIONS_TRACK_DEPENDENCIES", False)
+
+
+def update_dependencies(record, relations):
+    """Replace the dependencies of a record by its current relations.
+
+    Only the changes are written: nothing is written if the related records
+    and their revisions did not change.
+
+    :param record: The record, which must have a model.
+    :param relations: The ``RelationsMapping`` of the record.
+    """
+    ids_by_cls = {}
+    for name in relations:
+        record_cls = getattr(relations._fields[name], "record_cls", None)
+        if record_cls is None:
+            continue
+        ids = ids_by_cls.setdefault(record_cls, set())
+        for id_ in getattr(relations, name).ids():
+            key = _normalize_id(id_)
+            if key is not None:
+                ids.add(key)
+
+    # Current revisions of the related records.
+    revisions = {}
+    for record_cls, ids in ids_by_cls.items():
+        model_cls = record_cls.model_cls
+        for chunk in _chunks(list(ids)):
+            query = select(model_cls.id, model_cls.version_id).where(
+                model_cls.id.in_(chunk)
+            )
+            with db.session.no_autoflush:
+                for related_id, version_id in db.session.execute(query):
+                    revisions[related_id] = version_id - 1
+
+    with db.session.no_autoflush:
+        current = dict(
+            db.session.execute(
+                select(
+                    RecordDependency.related_id, RecordDependency.related_revision
+                ).where(RecordDependency.record_id == record.id)
+            ).all()
+        )
+
+    removed = [related_id for related_id in current if related_id not in revisions]
+    for chunk in _chunks(removed):
+        db.session.execute(
+            delete(RecordDependency).where(
+                RecordDependency.record_id == record.id,
+                RecordDependency.related_id.in_(chunk),
+            ),
+            execution_options={"synchronize_session": False},
+        )
+
+    added = []
+    changed = []
+    for related_id, revision in revisions.items():
+        row = {
+            "record_id": record.id,
+            "related_id": related_id,
+            "related_revision": revision,
+        }
+        if related_id not in current:
+            added.append(row)
+        elif current[related_id] != revision:
+            changed.append(row)
+    if added:
+        db.session.execute(insert(RecordDependency), added)
+    if changed:
+        # Bulk update by primary key.
+        db.session.execute(update(RecordDependency), changed)
+
+
+def clear_dependencies(record_id):
+    """Remove the dependencies of a record."""
+    db.session.execute(
+        delete(RecordDependency).where(RecordDependency.record_id == record_id),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def iter_stale_records(related_record_cls, chunk_size=1000):
+    """Iterate over the records embedding outdated related records.
+
+    :param related_record_cls: The class of the related records.
+    :param chunk_size: Number of rows fetched at once from the database.
+    :returns: A generator of record IDs (each ID is returned once).
+    """
+    model_cls = related_record_cls.model_cls
+    query = (
+        select(RecordDependency.record_id)
+        .join(model_cls, model_cls.id == RecordDependency.related_id)
+        .where(RecordDependency.related_revision < model_cls.version_id - 1)
+        .distinct()
+        .execution_options(yield_per=chunk_size)
+    )
+    for record_id in db.session.scalars(query):
+        yield record_id
+
+
+def dumped_revisions(dump):
+    """Get the revisions of the related records embedded in a dump.
+
+    :param dump: The dump of a record (e.g. the source of a search document).
+    :returns: A dictionary mapping the IDs of the related records to the
+        revision read from their ``"@v"`` version counter.
+    """
+    revisions = {}
+    stack = [dump]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            version = value.get("@v")
+            if isinstance(version, str) and "::" in version:
+                related_id, revision = version.rsplit("::", 1)
+                revisions[related_id] = int(revision)
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return revisions
+
+
+def mark_current(related_record_cls, revisions):
+    """Mark the related records embedded in records as up to date.
+
+    Used once the records have been dumped again (e.g. reindexed). Only the
+    revisions embedded in the dumps are stored: if a related record was
+    updated after a record was dumped, the record stays stale.
+
+    :param related_record_cls: The class of the related records.
+    :param revisions: A dictionary mapping the IDs of the records to the
+        revisions of the related records embedded in their dumps (see
+        :func:`dumped_revisions`).
+    """
+    rows = [
+        {
+            "b_record_id": uuid.UUID(str(record_id)),
+            "b_related_id": uuid.UUID(str(related_id)),
+            "b_revision": revision,
+        }
+        for record_id, related in revisions.items()
+        for related_id, revision in related.items()
+    ]
+    if not rows:
+        return
+    model_cls = related_record_cls.model_cls
+    table = RecordDependency.__table__
+    db.session.execute(
+        update(table)
+        .where(
+            table.c.record_id == bindparam("b_record_id"),
+            table.c.related_id == bindparam("b_related_id"),
+            table.c.related_id.in_(select(model_cls.id)),
+            table.c.related_revision < bindparam("b_revision"),
+        )
+        .values(related_revision=bindparam("b_revision")),
+        rows,
+    )
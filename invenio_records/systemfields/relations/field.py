@@ -6,7 +6,8 @@
 from werkzeug.utils import cached_property
 
 from ..base import SystemField
-from .mapping import RelationsMapping
+from .dependencies import clear_dependencies, tracking_enabled, update_dependencies
+from .mapping import RelationsMapping, prefetch_many
 from .relations import RelationBase
 
 
@@ -57,6 +58,27 @@ class RelationsField(SystemField):
         self._set_cache(instance, obj)
         return obj
 
+    def dereference_many(self, records, fields=None):
+        """Dereference the relations of several records at once.
+
+        The IDs of the related records are collected across all records and
+        resolved once (e.g. with one query per related record class for
+        primary key relations), before dereferencing each record.
+
+        :param records: The records, whose class must have this field.
+        :param fields: The names of the relation fields to dereference
+            (defaults to all fields).
+        """
+        cache = {}
+        mappings = []
+        for record in records:
+            mapping = self.obj(record)
+            mapping.inject_cache(cache)
+            mappings.append(mapping)
+        prefetch_many(mappings, fields=fields, dereferenced=False)
+        for mapping in mappings:
+            mapping.dereference(fields=fields)
+
     #
     # Data descriptor
     #
@@ -81,6 +103,21 @@ class RelationsField(SystemField):
         self.obj(record).validate()
         self.obj(record).clean()
 
+    def post_create(self, record):
+        """Track the dependencies of a created record (if enabled)."""
+        if tracking_enabled():
+            update_dependencies(record, self.obj(record))
+
+    def post_commit(self, record):
+        """Track the dependencies of a committed record (if enabled)."""
+        if tracking_enabled():
+            update_dependencies(record, self.obj(record))
+
+    def post_delete(self, record, force=False):
+        """Remove the dependencies of a deleted record (if tracked)."""
+        if tracking_enabled():
+            clear_dependencies(record.id)
+
 
 class MultiRelationsField(RelationsField):
     """Relations field for connections to external entities.
@@ -10,11 +10,18 @@ class RelationsMapping:
     def __init__(self, record, fields):
         """Initialize the relations mapping."""
         # Needed because we overwrite __setattr__
-        cache = {}
         super().__setattr__("_record", record)
         super().__setattr__("_fields", fields)
+        self.inject_cache({})
+
+    def inject_cache(self, cache):
+        """Inject a cache shared by the relations.
+
+        A cache can be shared between the mappings of several records, e.g.
+        to resolve a related record only once when dumping a batch of records.
+        """
         super().__setattr__("_cache", cache)
-        for name, field in fields.items():
+        for name, field in self._fields.items():
             field.inject_cache(cache, name)
 
     def __getattr__(self, name):
@@ -47,13 +54,33 @@ class RelationsMapping:
         """Iterate over the relations fields."""
         return iter(self._fields)
 
+    def prefetch(self, fields=None, dereferenced=True):
+        """Resolve the related records of several relation fields at once.
+
+        The IDs of all fields are collected first, and each group of fields
+        sharing the same cache and related record class is resolved at once
+        (e.g. with one query for primary key relations).
+
+        :param fields: The names of the fields (defaults to all fields).
+        :param dereferenced: If ``False``, skip already dereferenced objects.
+        """
+        prefetch_many([self], fields=fields, dereferenced=dereferenced)
+
     def validate(self, fields=None):
         """Validates all relations in the record."""
+        # Existence is checked without resolving the related records, which
+        # are only needed to check values.
+        value_check_fields = [
+            name for name in fields or self if self._fields[name].value_check
+        ]
+        if value_check_fields:
+            self.prefetch(value_check_fields)
         for name in fields or self:
             getattr(self, name).validate()
 
     def dereference(self, fields=None):
         """Dereferences relation fields."""
+        self.prefetch(fields, dereferenced=False)
         for name in fields or self:
             getattr(self, name).dereference()
 
@@ -61,3 +88,26 @@ class RelationsMapping:
         """Clean dereferenced relation fields."""
         for name in fields or self:
             getattr(self, name).clean()
+
+
+def prefetch_many(mappings, fields=None, dereferenced=True):
+    """Resolve the related records of the relations of several records at once.
+
+    The mappings should share the same cache (see
+    :meth:`RelationsMapping.inject_cache`), otherwise the resolved records are
+    only cached for the last mapping.
+
+    :param mappings: The :class:`RelationsMapping` of each record.
+    :param fields: The names of the fields (defaults to all fields).
+    :param dereferenced: If ``False``, skip already dereferenced objects.
+    """
+    groups = {}
+    for mapping in mappings:
+        for name in fields or mapping:
+            field = mapping._fields[name]
+            group_key = (field._cache_key, getattr(field, "record_cls", None))
+            group = groups.setdefault(group_key, (field, []))
+            group[1].extend(getattr(mapping, name).ids(dereferenced=dereferenced))
+    for field, ids in groups.values():
+        if ids:
+            field.prefetch(ids)
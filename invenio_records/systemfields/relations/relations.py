@@ -3,15 +3,29 @@
 
 """Relations system field."""
 
-from copy import deepcopy
+import uuid
+from itertools import chain
 
 from invenio_db import db
+from sqlalchemy import select
+from sqlalchemy.orm.exc import NoResultFound
 
-from ...dictutils import dict_lookup, parse_lookup_key
+from ...dictutils import KeyPath, deepcopy_json, dict_lookup
+from .cache import current_related_records_cache
 from .errors import InvalidRelationValue
 from .results import RelationListResult, RelationNestedListResult, RelationResult
 
 
+def _normalize_id(id_):
+    """Normalize a record ID to the string of its UUID (``None`` if invalid)."""
+    if isinstance(id_, uuid.UUID):
+        return str(id_)
+    try:
+        return str(uuid.UUID(id_))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
 class RelationBase:
     """Base class for defining relation fields."""
 
@@ -36,6 +50,11 @@ class RelationBase:
         self._cache_key = cache_key
         self.value_check = value_check
         self._cache_ref = None
+        # Compile the keys once, as they are looked up for each record.
+        self._key_path = None
+        self._value_key_path = None
+        self._value_key_suffix_path = KeyPath(_value_key_suffix)
+        self._keys_paths = [KeyPath(k) for k in self.keys]
 
     def inject_cache(self, cache, default_key):
         """Internal method used by mapping to inject a shared cache."""
@@ -58,11 +77,43 @@ class RelationBase:
         """Resolve a relation by its ID (has to be implemented)."""
         raise NotImplementedError()
 
+    def prefetch(self, ids):
+        """Resolve several IDs at once and add the results to the cache.
+
+        Used before resolving the IDs one by one, so that relation types which
+        can resolve several IDs with one query avoid one query per ID. By
+        default, nothing is prefetched.
+        """
+
     @property
     def value_key(self):
         """Default stored value key getter."""
         return f"{self.key}.{self._value_key_suffix}"
 
+    @property
+    def key_path(self):
+        """Compiled :class:`~invenio_records.dictutils.KeyPath` of the key."""
+        key = self.key
+        path = self._key_path
+        if path is None or path.key != key:
+            path = self._key_path = KeyPath(key)
+        return path
+
+    @property
+    def value_key_path(self):
+        """Compiled :class:`~invenio_records.dictutils.KeyPath` of the value key."""
+        value_key = self.value_key
+        path = self._value_key_path
+        if path is None or path.key != value_key:
+            path = self._value_key_path = KeyPath(value_key)
+        return path
+
+    def keys_paths(self, keys):
+        """Get the compiled paths of keys to copy from the related records."""
+        if keys is self.keys:
+            return self._keys_paths
+        return [KeyPath(k) for k in keys]
+
     def exists(self, id_):
         """Default existence check by ID."""
         return self.resolve(id_) is not None
@@ -71,6 +122,10 @@ class RelationBase:
         """Default multiple existence check by a list of IDs."""
         return all(self.exists(i) for i in ids)
 
+    def missing(self, ids):
+        """Get the IDs from a list of IDs which do not exist."""
+        return [i for i in ids if not self.exists(i)]
+
     def get_value(self, record):
         """Return the resolved relation from a record."""
         return self.result_cls(self, record)
@@ -84,9 +139,9 @@ class RelationBase:
         store_value = self.parse_value(value)
         if self.exists(store_value):
             # TODO: stolen from `SystemField.set_dictkey`
-            keys = parse_lookup_key(self.value_key)
+            keys = self.value_key_path.keys
             try:
-                parent = dict_lookup(record, keys, parent=True)
+                parent = self.value_key_path.get(record, parent=True)
             except KeyError as e:
                 parent = record
                 for k in keys[:-1]:
@@ -112,9 +167,9 @@ class RelationBase:
 
     def clear_value(self, record):
         """Clear the relation value."""
-        keys = parse_lookup_key(self.value_key)
+        keys = self.value_key_path.keys
         try:
-            parent = dict_lookup(record, keys, parent=True)
+            parent = self.value_key_path.get(record, parent=True)
         except KeyError as e:
             parent = record
             for k in keys[:-1]:
@@ -123,7 +178,7 @@ class RelationBase:
                 parent = parent[k]
         parent.pop(keys[-1], None)
         if self._clear_empty and parent == {}:
-            parent = dict_lookup(record, keys[:-1], parent=True)
+            parent = self.value_key_path.parent.get(record, parent=True)
             parent.pop(keys[-2], None)
 
 
@@ -180,12 +235,12 @@ class ListRelation(RelationBase):
         store_values = self.parse_value(value)
         # Validate all values
         if self.exists_many(store_values):
-            keys = parse_lookup_key(self.value_key)
+            keys = self.value_key_path.keys
             store_key, rel_id_key = keys[-2:]
             parent = self._get_parent(record, keys)
 
             if self.relation_field:
-                values_list = deepcopy(value)
+                values_list = deepcopy_json(value)
                 for v in values_list:
                     sv = v.get(self.relation_field)
                     if sv:
@@ -199,9 +254,9 @@ class ListRelation(RelationBase):
 
     def clear_value(self, record):
         """Clear the relation value."""
-        keys = parse_lookup_key(self.key)
+        keys = self.key_path.keys
         try:
-            parent = dict_lookup(record, keys, parent=True)
+            parent = self.key_path.get(record, parent=True)
         except KeyError as e:
             parent = record
             for k in keys[:-1]:
@@ -210,7 +265,7 @@ class ListRelation(RelationBase):
                 parent = parent[k]
         parent.pop(keys[-1], None)
         if self._clear_empty and parent == []:
-            parent = dict_lookup(record, keys[:-1], parent=True)
+            parent = self.key_path.parent.get(record, parent=True)
             parent.pop(keys[-2], None)
 
 
@@ -223,10 +278,26 @@ class PKRelation(RelationBase):
         super().__init__(*args, **kwargs)
 
     def resolve(self, id_):
-        """Resolve the value using the record class."""
+        """Resolve the value using the record class.
+
+        If enabled, the process-wide related records cache is used (see
+        :mod:`invenio_records.systemfields.relations.cache`).
+        """
         if id_ in self.cache:
             return self.cache[id_]
 
+        key = _normalize_id(id_)
+        if key is None:
+            # Not a record ID (the query would fail).
+            return None
+
+        shared_cache = current_related_records_cache()
+        if shared_cache is not None:
+            obj = shared_cache.get(self.record_cls, key)
+            if obj is not None:
+                self.cache[id_] = obj
+                return obj
+
         try:
             obj = self.record_cls.get_record(id_)
             # We detach the related record model from the database session when
@@ -234,9 +305,10 @@ class PKRelation(RelationBase):
             # model, will execute a new select query after a db.session.commit.
             db.session.expunge(obj.model)
             self.cache[id_] = obj
+            if shared_cache is not None:
+                shared_cache.set(self.record_cls, key, obj)
             return obj
-        # TODO: there's many ways Record.get_record can fail...
-        except Exception:
+        except NoResultFound:
             return None
 
     def parse_value(self, value):
@@ -250,14 +322,111 @@ class PKRelation(RelationBase):
                 f'Invalid value. Expected "str" or "{self.record_cls}"'
             )
 
-    # TODO: We could have a more efficient "exists" via PK queries
-    # def exists(self, id_):
-    #     """Check if an ID exists using the record class."""
-    #     return bool(self.record_cls.model_cls.query.filter_by(id=id_))
-    #
-    # def exists_many(self, ids):
-    #     """."""
-    #     self.record_cls.get_record(id_)
+    prefetch_chunk_size = 500
+    """Maximum number of IDs fetched with one query."""
+
+    def prefetch(self, ids):
+        """Fetch the records not in the cache with one query per chunk of IDs.
+
+        IDs which are not valid UUIDs are skipped, and records which do not
+        exist are left to :meth:`resolve`. Database errors are not caught.
+        """
+        shared_cache = current_related_records_cache()
+        # Map the normalized UUIDs to the IDs used as cache keys.
+        missing = {}
+        for id_ in ids:
+            key = _normalize_id(id_)
+            if key is None or id_ in self.cache:
+                continue
+            if shared_cache is not None:
+                obj = shared_cache.get(self.record_cls, key)
+                if obj is not None:
+                    self.cache[id_] = obj
+                    continue
+            missing[key] = id_
+
+        keys = list(missing)
+        for i in range(0, len(keys), self.prefetch_chunk_size):
+            records = self.record_cls.get_records(
+                keys[i : i + self.prefetch_chunk_size]
+            )
+            for obj in records:
+                # See resolve() about detaching the model.
+                db.session.expunge(obj.model)
+                key = str(obj.id)
+                self.cache[missing[key]] = obj
+                if shared_cache is not None:
+                    shared_cache.set(self.record_cls, key, obj)
+
+    def exists(self, id_):
+        """Check if an ID exists without loading the related record."""
+        return not self._missing([id_])
+
+    def exists_many(self, ids):
+        """Check if all IDs exist with a single query."""
+        return not self._missing(ids)
+
+    def _overrides(self, method):
+        """Check if a method is overridden outside of this module."""
+        for cls in type(self).__mro__:
+            if method in vars(cls):
+                return cls.__module__ != __name__
+        return False
+
+    def missing(self, ids):
+        """Get the IDs from a list of IDs which do not exist.
+
+        Only the primary keys of the related records are queried (with one
+        query per chunk of IDs), so their JSON is not loaded. Records in the
+        cache are known to exist, and soft-deleted records do not exist.
+
+        If a subclass overrides :meth:`exists`, :meth:`exists_many` or
+        :meth:`resolve` (e.g. to filter the related records), the IDs are
+        checked with it instead.
+        """
+        if self._overrides("exists"):
+            return [id_ for id_ in ids if not self.exists(id_)]
+        if self._overrides("exists_many"):
+            # Nested list relations check lists of lists of IDs.
+            nested = isinstance(self, NestedListRelation)
+            if self.exists_many([ids] if nested else ids):
+                return []
+            return [
+                id_ for id_ in ids if not self.exists_many([[id_]] if nested else [id_])
+            ]
+        return self._missing(ids)
+
+    def _missing(self, ids):
+        """Get the IDs which do not exist, ignoring ``exists`` overrides."""
+        if self._overrides("resolve"):
+            return [id_ for id_ in ids if self.resolve(id_) is None]
+
+        missing = []
+        # Map the normalized UUIDs to the IDs to check.
+        to_check = {}
+        for id_ in ids:
+            key = _normalize_id(id_)
+            if key is None:
+                missing.append(id_)
+                continue
+            if id_ not in self.cache:
+                to_check.setdefault(key, []).append(id_)
+
+        model_cls = self.record_cls.model_cls
+        keys = list(to_check)
+        found = set()
+        for i in range(0, len(keys), self.prefetch_chunk_size):
+            query = select(model_cls.id).where(
+                model_cls.id.in_(keys[i : i + self.prefetch_chunk_size]),
+                model_cls.is_deleted != True,  # noqa
+            )
+            with db.session.no_autoflush:
+                found.update(str(id_) for id_ in db.session.scalars(query))
+
+        for key, key_ids in to_check.items():
+            if key not in found:
+                missing.extend(key_ids)
+        return missing
 
 
 class PKListRelation(ListRelation, PKRelation):
@@ -271,7 +440,7 @@ class NestedListRelation(ListRelation):
 
     def exists_many(self, ids):
         """Default multiple existence check by a list of IDs."""
-        return all(all(self.exists(i) for i in inner_ids) for inner_ids in ids)
+        return super().exists_many(list(chain.from_iterable(ids)))
 
     def parse_value(self, value):
         """Parse a record (or ID) to the ID to be stored."""
@@ -298,12 +467,12 @@ class NestedListRelation(ListRelation):
         store_values = self.parse_value(value)
         # Validate all values
         if self.exists_many(store_values):
-            keys = parse_lookup_key(self.value_key)
+            keys = self.value_key_path.keys
             store_key, rel_id_key = keys[-2:]
             parent = self._get_parent(record, keys)
 
             if self.relation_field:
-                values_list = deepcopy(value)
+                values_list = deepcopy_json(value)
                 for v in values_list:
                     inner_sv = v.get(self.relation_field)
                     if inner_sv:
@@ -5,7 +5,6 @@
 
 from itertools import chain
 
-from ...dictutils import dict_lookup, dict_set
 from .errors import InvalidCheckValue, InvalidRelationValue
 
 
@@ -18,10 +17,10 @@ class RelationResult:
         self.record = record
 
     def _lookup_id(self):
-        return dict_lookup(self.record, self.value_key)
+        return self.field.value_key_path.get(self.record)
 
     def _lookup_data(self):
-        return dict_lookup(self.record, self.key)
+        return self.field.key_path.get(self.record)
 
     def __call__(self, force=True):
         """Resolve the relation."""
@@ -62,6 +61,42 @@ class RelationResult:
                             f"{value} with record value {object[key]}."
                         )
 
+    def _iter_objects(self):
+        """Iterate over the related objects stored in the record."""
+        try:
+            data = self._lookup_data()
+        except KeyError:
+            return
+        if isinstance(data, dict) and self.field._value_key_suffix in data:
+            yield data
+
+    def ids(self, dereferenced=True):
+        """Get the IDs of the related records.
+
+        :param dereferenced: If ``False``, skip already dereferenced objects.
+        """
+        suffix = self.field._value_key_suffix
+        return [
+            v[suffix] for v in self._iter_objects() if dereferenced or "@v" not in v
+        ]
+
+    def _missing(self, ids):
+        """Get the IDs which do not exist.
+
+        Uses the ``exists()`` method of the result class if it defines one,
+        and otherwise a single ``missing()`` call of the field.
+        """
+        if getattr(type(self), "exists", None) is not None:
+            return [id_ for id_ in ids if not self.exists(id_)]
+        return self.field.missing(ids)
+
+    def prefetch(self, dereferenced=True):
+        """Resolve all related records at once (see ``RelationBase.prefetch``).
+
+        :param dereferenced: If ``False``, skip already dereferenced objects.
+        """
+        self.field.prefetch(self.ids(dereferenced=dereferenced))
+
     def validate(self):
         """Validate the field."""
         try:
@@ -107,11 +142,11 @@ class RelationResult:
             data.update({k: v for k, v in obj.items()})
         else:
             new_obj = {}
-            for k in keys:
+            for path in self.field.keys_paths(keys):
                 try:
-                    val = dict_lookup(obj, k)
+                    val = path.get(obj)
                     if val:
-                        dict_set(new_obj, k, val)
+                        path.set(new_obj, val)
                 except KeyError:
                     pass
             data.update(new_obj)
@@ -146,10 +181,10 @@ class RelationListResult(RelationResult):
             return None
 
     def _lookup_id(self, data):
-        return dict_lookup(data, self.field._value_key_suffix)
+        return self.field._value_key_suffix_path.get(data)
 
     def _lookup_data(self):
-        data = dict_lookup(self.record, self.key)
+        data = self.field.key_path.get(self.record)
         if self.relation_field:
             fields = self.relation_field.split(".")
             for field in fields:
@@ -169,9 +204,14 @@ class RelationListResult(RelationResult):
             if values and not isinstance(values, list):
                 raise InvalidRelationValue(f"Invalid value {values}, should be list.")
 
+            # Check existence with one query and only resolve the related
+            # records if their values are checked.
+            missing = self._missing(self.ids())
+            if self.value_check:
+                self.prefetch()
             for v in values:
                 relation_id = self._lookup_id(v)
-                if not self.exists(relation_id):
+                if relation_id in missing:
                     raise InvalidRelationValue(f"Invalid value {relation_id}.")
                 if self.value_check:
                     obj = self.resolve(v[self.field._value_key_suffix])
@@ -179,6 +219,17 @@ class RelationListResult(RelationResult):
         except KeyError:
             return None
 
+    def _iter_objects(self):
+        """Iterate over the related objects stored in the record."""
+        try:
+            values = self._lookup_data()
+        except KeyError:
+            return
+        if isinstance(values, list):
+            for v in values:
+                if isinstance(v, dict) and self.field._value_key_suffix in v:
+                    yield v
+
     def _apply_items(self, func, keys=None, attrs=None):
         """Iterate over the list of objects."""
         # The attributes we want to get from the related record.
@@ -210,6 +261,7 @@ class RelationListResult(RelationResult):
 
             [{"id": "eng", "title": ..., "@v": ...}]
         """
+        self.prefetch(dereferenced=False)
         return self._apply_items(self._dereference_one, keys, attrs)
 
     def clean(self, keys=None, attrs=None):
@@ -255,6 +307,9 @@ class RelationNestedListResult(RelationListResult):
             if values and not isinstance(values, list):
                 raise InvalidRelationValue(f"Invalid value {values}, should be list.")
 
+            missing = self._missing(self.ids())
+            if self.value_check:
+                self.prefetch()
             for outter_v in values:
                 if outter_v and not isinstance(outter_v, list):
                     raise InvalidRelationValue(
@@ -262,7 +317,7 @@ class RelationNestedListResult(RelationListResult):
                     )
                 for v in outter_v:
                     relation_id = self._lookup_id(v)
-                    if not self.exists(relation_id):
+                    if relation_id in missing:
                         raise InvalidRelationValue(f"Invalid value {relation_id}.")
                     if self.value_check:
                         obj = self.resolve(v[self.field._value_key_suffix])
@@ -270,6 +325,19 @@ class RelationNestedListResult(RelationListResult):
         except KeyError:
             return None
 
+    def _iter_objects(self):
+        """Iterate over the related objects stored in the record."""
+        try:
+            values = self._lookup_data()
+        except KeyError:
+            return
+        if isinstance(values, list):
+            for outter_v in values:
+                if isinstance(outter_v, list):
+                    for v in outter_v:
+                        if isinstance(v, dict) and self.field._value_key_suffix in v:
+                            yield v
+
     def _apply_items(self, func, keys=None, attrs=None):
         """Iterate over the list of objects."""
         # The attributes we want to get from the related record.
@@ -0,0 +1,373 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Celery tasks for the maintenance of records.
+
+The tasks process the records by batches, and commit the database session
+after each batch. The tasks processing all the records can be restricted to
+a range of IDs, and ``dispatch_records`` splits the records in ranges
+processed by parallel tasks.
+"""
+
+import uuid
+from datetime import datetime
+
+from celery import shared_task
+from flask import current_app
+from invenio_base.utils import obj_or_import_string
+from invenio_db import db
+from jsonschema.exceptions import ValidationError
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..api import Record, _chunked
+from ..models import RecordMetadata
+from ..revisions import prune_revisions as _prune_revisions
+from ..systemfields.relations.cache import current_related_records_cache
+
+
+def _report_progress(task, meta):
+    """Report the progress of a task (if it runs in a worker)."""
+    if task.request.id and not task.request.is_eager:
+        task.update_state(state="PROGRESS", meta=meta)
+
+
+def _id_range(model_cls, start_id, end_id):
+    """Filter the models with an ID in ``[start_id, end_id)``."""
+    clauses = []
+    if start_id is not None:
+        clauses.append(model_cls.id >= uuid.UUID(str(start_id)))
+    if end_id is not None:
+        clauses.append(model_cls.id < uuid.UUID(str(end_id)))
+    return and_(*clauses) if clauses else None
+
+
+def _record_batches(
+    record_cls, batch_size, with_deleted=False, start_id=None, end_id=None
+):
+    """Iterate over the records of a range of IDs by batches.
+
+    The IDs are paginated with a keyset (i.e. ``WHERE id > <last ID>``).
+    Unlike :meth:`~invenio_records.api.Record.iter_records`, the models are
+    not expunged from the session, so that they can be modified and
+    committed.
+    """
+    model_cls = record_cls.model_cls
+    query = select(model_cls.id).order_by(model_cls.id).limit(batch_size)
+    id_range = _id_range(model_cls, start_id, end_id)
+    if id_range is not None:
+        query = query.where(id_range)
+    if not with_deleted:
+        query = query.where(model_cls.is_deleted != True)  # noqa
+
+    last_id = None
+    while True:
+        batch_query = query
+        if last_id is not None:
+            batch_query = query.where(model_cls.id > last_id)
+        ids = db.session.scalars(batch_query).all()
+        if not ids:
+            return
+        last_id = ids[-1]
+        yield record_cls.get_records(ids, with_deleted=True)
+
+
+def _ids_batches(record_cls, ids, batch_size, with_deleted):
+    """Iterate over the records of a list of IDs by batches."""
+    for chunk in _chunked(dict.fromkeys(ids), batch_size):
+        yield len(chunk), record_cls.get_records(chunk, with_deleted=with_deleted)
+
+
+@shared_task(bind=True)
+def prune_revisions(
+    self,
+    model_cls=None,
+    keep_last=10,
+    keep_daily=False,
+    before=None,
+    record_ids=None,
+    batch_size=100,
+):
+    """Prune the old revisions of records.
+
+    See :func:`invenio_records.revisions.prune_revisions`.
+
+    :param model_cls: Import path of the records model class (defaults to
+        :class:`~invenio_records.models.RecordMetadata`).
+    :param keep_last: Number of latest revisions of each record to keep.
+    :param keep_daily: If ``True``, keep the latest revision of each day.
+    :param before: If set, only prune revisions updated before this date
+        (ISO 8601 string).
+    :param record_ids: IDs of the records to prune (defaults to all).
+    :param batch_size: Number of records per batch (and commit).
+    :returns: The total number of ``records`` pruned, of ``rows`` deleted
+        and of ``bytes`` of JSON reclaimed.
+    """
+    model_cls = obj_or_import_string(model_cls, default=RecordMetadata)
+    if isinstance(before, str):
+        before = datetime.fromisoformat(before)
+
+    totals = {"records": 0, "rows": 0, "bytes": 0}
+    for stats in _prune_revisions(
+        model_cls=model_cls,
+        keep_last=keep_last,
+        keep_daily=keep_daily,
+        before=before,
+        record_ids=record_ids,
+        batch_size=batch_size,
+    ):
+        db.session.commit()
+        for key, value in stats.items():
+            totals[key] += value
+        _report_progress(self, totals)
+
+    current_app.logger.info("Pruned revisions: %s", totals)
+    return totals
+
+
+@shared_task(bind=True)
+def revalidate_records(
+    self,
+    record_cls=None,
+    batch_size=100,
+    start_id=None,
+    end_id=None,
+    max_invalid_ids=100,
+):
+    """Validate all the records against their current JSONSchema.
+
+    Useful after schemas were changed, to find the records which must be
+    migrated. The records are not modified. The ID of each invalid record is
+    logged. The records which cannot be validated (e.g. because of an
+    unknown schema or an unresolvable reference) are counted as invalid.
+
+    :param record_cls: Import path of the record class (defaults to
+        :class:`~invenio_records.api.Record`).
+    :param batch_size: Number of records per batch.
+    :param start_id: If set, only validate the records with an ID greater
+        than or equal to it.
+    :param end_id: If set, only validate the records with an ID less than it.
+    :param max_invalid_ids: Maximum number of IDs of invalid records
+        returned.
+    :returns: The number of ``records`` validated, the number of
+        ``invalid`` records, and the ``invalid_ids`` of the first of them.
+    """
+    record_cls = obj_or_import_string(record_cls, default=Record)
+
+    totals = {"records": 0, "invalid": 0, "invalid_ids": []}
+    batches = _record_batches(record_cls, batch_size, start_id=start_id, end_id=end_id)
+    for batch in batches:
+        for record in batch:
+            try:
+                record.validate()
+            except ValidationError as e:
+                current_app.logger.warning(
+                    "Invalid record %s: %s", record.id, e.message
+                )
+            except SQLAlchemyError:
+                raise
+            except Exception:
+                # E.g. an unknown schema or an unresolvable reference, which
+                # must not stop the validation of the other records.
+                current_app.logger.warning(
+                    "Could not validate record %s", record.id, exc_info=True
+                )
+            else:
+                continue
+            totals["invalid"] += 1
+            if len(totals["invalid_ids"]) < max_invalid_ids:
+                totals["invalid_ids"].append(str(record.id))
+        totals["records"] += len(batch)
+        # Nothing to commit, but do not keep the transaction open.
+        db.session.rollback()
+        _report_progress(
+            self, {"records": totals["records"], "invalid": totals["invalid"]}
+        )
+
+    current_app.logger.info(
+        "Revalidated %s records (%s invalid)", totals["records"], totals["invalid"]
+    )
+    return totals
+
+
+@shared_task(bind=True)
+def reencode_records(
+    self,
+    record_cls=None,
+    batch_size=100,
+    with_deleted=False,
+    start_id=None,
+    end_id=None,
+):
+    """Encode again the JSON documents of all the records.
+
+    Useful after the encoder of the records model was changed: the stored
+    documents are decoded and encoded again with the current encoder. Only
+    the documents which change are updated (which creates a new revision),
+    the records are neither validated nor passed to the extensions, and no
+    signals are sent. The updated records are removed from the related
+    records cache.
+
+    :param record_cls: Import path of the record class (defaults to
+        :class:`~invenio_records.api.Record`).
+    :param batch_size: Number of records per batch (and commit).
+    :param with_deleted: If ``True``, also re-encode the soft-deleted
+        records.
+    :param start_id: If set, only re-encode the records with an ID greater
+        than or equal to it.
+    :param end_id: If set, only re-encode the records with an ID less than
+        it.
+    :returns: The number of ``records`` processed and of records
+        ``updated``.
+    """
+    record_cls = obj_or_import_string(record_cls, default=Record)
+
+    totals = {"records": 0, "updated": 0}
+    batches = _record_batches(
+        record_cls,
+        batch_size,
+        with_deleted=with_deleted,
+        start_id=start_id,
+        end_id=end_id,
+    )
+    for batch in batches:
+        updated = []
+        for record in batch:
+            model = record.model
+            if model.json is None:
+                continue
+            encoded = model.encode(model.data)
+            if encoded != model.json:
+                model.json = encoded
+                updated.append(model)
+        db.session.flush()
+        # Read before the commit expires the models.
+        revisions = [(str(model.id), model.version_id - 1) for model in updated]
+        db.session.commit()
+
+        # No signals are sent, so the cache must be invalidated here.
+        cache = current_related_records_cache()
+        if cache is not None:
+            for id_, revision_id in revisions:
+                cache.invalidate(id_, revision_id=revision_id)
+        totals["records"] += len(batch)
+        totals["updated"] += len(updated)
+        _report_progress(self, totals)
+
+    current_app.logger.info("Re-encoded records: %s", totals)
+    return totals
+
+
+@shared_task(bind=True)
+def dispatch_records(self, task, record_cls=None, chunk_size=10000, **kwargs):
+    """Process all the records with parallel tasks.
+
+    The records are split in ranges of at most ``chunk_size`` IDs, and a
+    task is sent for each range (with its ``start_id`` and ``end_id``), so
+    that several workers share the work:
+
+    .. code-block:: python
+
+        dispatch_records.delay("reencode_records", chunk_size=5000)
+
+    :param task: Name of the task (``"revalidate_records"`` or
+        ``"reencode_records"``).
+    :param record_cls: Import path of the record class (defaults to
+        :class:`~invenio_records.api.Record`).
+    :param chunk_size: Maximum number of records per task.
+    :param kwargs: Other arguments of the task (e.g. ``batch_size``).
+    :returns: The IDs of the sent ``tasks``.
+    """
+    range_tasks = {
+        "revalidate_records": revalidate_records,
+        "reencode_records": reencode_records,
+    }
+    if task not in range_tasks:
+        raise ValueError(f"Unknown task: {task}")
+    model_cls = obj_or_import_string(record_cls, default=Record).model_cls
+
+    # The first IDs of the ranges (but the first one) are the IDs at the
+    # positions ``chunk_size``, ``2 * chunk_size``, ... in the ID order.
+    position = func.row_number().over(order_by=model_cls.id) - 1
+    numbered = select(model_cls.id, position.label("position")).subquery()
+    boundaries = db.session.scalars(
+        select(numbered.c.id)
+        .where(numbered.c.position > 0, numbered.c.position % chunk_size == 0)
+        .order_by(numbered.c.id)
+    ).all()
+    db.session.rollback()
+    ranges = zip([None] + boundaries, boundaries + [None])
+
+    task_ids = []
+    for start_id, end_id in ranges:
+        result = range_tasks[task].delay(
+            record_cls=record_cls,
+            start_id=start_id and str(start_id),
+            end_id=end_id and str(end_id),
+            **kwargs,
+        )
+        task_ids.append(result.id)
+
+    current_app.logger.info("Dispatched %s %s tasks", len(task_ids), task)
+    return {"tasks": task_ids}
+
+
+@shared_task(bind=True)
+def delete_records(self, ids, record_cls=None, force=False, batch_size=100):
+    """Delete records by ID.
+
+    See :meth:`invenio_records.api.Record.delete`.
+
+    :param ids: List of record IDs. Unknown (and, unless ``force`` is set,
+        already deleted) records are skipped.
+    :param record_cls: Import path of the record class (defaults to
+        :class:`~invenio_records.api.Record`).
+    :param force: If ``True``, hard-delete the records (including the
+        soft-deleted ones).
+    :param batch_size: Number of records per batch (and commit).
+    :returns: The number of IDs ``processed`` and of records ``deleted``.
+    """
+    record_cls = obj_or_import_string(record_cls, default=Record)
+
+    totals = {"processed": 0, "deleted": 0}
+    for count, records in _ids_batches(record_cls, ids, batch_size, force):
+        for record in records:
+            record.delete(force=force)
+        db.session.commit()
+        totals["processed"] += count
+        totals["deleted"] += len(records)
+        _report_progress(self, totals)
+
+    current_app.logger.info("Deleted records: %s", totals)
+    return totals
+
+
+@shared_task(bind=True)
+def undelete_records(self, ids, record_cls=None, batch_size=100):
+    """Undelete soft-deleted records by ID.
+
+    See :meth:`invenio_records.api.Record.undelete`.
+
+    :param ids: List of record IDs. Unknown and not deleted records are
+        skipped.
+    :param record_cls: Import path of the record class (defaults to
+        :class:`~invenio_records.api.Record`).
+    :param batch_size: Number of records per batch (and commit).
+    :returns: The number of IDs ``processed`` and of records ``undeleted``.
+    """
+    record_cls = obj_or_import_string(record_cls, default=Record)
+
+    totals = {"processed": 0, "undeleted": 0}
+    for count, records in _ids_batches(record_cls, ids, batch_size, True):
+        for record in records:
+            if not record.is_deleted:
+                continue
+            record.undelete()
+            record.commit()
+            totals["undeleted"] += 1
+        db.session.commit()
+        totals["processed"] += count
+        _report_progress(self, totals)
+
+    current_app.logger.info("Undeleted records: %s", totals)
+    return totals
@@ -4,6 +4,9 @@
 
 """Record validators."""
 
+import threading
+from collections import OrderedDict
+
 from jsonschema.validators import Draft4Validator, extend, validator_for
 
 PartialDraft4Validator = extend(Draft4Validator, {"required": lambda *args: None})
@@ -56,3 +59,113 @@ def _create_validator(schema, base_validator_cls=None, custom_checks=None):
         )
 
     return validator_cls
+
+
+class JSONSchemaBackend:
+    """Validation backend using the validator classes of ``jsonschema``."""
+
+    def build(self, schema, validator_cls, resolver, **kwargs):
+        """Build a validator for the schema.
+
+        :param schema: The schema to validate against.
+        :param validator_cls: The :class:`jsonschema.protocols.Validator`
+            class to use.
+        :param resolver: The ref resolver.
+        :param kwargs: Other arguments for the validator (e.g. the
+            ``format_checker``).
+        :returns: An object providing ``iter_errors()``.
+        """
+        return validator_cls(schema, resolver=resolver, **kwargs)
+
+
+class ValidatorCache:
+    """Bounded cache of ready-to-use validator instances.
+
+    A validator instance holds a ref resolver which keeps a stack of
+    resolution scopes while validating, thus an instance cannot be shared
+    between threads. The cache therefore keeps a separate LRU mapping per
+    thread, while the hit/miss counters and the invalidation state are shared.
+
+    Keys are tuples whose first item is the schema URL, which allows
+    invalidating all validators built for a given schema.
+    """
+
+    def __init__(self, maxsize=128):
+        """Initialize the cache.
+
+        :param maxsize: Maximum number of validators kept per thread. A value
+            of ``0`` disables the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0
+        self._schema_generations = {}
+
+    def _entries(self):
+        """Get the entries of the current thread."""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.entries = OrderedDict()
+            local.generation = self._generation
+        return local.entries
+
+    def _count(self, hit):
+        """Update the hit/miss counters."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key, factory):
+        """Get a validator from the cache or build it.
+
+        :param key: A hashable tuple starting with the schema URL.
+        :param factory: Callable building the validator on a cache miss.
+        """
+        if not self.maxsize:
+            self._count(False)
+            return factory()
+
+        entries = self._entries()
+        schema_generation = self._schema_generations.get(key[0], 0)
+        entry = entries.get(key)
+        if entry is not None and entry[1] == schema_generation:
+            entries.move_to_end(key)
+            self._count(True)
+            return entry[0]
+
+        self._count(False)
+        validator = factory()
+        entries[key] = (validator, schema_generation)
+        entries.move_to_end(key)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return validator
+
+    def invalidate(self, schema=None):
+        """Invalidate cached validators in all threads.
+
+        :param schema: Only invalidate the validators of this schema URL. If
+            not given, the whole cache is invalidated.
+        """
+        with self._lock:
+            if schema is None:
+                self._generation += 1
+                self._schema_generations.clear()
+            else:
+                self._schema_generations[schema] = (
+                    self._schema_generations.get(schema, 0) + 1
+                )
+
+    def info(self):
+        """Get the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._entries()),
+        }
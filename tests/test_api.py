@@ -5,6 +5,7 @@
 """Test Invenio Records API."""
 
 import copy
+import os
 import uuid
 from datetime import datetime, timedelta, timezone
 
@@ -13,10 +14,19 @@ from jsonresolver import JSONResolver
 from jsonresolver.contrib.jsonref import json_loader_factory
 from jsonschema import FormatChecker
 from jsonschema.exceptions import ValidationError
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
 from sqlalchemy.orm.exc import NoResultFound
+from sqlalchemy_continuum import version_class
 
 from invenio_records import Record
-from invenio_records.errors import MissingModelError
+from invenio_records.errors import (
+    MissingModelError,
+    ReadOnlyRecordError,
+    StaleRecordsError,
+)
+from invenio_records.models import RecordMetadata
+from invenio_records.revisions import is_delta, listen_delta, store_delta
 from invenio_records.validators import PartialDraft4Validator
 
 
@@ -49,6 +59,208 @@ def test_get_records(testapp, db):
     assert len(Record.get_records(test_ids, with_deleted=True)) == 3
 
 
+def test_get_records_ordered(testapp, db):
+    """Test fetching records aligned with the list of IDs."""
+    records = [Record.create({"title": f"test{i}"}) for i in range(5)]
+    db.session.commit()
+    records[1].delete()
+    db.session.commit()
+    unknown_id = uuid.uuid4()
+
+    ids = [
+        records[4].id,
+        unknown_id,
+        str(records[0].id),
+        records[1].id,
+        records[2].id,
+        records[4].id,
+        records[3].id,
+    ]
+    result = Record.get_records(ids, ordered=True, chunk_size=2)
+    assert [r.id if r else None for r in result] == [
+        records[4].id,
+        None,
+        records[0].id,
+        None,
+        records[2].id,
+        records[4].id,
+        records[3].id,
+    ]
+    assert result[0] is result[5]
+
+    result = Record.get_records(iter(ids), ordered=True, with_deleted=True)
+    assert result[3].id == records[1].id and result[1] is None
+
+    result = Record.get_records(ids, ordered=True, fields=["title"], chunk_size=3)
+    assert [r["title"] if r else None for r in result] == [
+        "test4",
+        None,
+        "test0",
+        None,
+        "test2",
+        "test4",
+        "test3",
+    ]
+
+    # Unordered chunked queries skip the missing IDs.
+    result = Record.get_records(ids, chunk_size=1)
+    assert sorted(r.id for r in result) == sorted(records[i].id for i in (0, 2, 3, 4))
+
+    # Invalid IDs are handled like missing IDs in both modes.
+    ids = ["invalid", str(records[0].id), None, records[0].id, 42]
+    result = Record.get_records(ids, ordered=True, fields=["title"])
+    assert [r.id if r else None for r in result] == [
+        None,
+        records[0].id,
+        None,
+        records[0].id,
+        None,
+    ]
+    assert result[1] is result[3]
+    result = Record.get_records(ids, chunk_size=1)
+    assert [r.id for r in result] == [records[0].id]
+
+
+def test_get_records_fields(testapp, db):
+    """Test fetching records with a projection of their JSON documents."""
+    records = [
+        Record.create(
+            {
+                "title": f"Title {i}",
+                "metadata": {"date": "2020", "languages": ["en"], "null": None},
+                "other": i,
+            }
+        )
+        for i in range(3)
+    ]
+    db.session.commit()
+    ids = [r.id for r in records]
+    records[2].delete()
+    db.session.commit()
+
+    fields = ["title", "metadata.languages", "metadata.null", "metadata.x", "x.y"]
+    partial = Record.get_records(ids, fields=fields)
+    assert {r.id for r in partial} == set(ids[:2])
+    for record in partial:
+        original = records[ids.index(record.id)]
+        assert record == {
+            "title": original["title"],
+            "metadata": {"languages": ["en"], "null": None},
+        }
+        assert record.revision_id == original.revision_id
+        assert record.created == original.created
+        assert record.updated == original.updated
+        assert not record.is_deleted
+
+    # A field includes its nested fields.
+    partial = Record.get_records(ids[:1], fields=["metadata.date", "metadata"])
+    assert partial[0] == {"metadata": records[0]["metadata"]}
+    partial = Record.get_records(ids[:1], fields=[])
+    assert partial[0] == {} and partial[0].id == ids[0]
+
+    # List items are loaded under their index as a string key (not as a list),
+    # like the keys of dictionaries, on all databases.
+    fields = ["metadata.languages.0", "metadata.languages.1", "title.0"]
+    partial = Record.get_records(ids[:1], fields=fields)
+    assert partial[0] == {"metadata": {"languages": {"0": "en"}}}
+    assert not isinstance(partial[0]["metadata"]["languages"], list)
+
+    # Deleted records
+    partial = Record.get_records(ids, fields=["title"], with_deleted=True)
+    assert len(partial) == 3
+    deleted = [r for r in partial if r.id == ids[2]][0]
+    assert deleted.is_deleted and deleted == {}
+
+    # The JSON of deleted records is not decoded.
+    class TitleEncoder:
+        def encode(self, data):
+            return data
+
+        def decode(self, data):
+            data["title"] = data["title"].upper()
+            return data
+
+    Record.model_cls.encoder = TitleEncoder()
+    try:
+        partial = Record.get_records(ids, fields=["title"], with_deleted=True)
+    finally:
+        Record.model_cls.encoder = None
+    assert {r.id: r for r in partial}[ids[0]] == {"title": "TITLE 0"}
+    assert {r.id: r for r in partial}[ids[2]] == {}
+
+    # The records are read-only.
+    record = [r for r in partial if r.id == ids[0]][0]
+    record["title"] = "New title"
+    pytest.raises(ReadOnlyRecordError, record.commit)
+    pytest.raises(ReadOnlyRecordError, record.delete)
+    pytest.raises(ReadOnlyRecordError, Record.commit_many, [record])
+    pytest.raises(MissingModelError, lambda: record.revisions)
+    db.session.commit()
+
+
+@pytest.mark.skipif(
+    not os.environ.get("SQLALCHEMY_DATABASE_URI", "").startswith("postgresql"),
+    reason="The fields are extracted by the database only on PostgreSQL.",
+)
+def test_get_records_fields_postgresql(testapp, db):
+    """Test that PostgreSQL extracts the same fields as the other databases."""
+    data = {
+        "title": "Title",
+        "metadata": {"titles": [{"title": "A"}, {"title": "B"}], "null": None},
+    }
+    record = Record.create(data)
+    db.session.commit()
+
+    fields = [
+        "title",
+        "metadata.titles.1.title",
+        "metadata.titles.2",
+        "metadata.null",
+        "metadata.null.x",
+        "title.x",
+    ]
+    (partial,) = Record.get_records([record.id], fields=fields)
+    assert partial == {
+        "title": "Title",
+        "metadata": {"titles": {"1": {"title": "B"}}, "null": None},
+    }
+    assert Record.get_record(record.id)["title"] != "New title"
+
+
+def test_iter_records(testapp, db):
+    """Test iterating over all records by batches."""
+    records = [Record.create({"title": f"Title {i}", "i": i}) for i in range(7)]
+    db.session.commit()
+    records[3].delete()
+    db.session.commit()
+    ids = sorted(r.id for r in records)
+    deleted_id = records[3].id
+    db.session.expunge_all()
+
+    # Other tests may have left records in the table.
+    filter = Record.model_cls.id.in_(ids)
+    it = Record.iter_records(filter=filter, batch_size=3)
+    assert not isinstance(it, list)
+    result = list(it)
+    assert [r.id for r in result] == [id_ for id_ in ids if id_ != deleted_id]
+    assert all(r["title"] == f"Title {r['i']}" for r in result)
+    # The models are not kept in the session.
+    assert not any(r.model in db.session for r in result)
+
+    result = Record.iter_records(filter=filter, batch_size=2, with_deleted=True)
+    assert [r.id for r in result] == ids
+    assert [r.id for r in Record.iter_records(filter=filter, batch_size=6)] == [
+        id_ for id_ in ids if id_ != deleted_id
+    ]
+
+    # Records can be modified during the iteration.
+    for record in Record.iter_records(filter=filter, batch_size=2):
+        record["title"] = "New title"
+        record.commit()
+    db.session.commit()
+    assert all(r["title"] == "New title" for r in Record.iter_records(filter=filter))
+
+
 def test_revision_id_created_updated_properties(testapp, db):
     """Test properties."""
     record = Record.create({"title": "test"})
@@ -479,6 +691,122 @@ def test_reversed_works_for_revisions(testapp, database):
     reversed_revisions[2].revision_id == 0
 
 
+def test_revisions_reversed_and_negative_index(testapp, database):
+    """Test reverse iteration and negative indexes of revisions."""
+    db = database
+    record = Record.create({"title": "test 0"})
+    db.session.commit()
+    for i in range(1, 5):
+        record["title"] = f"test {i}"
+        record.commit()
+        db.session.commit()
+
+    revisions = record.revisions
+    expected = [r.revision_id for r in revisions]
+    assert expected == [0, 1, 2, 3, 4]
+
+    revisions.batch_size = 2
+    reversed_revisions = list(reversed(revisions))
+    assert [r.revision_id for r in reversed_revisions] == expected[::-1]
+    assert [r["title"] for r in reversed_revisions][:2] == ["test 4", "test 3"]
+
+    assert revisions[-1].revision_id == 4
+    assert revisions[-2]["title"] == "test 3"
+    assert revisions[-5].revision_id == 0
+    with pytest.raises(IndexError):
+        revisions[-6]
+    assert -5 in revisions and -6 not in revisions
+
+
+def test_revisions_page(testapp, database):
+    """Test paginated revisions."""
+    db = database
+    record = Record.create({"title": "test 0"})
+    db.session.commit()
+    for i in range(1, 5):
+        record["title"] = f"test {i}"
+        record.commit()
+        db.session.commit()
+
+    page = record.revisions.page(size=2)
+    assert [r.revision_id for r in page] == [0, 1]
+    assert page[0].created is not None and page[1].updated >= page[0].updated
+    # The JSON documents are not loaded until needed.
+    assert page[1]._revision is None
+    assert page[1].revision["title"] == "test 1"
+    assert page[1].revision.revision_id == 1
+    assert page[1].revision is page[1].revision
+
+    pages = [page]
+    while page:
+        page = record.revisions.page(after=page[-1].transaction_id, size=2)
+        pages.append(page)
+    assert [[r.revision_id for r in p] for p in pages] == [[0, 1], [2, 3], [4], []]
+    assert pages[2][0].revision == record
+
+
+def test_revisions_delta(testapp, database):
+    """Test storing the revisions as patches against snapshots."""
+    db = database
+    testapp.config["RECORDS_REVISIONS_DELTA"] = True
+    testapp.config["RECORDS_REVISIONS_SNAPSHOT_INTERVAL"] = 3
+    # Done by the extension if enabled when the application is initialized.
+    listen_delta()
+    # Only the version classes of the records models are listened to.
+    assert event.contains(version_class(RecordMetadata), "before_update", store_delta)
+    assert not event.contains(Mapper, "before_update", store_delta)
+    try:
+        data = {"title": "test 0", "description": "x" * 1000}
+        record = Record.create(data)
+        db.session.commit()
+        for i in range(1, 7):
+            record["title"] = f"test {i}"
+            if i == 5:
+                # A large change is stored as a snapshot.
+                record["description"] = "y" * 1000
+            record.commit()
+            db.session.commit()
+        record.delete()
+        db.session.commit()
+        record = Record.get_record(record.id, with_deleted=True)
+        record.undelete()
+        record.commit()
+        db.session.commit()
+    finally:
+        testapp.config["RECORDS_REVISIONS_DELTA"] = False
+        testapp.config["RECORDS_REVISIONS_SNAPSHOT_INTERVAL"] = 10
+
+    stored = [v.json for v in record.model.versions]
+    assert [is_delta(json) for json in stored] == [
+        False,  # first revision
+        True,
+        True,
+        False,  # snapshot interval
+        True,
+        False,  # large change
+        True,
+        False,  # deleted
+        False,  # following a deletion
+    ]
+    assert stored[2]["$delta"]["snapshot"] == record.model.versions[0].transaction_id
+
+    revisions = list(record.revisions)
+    assert [r.get("title") for r in revisions] == [
+        *[f"test {i}" for i in range(7)],
+        None,
+        None,
+    ]
+    assert revisions[4]["description"] == "x" * 1000
+    assert revisions[6]["description"] == "y" * 1000
+    assert record.revisions[2] == revisions[2]
+
+    # Reverting to a revision stored as a patch restores the full document.
+    record = record.revert(2)
+    db.session.commit()
+    assert record == {"title": "test 2", "description": "x" * 1000}
+    assert not is_delta(list(record.model.versions)[-1].json)
+
+
 def test_clear_none(testapp, db):
     """Test clear_none."""
     record = Record({"a": None})
@@ -509,3 +837,73 @@ def test_undelete_with_get(testapp, db):
     record.commit()
     db.session.commit()
     assert record == {}
+
+
+def test_create_many(testapp, db):
+    """Test bulk record creation."""
+    data = [{"title": f"test {i}"} for i in range(5)]
+    records = Record.create_many(data, chunk_size=2)
+    db.session.commit()
+
+    assert [r["title"] for r in records] == [d["title"] for d in data]
+    assert all(r.revision_id == 0 for r in records)
+    assert len(Record.get_records([r.id for r in records])) == 5
+    assert len(records[0].revisions) == 1
+
+
+def test_create_many_errors(testapp, db):
+    """Test bulk record creation with invalid records."""
+    schema = {"properties": {"title": {"type": "string"}}}
+    data = [
+        {"title": "valid", "$schema": schema},
+        {"title": 1, "$schema": schema},
+        {"title": "valid too", "$schema": schema},
+    ]
+    with pytest.raises(ValidationError):
+        Record.create_many(data)
+
+    records, errors = Record.create_many(data, return_errors=True)
+    db.session.commit()
+    assert [r["title"] for r in records] == ["valid", "valid too"]
+    assert len(errors) == 1
+    assert errors[0][0] == 1
+    assert isinstance(errors[0][1], ValidationError)
+
+
+def test_commit_many(testapp, db):
+    """Test bulk record commit."""
+    records = Record.create_many([{"title": f"test {i}"} for i in range(5)])
+    db.session.commit()
+
+    for record in records:
+        record["title"] += " updated"
+    Record.commit_many(records, chunk_size=2)
+    db.session.commit()
+
+    assert all(r.revision_id == 1 for r in records)
+    for record in Record.get_records([r.id for r in records]):
+        assert record["title"].endswith(" updated")
+
+
+def test_commit_many_stale(testapp, db):
+    """Test bulk record commit with concurrently modified records."""
+    records = Record.create_many([{"title": f"test {i}"} for i in range(3)])
+    db.session.commit()
+
+    # Simulate a concurrent transaction updating the second record.
+    db.session.execute(
+        Record.model_cls.__table__.update()
+        .where(Record.model_cls.id == records[1].id)
+        .values(version_id=Record.model_cls.version_id + 1)
+    )
+
+    for record in records:
+        record["title"] += " updated"
+    with pytest.raises(StaleRecordsError) as exc_info:
+        Record.commit_many(records)
+    assert exc_info.value.records == [records[1]]
+    db.session.rollback()
+
+    records[0].delete()
+    db.session.commit()
+    pytest.raises(MissingModelError, Record.commit_many, records)
@@ -139,6 +139,53 @@ def test_esdumper_sa_datatypes(testapp, database):
     assert SearchDumper._sa_type(TypeModel, "invalid") is None
 
 
+def test_esdumper_plan(testapp, db, example_data):
+    """Test the model fields dump plan is computed once per record class."""
+    dumper = SearchDumper(model_fields={"version_id": ("revision", None)})
+    record = Record.create(example_data)
+    db.session.commit()
+
+    plan = dumper._plan(Record)
+    assert ("version_id", "revision", int) in plan
+    assert ("id", "uuid", UUID) in plan
+
+    dump = record.dumps(dumper=dumper)
+    assert dumper._plan(Record) is plan
+    assert dump["revision"] == record.revision_id + 1
+    assert dump["uuid"] == str(record.id)
+
+    loaded_record = Record.loads(dump, loader=dumper)
+    assert loaded_record.model.version_id == record.model.version_id
+    assert loaded_record.id == record.id
+
+
+def test_esdumper_model_field_hooks(testapp, db, example_data):
+    """Test subclasses overriding the model field helpers are called."""
+
+    class CustomDumper(SearchDumper):
+        def _dump_model_field(self, record, model_field_name, dump, *args):
+            super()._dump_model_field(record, model_field_name, dump, *args)
+            dump.setdefault("dumped", []).append(model_field_name)
+
+        def _load_model_field(self, record_cls, model_field_name, *args):
+            self.loaded.append(model_field_name)
+            return super()._load_model_field(record_cls, model_field_name, *args)
+
+    dumper = CustomDumper()
+    dumper.loaded = []
+    record = Record.create(example_data)
+    db.session.commit()
+
+    dump = record.dumps(dumper=dumper)
+    fields = ["id", "version_id", "created", "updated"]
+    assert dump.pop("dumped") == fields
+    assert dump["uuid"] == str(record.id)
+
+    loaded_record = Record.loads(dump, loader=dumper)
+    assert dumper.loaded == fields
+    assert loaded_record.model.version_id == record.model.version_id
+
+
 def test_relations_dumper(testapp, db, example_data):
     """Test relations dumper extension."""
 
@@ -246,3 +293,82 @@ def test_indexedtime_dumper(testapp, db, example_data):
     # load it
     new_record = RecordWithIndexedTime.loads(dump)
     assert "indexed_at" not in new_record
+
+
+def test_esdumper_dump_many(testapp, db, example_data):
+    """Test dumping and loading a batch of records."""
+
+    class BatchRecord(Record):
+        relations = RelationsField(
+            language=PKRelation(key="language", keys=["iso"], record_cls=Record),
+        )
+
+        dumper = SearchDumper(
+            extensions=[RelationDumperExt("relations"), IndexedAtDumperExt()]
+        )
+
+    en_language = Record.create({"title": "English", "iso": "en"})
+    db.session.commit()
+    records = []
+    for i in range(5):
+        record = BatchRecord.create({"title": f"Record {i}"})
+        record.relations.language = en_language
+        records.append(record)
+    db.session.commit()
+
+    dumper = BatchRecord.dumper
+    dumps = dumper.dump_many(records, chunk_size=2)
+    assert not isinstance(dumps, list)
+    dumps = list(dumps)
+    assert len(dumps) == 5
+    for record, dump in zip(records, dumps):
+        expected = record.dumps()
+        dump.pop("indexed_at")
+        expected.pop("indexed_at")
+        assert dump == expected
+        assert dump["language"]["iso"] == "en"
+
+    # The same timestamp is used for a batch.
+    dumps = list(dumper.dump_many(records))
+    assert len({d["indexed_at"] for d in dumps}) == 1
+
+    # Load the dumps
+    loaded = list(dumper.load_many(dumps, BatchRecord, chunk_size=2))
+    assert [r.id for r in loaded] == [r.id for r in records]
+    for dump, new_record in zip(dumps, loaded):
+        assert new_record == BatchRecord.loads(dump, loader=dumper)
+        assert "indexed_at" not in new_record
+    # The dumps are not modified.
+    assert "indexed_at" in dumps[0]
+
+
+def test_esdumper_dump_many_overridden(testapp, db, example_data):
+    """Test dumping and loading a batch of records with an overridden dumper."""
+
+    class CustomDumper(SearchDumper):
+        def dump(self, record, data):
+            data = super().dump(record, data)
+            data["custom"] = True
+            return data
+
+        def load(self, data, record_cls):
+            data.pop("custom")
+            record = super().load(data, record_cls)
+            record["loaded"] = True
+            return record
+
+    class CustomRecord(Record):
+        dumper = CustomDumper()
+
+    records = [CustomRecord.create({"title": f"Record {i}"}) for i in range(3)]
+    db.session.commit()
+
+    dumper = CustomRecord.dumper
+    dumps = list(dumper.dump_many(records, chunk_size=2))
+    assert dumps == [record.dumps() for record in records]
+    assert all(dump["custom"] for dump in dumps)
+
+    loaded = list(dumper.load_many(dumps, CustomRecord, chunk_size=2))
+    assert loaded == [CustomRecord.loads(dump) for dump in dumps]
+    assert all(record["loaded"] for record in loaded)
+    assert all(dump["custom"] for dump in dumps)
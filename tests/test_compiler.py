@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the compiled validation backend."""
+
+import logging
+
+import pytest
+from jsonschema import FormatChecker
+from jsonschema.exceptions import ValidationError
+
+from invenio_records.api import Record
+from invenio_records.compiler import (
+    CompiledBackend,
+    CompiledValidator,
+    SchemaCompiler,
+)
+from invenio_records.validators import JSONSchemaBackend, PartialDraft4Validator
+
+
+def local_ref_resolver_store_factory():
+    """Build local JSONSchema ref resolver store."""
+    return {
+        "local://authors.json": {
+            "$id": "local://authors.json",
+            "type": "array",
+            "items": {"type": "string", "minLength": 1},
+        },
+        "local://books.json": {
+            "$id": "local://books.json",
+            "type": "object",
+            "definitions": {
+                "price": {
+                    "type": "string",
+                    "pattern": "^[0-9]+$",
+                },
+            },
+            "properties": {
+                "title": {"type": "string"},
+                "price": {"$ref": "#/definitions/price"},
+                "authors": {"$ref": "local://authors.json"},
+                "format": {"enum": ["paperback", "hardcover"]},
+                "pages": {"type": "integer", "minimum": 1},
+            },
+            "required": ["title"],
+        },
+        "local://locations.json": {
+            "$id": "local://locations.json",
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "type": "object",
+            "required": ["latitude", "longitude"],
+            "properties": {
+                "latitude": {"type": "number", "minimum": -90, "maximum": 90},
+                "longitude": {"type": "number", "minimum": -180, "maximum": 180},
+                "name": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+            },
+            "additionalProperties": False,
+        },
+        "local://dates.json": {
+            "$id": "local://dates.json",
+            "type": "object",
+            "properties": {"date": {"type": "string", "format": "date"}},
+        },
+        "local://unsupported.json": {
+            "$id": "local://unsupported.json",
+            "type": "object",
+            "properties": {"tags": {"type": "array", "uniqueItems": True}},
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def app_config(app_config):
+    """Configure the compiled validation backend."""
+    app_config["RECORDS_REFRESOLVER_CLS"] = (
+        "invenio_records.resolver.InvenioRefResolver"
+    )
+    app_config["RECORDS_REFRESOLVER_STORE"] = local_ref_resolver_store_factory()
+    app_config["RECORDS_VALIDATION_BACKEND"] = (
+        "invenio_records.compiler.CompiledBackend"
+    )
+    return app_config
+
+
+def _error(state, data, **kwargs):
+    """Validate a document and return the error."""
+    try:
+        state.validate(data, data["$schema"], **kwargs)
+    except ValidationError as e:
+        return (e.message, list(e.path), list(e.schema_path), e.validator)
+    return None
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"title": "The Hobbit", "price": "20", "authors": ["J. R. R. Tolkien"]},
+        {"title": "The Hobbit", "pages": 310, "format": "paperback"},
+        {"price": "20"},
+        {"title": 1},
+        {"title": "The Hobbit", "price": "twenty"},
+        {"title": "The Hobbit", "authors": ["J. R. R. Tolkien", ""]},
+        {"title": "The Hobbit", "authors": "J. R. R. Tolkien"},
+        {"title": "The Hobbit", "format": "ebook"},
+        {"title": "The Hobbit", "pages": 0},
+        {"title": "The Hobbit", "pages": 1.5},
+        {"title": "The Hobbit", "pages": True},
+    ],
+)
+def test_identical_errors_books(testapp, data):
+    """Compare errors of the compiled and the jsonschema backend."""
+    _assert_identical_errors(testapp, dict(data, **{"$schema": "local://books.json"}))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"latitude": 42, "longitude": 42},
+        {"latitude": 42, "longitude": 42, "name": None},
+        {"latitude": 42.5, "longitude": -181},
+        {"latitude": "invalid", "longitude": 42},
+        {"latitude": 42},
+        {"latitude": 42, "longitude": 42, "name": 1},
+        {"latitude": 42, "longitude": 42, "other": 1},
+    ],
+)
+def test_identical_errors_locations(testapp, data):
+    """Compare errors of the compiled and the jsonschema backend."""
+    data = dict(data, **{"$schema": "local://locations.json"})
+    _assert_identical_errors(testapp, data)
+
+
+def _assert_identical_errors(app, data):
+    """Validate a document with both backends and compare the errors."""
+    state = app.extensions["invenio-records"]
+    try:
+        state.validation_backend = JSONSchemaBackend()
+        state.invalidate_validators()
+        expected = _error(state, data)
+        state.validation_backend = CompiledBackend()
+        state.invalidate_validators()
+        assert _error(state, data) == expected
+    finally:
+        state.invalidate_validators()
+
+
+def test_compiled_validator(testapp, monkeypatch, caplog):
+    """Test which schemas are compiled."""
+    state = testapp.extensions["invenio-records"]
+    assert isinstance(state.validation_backend, CompiledBackend)
+
+    def build(schema, **kwargs):
+        return state._build_validator({"$ref": schema}, None, {}, **kwargs)
+
+    assert isinstance(build("local://books.json"), CompiledValidator)
+    assert build("local://books.json").is_valid({"title": "The Hobbit"})
+    assert not build("local://books.json").is_valid({"title": 1})
+
+    # Unsupported keywords, overridden keywords and format checks are left
+    # to jsonschema.
+    assert not isinstance(build("local://unsupported.json"), CompiledValidator)
+    assert not isinstance(
+        state._build_validator(
+            {"$ref": "local://books.json"}, PartialDraft4Validator, {}
+        ),
+        CompiledValidator,
+    )
+    assert isinstance(build("local://dates.json"), CompiledValidator)
+    assert not isinstance(
+        build("local://dates.json", format_checker=FormatChecker()),
+        CompiledValidator,
+    )
+
+    # Other compilation errors are logged, and left to jsonschema too.
+    def fail(self, schema):
+        raise RuntimeError("compiler bug")
+
+    monkeypatch.setattr(SchemaCompiler, "compile", fail)
+    with caplog.at_level(logging.WARNING):
+        assert not isinstance(build("local://books.json"), CompiledValidator)
+    assert "compiler bug" in caplog.text
+    monkeypatch.undo()
+    caplog.clear()
+    assert not isinstance(build("local://unsupported.json"), CompiledValidator)
+    assert not caplog.records
+
+    # Partial validation keeps working with the compiled backend.
+    data = {"$schema": "local://books.json", "price": "20"}
+    with pytest.raises(ValidationError):
+        Record(data).validate()
+    Record(data).validate(validator=PartialDraft4Validator)
@@ -3,14 +3,21 @@
 
 """Test of dictionary utilities."""
 
+import random
+import sys
 from copy import deepcopy
+from datetime import date
 
 import pytest
 
 from invenio_records.dictutils import (
+    KeyPath,
     clear_none,
+    clear_none_list,
+    deepcopy_json,
     dict_lookup,
     dict_merge,
+    dict_set,
     filter_dict_keys,
 )
 
@@ -39,6 +46,100 @@ def test_clear_none():
     assert d == {"b": [{"a": "1"}]}
 
 
+def _clear_none_reference(d):
+    """Baseline recursive implementation of ``clear_none`` (copied verbatim)."""
+    del_keys = []
+    for k, v in d.items():
+        if v is None:
+            del_keys.append(k)
+        elif isinstance(v, dict):
+            _clear_none_reference(v)
+            if v == {}:
+                del_keys.append(k)
+        elif isinstance(v, list):
+            _clear_none_list_reference(v)
+            if v == []:
+                del_keys.append(k)
+
+    # Delete the keys (cannot be done during the dict iteration)
+    for k in del_keys:
+        del d[k]
+
+
+def _clear_none_list_reference(ls):
+    """Baseline recursive implementation of ``clear_none_list``."""
+    del_idx = []
+    for i, v in enumerate(ls):
+        if v is None:
+            del_idx.append(i)
+        elif isinstance(v, list):
+            _clear_none_list_reference(v)
+            if v == []:
+                del_idx.append(i)
+        elif isinstance(v, dict):
+            _clear_none_reference(v)
+            if v == {}:
+                del_idx.append(i)
+
+    # Delete the keys (reverse so index stays stable).
+    for i in reversed(del_idx):
+        del ls[i]
+
+
+def _random_tree(rng, depth):
+    """Generate a random JSON-like tree with many None and empty values."""
+    choice = rng.random()
+    if depth == 0 or choice < 0.3:
+        return rng.choice([None, None, 0, "", "a", False, 1.5])
+    size = rng.randint(0, 4)
+    if choice < 0.65:
+        return {f"k{i}": _random_tree(rng, depth - 1) for i in range(size)}
+    return [_random_tree(rng, depth - 1) for _ in range(size)]
+
+
+def test_clear_none_property():
+    """Test clear_none against the baseline recursive implementation."""
+    rng = random.Random(42)
+    for _ in range(500):
+        d = {"root": _random_tree(rng, 6), "other": _random_tree(rng, 4)}
+        expected = deepcopy(d)
+        _clear_none_reference(expected)
+
+        # Copy mode leaves the input untouched.
+        original = deepcopy(d)
+        assert clear_none(d, copy=True) == expected
+        assert d == original
+
+        assert clear_none(d) is d
+        assert d == expected
+
+        ls = [_random_tree(rng, 5) for _ in range(3)]
+        expected = deepcopy(ls)
+        _clear_none_list_reference(expected)
+        assert clear_none_list(ls, copy=True) == expected
+        clear_none_list(ls)
+        assert ls == expected
+
+
+def test_clear_none_deep():
+    """Test clear_none on documents nested deeper than the recursion limit."""
+    depth = sys.getrecursionlimit() * 2
+    d = leaf = {}
+    for _ in range(depth):
+        leaf["a"] = [{"b": None, "c": 1}]
+        leaf = leaf["a"][0]
+
+    copied = clear_none(d, copy=True)
+    assert d["a"][0]["b"] is None
+    clear_none(d)
+    # Comparing such documents is recursive, so walk them instead.
+    for node in (copied, d):
+        for _ in range(depth):
+            assert "b" not in node and len(node["a"]) == 1
+            node = node["a"][0]
+        assert node == {"c": 1}
+
+
 def test_dict_lookup():
     """Test lookup by a key."""
     d = {
@@ -61,6 +162,39 @@ def test_dict_lookup():
     assert pytest.raises(KeyError, dict_lookup, d, "d.3")
 
 
+def test_keypath():
+    """Test compiled lookup keys behave like dict_lookup and dict_set."""
+    d = {
+        "a": 1,
+        "b": {"c": None},
+        "d": ["1", {"e": "2"}],
+    }
+    keys = ["a", "b", "b.c", "d", "d.0", "d.1.e", "d.-1", ["d", 1, "e"]]
+    for key in keys:
+        path = KeyPath(key)
+        assert path.get(d) is dict_lookup(d, key)
+        assert path.get(d, parent=True) is dict_lookup(d, key, parent=True)
+        assert dict_lookup(d, path) is dict_lookup(d, key)
+    for key in ["x", "a.x", "b.x", "b.c.0", "d.3", "d.x", "d.0.x"]:
+        with pytest.raises(KeyError):
+            dict_lookup(d, key)
+        with pytest.raises(KeyError):
+            KeyPath(key).get(d)
+    with pytest.raises(KeyError):
+        KeyPath("")
+
+    path = KeyPath("f.g.h")
+    assert path.keys == ("f", "g", "h")
+    assert path.parent == KeyPath(["f", "g"])
+    assert str(path) == "f.g.h"
+    expected = deepcopy(d)
+    dict_set(expected, "f.g.h", 3)
+    path.set(d, 3)
+    assert d == expected and d["f"] == {"g": {"h": 3}}
+    dict_set(d, KeyPath(["d", 1, "e"]), "3")
+    assert d["d"][1] == {"e": "3"}
+
+
 def test_dict_merge():
     """Test dict merge."""
     dest = dict()
@@ -92,3 +226,22 @@ def test_filter_dict_keys():
     assert filter_dict_keys(
         source, ["foo1.bar1", "foo2", "foo3.bar1.foo4", "foo3.bar3"]
     ) == {"foo1": {"bar1": 1}, "foo2": 1, "foo3": {"bar1": {"foo4": 0}, "bar3": 2}}
+
+
+def test_deepcopy_json():
+    """Test copy of JSON documents."""
+    src = {
+        "a": [1, 2.5, True, None, "x", {"b": [[]]}],
+        "c": {"d": {"e": "f"}},
+        "date": date(2020, 9, 3),
+        "tuple": ([1],),
+    }
+    copy = deepcopy_json(src)
+    assert copy == src
+    assert copy is not src
+    assert copy["a"] is not src["a"]
+    assert copy["a"][5]["b"][0] is not src["a"][5]["b"][0]
+    assert copy["c"]["d"] is not src["c"]["d"]
+    # Other objects are copied with deepcopy.
+    assert copy["tuple"][0] is not src["tuple"][0]
+    assert copy["date"] == src["date"]
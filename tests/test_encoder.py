@@ -168,3 +168,22 @@ def test_encoding_with_schema_fail(testapp, database, testdate, schema):
 
     rec.update(data)
     assert pytest.raises(ValidationError, rec.commit)
+
+
+@pytest.mark.parametrize("copy_strategy", ["tree", "deepcopy", "json"])
+def test_copy_strategy(testapp, db, copy_strategy):
+    """Test that the model JSON is isolated from the record."""
+    Record.model_cls.copy_strategy = copy_strategy
+    try:
+        rec = Record.create({"title": "Title", "nested": {"list": [1, 2]}})
+        db.session.commit()
+
+        rec = Record.get_record(rec.id)
+        rec["nested"]["list"].append(3)
+        assert rec.model.json == {"title": "Title", "nested": {"list": [1, 2]}}
+
+        rec.commit()
+        rec["nested"]["list"].append(4)
+        assert rec.model.json["nested"]["list"] == [1, 2, 3]
+    finally:
+        Record.model_cls.copy_strategy = "tree"
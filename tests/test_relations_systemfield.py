@@ -3,18 +3,30 @@
 
 """Tests for relations system field."""
 
+import time
 from collections.abc import Iterable
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
 
 from invenio_records.api import Record
+from invenio_records.errors import ReadOnlyRecordError
+from invenio_records.models import RecordDependency
 from invenio_records.systemfields import PKRelation, RelationsField, SystemFieldsMixin
 from invenio_records.systemfields.relations import (
     InvalidRelationValue,
     PKListRelation,
     PKNestedListRelation,
+    RelatedRecordsCache,
+    RelationListResult,
     RelationsMapping,
 )
+from invenio_records.systemfields.relations.dependencies import (
+    dumped_revisions,
+    iter_stale_records,
+    mark_current,
+)
 from invenio_records.systemfields.relations.errors import InvalidCheckValue
 
 
@@ -1402,3 +1414,431 @@ def test_nested_field_dereferencing(testapp, db, languages):
         "information": fr_lang["information"],
         "@v": str(fr_lang.id) + "::" + str(fr_lang.revision_id),
     }
+
+
+def test_relations_prefetch(testapp, db, languages, monkeypatch):
+    """Test related records are resolved with one query per relation."""
+    Language, languages = languages
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            language=PKRelation(key="language", keys=["iso"], record_cls=Language),
+            languages=PKListRelation(
+                key="languages", keys=["iso"], record_cls=Language
+            ),
+        )
+
+    ids = [str(lang.id) for lang in languages.values()]
+    record = Record1(
+        {
+            "language": {"id": ids[0]},
+            "languages": [{"id": id_} for id_ in ids] + [{"id": ids[0]}],
+        }
+    )
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        record.relations.dereference()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    # One query per relation field, instead of one query per related record.
+    assert len(statements) == 2
+    assert [v["iso"] for v in record["languages"]] == list(languages) + ["en"]
+    assert record["language"]["iso"] == "en"
+
+    # Already cached or invalid IDs are not fetched.
+    field = Record1.relations.languages
+    field.prefetch(ids + ["invalid", None])
+    assert sorted(field.cache) == sorted(ids)
+
+    # Invalid IDs are not queried, but database errors are not hidden.
+    assert field.resolve("invalid") is None
+    field.cache.clear()
+
+    def get_records(*args, **kwargs):
+        raise OperationalError("SELECT", {}, Exception("connection lost"))
+
+    monkeypatch.setattr(Language, "get_records", get_records)
+    with pytest.raises(OperationalError):
+        field.prefetch(ids)
+
+
+def test_relations_missing(testapp, db, languages):
+    """Test existence checks only query the primary keys."""
+    Language, languages = languages
+    ids = [str(lang.id) for lang in languages.values()]
+    deleted = Language.create({"title": "Latin", "iso": "la"})
+    deleted.delete()
+    db.session.commit()
+    deleted_id = str(deleted.id)
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            languages=PKListRelation(
+                key="languages", keys=["iso"], record_cls=Language
+            ),
+            nested=PKNestedListRelation(key="nested", record_cls=Language),
+        )
+
+    field = Record1.relations.languages
+    Record1({}).relations  # inject the relations cache
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        assert field.exists_many(ids)
+        assert field.missing(ids + [unknown, "invalid", deleted_id]) == [
+            "invalid",
+            unknown,
+            deleted_id,
+        ]
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    assert len(statements) == 2
+    # Related records are not loaded.
+    assert field.cache == {}
+
+    record = Record1.create({})
+    with pytest.raises(InvalidRelationValue):
+        record.relations.languages = ids + [unknown]
+    with pytest.raises(InvalidRelationValue):
+        record.relations.nested = [ids, [unknown]]
+    record.relations.nested = [ids[:2], ids[2:]]
+
+    record["languages"] = [{"id": ids[0]}, {"id": unknown}]
+    with pytest.raises(InvalidRelationValue) as exc_info:
+        record.commit()
+    assert str(exc_info.value) == f"Invalid value {unknown}."
+
+
+def test_relations_missing_custom_resolve(testapp, db, languages):
+    """Test existence checks go through an overridden resolve()."""
+    Language, languages = languages
+
+    class EnglishOnlyRelation(PKListRelation):
+        def resolve(self, id_):
+            obj = super().resolve(id_)
+            return obj if obj is not None and obj["iso"] == "en" else None
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            languages=EnglishOnlyRelation(
+                key="languages", keys=["iso"], record_cls=Language
+            ),
+        )
+
+    Record1({}).relations  # inject the relations cache
+    field = Record1.relations.languages
+    en, fr = str(languages["en"].id), str(languages["fr"].id)
+    assert field.exists(en)
+    assert not field.exists(fr)
+    assert field.missing([en, fr]) == [fr]
+
+
+def test_relations_missing_custom_exists(testapp, db, languages):
+    """Test validation goes through overridden exists_many() and exists()."""
+    Language, languages = languages
+    en, fr = str(languages["en"].id), str(languages["fr"].id)
+
+    class EnglishOnlyRelation(PKListRelation):
+        def exists_many(self, ids):
+            return all(id_ == en for id_ in ids)
+
+    class EnglishOnlyNestedRelation(PKNestedListRelation):
+        def exists_many(self, ids):
+            return all(id_ == en for inner_ids in ids for id_ in inner_ids)
+
+    class EnglishOnlyResult(RelationListResult):
+        def exists(self, id_):
+            return id_ == en
+
+    class ResultRelation(PKListRelation):
+        result_cls = EnglishOnlyResult
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            languages=EnglishOnlyRelation(
+                key="languages", keys=["iso"], record_cls=Language
+            ),
+            nested=EnglishOnlyNestedRelation(
+                key="nested", keys=["iso"], record_cls=Language
+            ),
+            results=ResultRelation(key="results", keys=["iso"], record_cls=Language),
+        )
+
+    record = Record1({})
+    record.relations.languages = [en]
+    with pytest.raises(InvalidRelationValue, match=r"^Invalid values\.$"):
+        record.relations.languages = [en, fr]
+    assert Record1.relations.languages.missing([en, fr]) == [fr]
+    record.relations.nested = [[en]]
+    with pytest.raises(InvalidRelationValue, match=r"^Invalid values\.$"):
+        record.relations.nested = [[en], [fr]]
+    assert Record1.relations.nested.missing([en, fr]) == [fr]
+
+    record = Record1(
+        {
+            "languages": [{"id": fr}],
+            "nested": [[{"id": en}]],
+            "results": [{"id": en}],
+        }
+    )
+    with pytest.raises(InvalidRelationValue):
+        record.relations.validate(["languages"])
+    record.relations.validate(["nested", "results"])
+    record["results"].append({"id": fr})
+    with pytest.raises(InvalidRelationValue):
+        record.relations.validate(["results"])
+
+
+def test_related_records_cache(testapp, db, languages):
+    """Test the process-wide related records cache."""
+    Language, languages = languages
+    en_lang = languages["en"]
+    en_id = str(en_lang.id)
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            language=PKRelation(key="language", keys=["iso"], record_cls=Language),
+        )
+
+    state = testapp.extensions["invenio-records"]
+    cache = RelatedRecordsCache(maxsize=10)
+    state.related_records_cache = cache
+    try:
+        # Resolved once for all records.
+        for _ in range(3):
+            record = Record1({"language": {"id": en_id}})
+            assert record.relations.language() == en_lang
+        assert cache.info()["hits"] == 2
+        assert cache.info()["misses"] == 1
+        assert cache.info()["currsize"] == 1
+
+        # Updates invalidate the cache.
+        en_lang = Language.get_record(en_id)
+        en_lang["iso"] = "eng"
+        en_lang.commit()
+        db.session.commit()
+        assert cache.info()["currsize"] == 0
+        record = Record1({"language": {"id": en_id}})
+        record.relations.dereference()
+        assert record["language"]["iso"] == "eng"
+
+        # Older revisions are not cached anymore.
+        cache.invalidate(en_id, revision_id=en_lang.revision_id + 1)
+        cache.set(Language, en_id, en_lang)
+        assert cache.get(Language, en_id) is None
+    finally:
+        state.related_records_cache = None
+
+    # Entries expire
+    cache = RelatedRecordsCache(ttl=0.01)
+    cache.set(Language, en_id, en_lang)
+    assert cache.get(Language, en_id) == en_lang
+    time.sleep(0.02)
+    assert cache.get(Language, en_id) is None
+
+
+def test_related_records_cache_copies(testapp, db, languages):
+    """Test the related records cache returns read-only copies."""
+    Language, languages = languages
+    en_lang = languages["en"]
+    en_id = str(en_lang.id)
+
+    cache = RelatedRecordsCache()
+    cache.set(Language, en_id, en_lang)
+    en_lang["iso"] = "changed"
+
+    cached = cache.get(Language, en_id)
+    assert cached["iso"] == "en"
+    assert cached.id == en_lang.id
+    assert cached.revision_id == en_lang.revision_id
+    cached["information"]["ethnicity"] = "changed"
+    assert cached is not cache.get(Language, en_id)
+    assert cache.get(Language, en_id)["information"]["ethnicity"] == "English"
+
+    pytest.raises(ReadOnlyRecordError, cached.commit)
+    pytest.raises(ReadOnlyRecordError, cached.delete)
+
+    # All the columns of the model are available.
+    assert cached.created == en_lang.created
+    assert cached.updated == en_lang.updated
+    assert cached.is_deleted is False
+    assert cached.model.data["iso"] == "en"
+    assert cached.model.json["iso"] == "en"
+    cached.model.json["iso"] = "changed"
+    assert cache.get(Language, en_id).model.json["iso"] == "en"
+
+
+def test_related_records_cache_transactions(testapp, db, languages):
+    """Test the related records cache only shares committed records."""
+    Language, languages = languages
+    en_id = str(languages["en"].id)
+    cache = RelatedRecordsCache()
+
+    # Records read after a write are discarded on rollback.
+    en_lang = Language.get_record(en_id)
+    en_lang["iso"] = "uncommitted"
+    en_lang.commit()
+    cache.set(Language, en_id, en_lang)
+    assert cache.get(Language, en_id) is None
+    db.session.rollback()
+    assert cache.get(Language, en_id) is None
+
+    # ... and added on commit.
+    en_lang = Language.get_record(en_id)
+    assert en_lang["iso"] == "en"
+    en_lang.commit()
+    db.session.flush()
+    cache.set(Language, en_id, en_lang)
+    assert cache.get(Language, en_id) is None
+    with db.session.begin_nested():
+        pass
+    assert cache.get(Language, en_id) is None
+    db.session.commit()
+    assert cache.get(Language, en_id)["iso"] == "en"
+
+    # Records read without writing are added right away.
+    cache.invalidate(en_id)
+    cache.set(Language, en_id, Language.get_record(en_id))
+    assert cache.get(Language, en_id)["iso"] == "en"
+
+
+def test_relations_dependencies(testapp, db, languages):
+    """Test tracking of the revisions of related records."""
+    Language, languages = languages
+    en_lang, fr_lang = languages["en"], languages["fr"]
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            language=PKRelation(key="language", keys=["iso"], record_cls=Language),
+            languages=PKListRelation(
+                key="languages", keys=["iso"], record_cls=Language
+            ),
+        )
+
+    testapp.config["RECORDS_RELATIONS_TRACK_DEPENDENCIES"] = True
+    try:
+        record = Record1.create({"language": {"id": str(en_lang.id)}})
+        other = Record1.create({})
+        other.relations.languages = [str(fr_lang.id), str(en_lang.id)]
+        other.commit()
+        db.session.commit()
+
+        rows = db.session.query(RecordDependency).all()
+        assert {(r.record_id, r.related_id) for r in rows} == {
+            (record.id, en_lang.id),
+            (other.id, en_lang.id),
+            (other.id, fr_lang.id),
+        }
+        assert list(iter_stale_records(Language)) == []
+
+        # Updating a related record makes its dependents stale.
+        fr_lang = Language.get_record(fr_lang.id)
+        fr_lang["title"] = "Français"
+        fr_lang.commit()
+        db.session.commit()
+        assert list(iter_stale_records(Language)) == [other.id]
+
+        # The record is dumped (e.g. reindexed)...
+        dump = Record1.get_record(other.id)
+        dump.relations.dereference()
+        revisions = dumped_revisions(dump)
+        assert revisions == {
+            str(en_lang.id): en_lang.revision_id,
+            str(fr_lang.id): fr_lang.revision_id,
+        }
+        # ... but the related record changes before it is marked as current.
+        fr_lang = Language.get_record(fr_lang.id)
+        fr_lang["title"] = "Francais"
+        fr_lang.commit()
+        db.session.commit()
+        mark_current(Language, {other.id: revisions})
+        db.session.commit()
+        assert list(iter_stale_records(Language)) == [other.id]
+
+        revisions[str(fr_lang.id)] = fr_lang.revision_id
+        mark_current(Language, {other.id: revisions})
+        db.session.commit()
+        assert list(iter_stale_records(Language)) == []
+
+        # Nothing is written if the dependencies did not change.
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            if "records_dependencies" in statement:
+                statements.append(statement.split()[0])
+
+        event.listen(db.engine, "before_cursor_execute", count)
+        try:
+            Record1.get_record(other.id).commit()
+            db.session.commit()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count)
+        assert statements == ["SELECT"]
+
+        # Dependencies are replaced on commit and removed on delete.
+        other = Record1.get_record(other.id)
+        other.relations.languages = [str(en_lang.id)]
+        other.commit()
+        record.delete()
+        db.session.commit()
+        rows = db.session.query(RecordDependency).all()
+        assert [(r.record_id, r.related_id) for r in rows] == [(other.id, en_lang.id)]
+    finally:
+        testapp.config["RECORDS_RELATIONS_TRACK_DEPENDENCIES"] = False
+
+
+def test_relations_dereference_many(testapp, db, languages):
+    """Test dereferencing the relations of several records at once."""
+    Language, languages = languages
+    ids = [str(lang.id) for lang in languages.values()]
+
+    class Record1(Record, SystemFieldsMixin):
+        relations = RelationsField(
+            language=PKRelation(key="language", keys=["iso"], record_cls=Language),
+            languages=PKListRelation(
+                key="languages", keys=["iso"], record_cls=Language
+            ),
+        )
+
+    records = [
+        Record1(
+            {
+                "language": {"id": id_},
+                "languages": [{"id": id_}, {"id": ids[0]}],
+            }
+        )
+        for id_ in ids
+    ]
+
+    statements = []
+
+    def count(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        Record1.relations.dereference_many(records)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    # One query per relation field for all records.
+    assert len(statements) == 2
+    for record, lang in zip(records, languages.values()):
+        assert record["language"]["iso"] == lang["iso"]
+        assert [v["iso"] for v in record["languages"]] == [lang["iso"], "en"]
+        assert "@v" in record["language"]
@@ -4,6 +4,7 @@
 """Tests Invenio-Records JSONSchema ref resolver."""
 
 import pytest
+from jsonschema.exceptions import ValidationError
 
 from invenio_records.api import Record
 from invenio_records.resolver import urljoin_with_custom_scheme
@@ -80,3 +81,28 @@ def test_invenio_refresolver_with_local_store(db):
 def test_urljoin_with_custom_scheme(resolution_scope, scope, expected_output):
     """Test urljoin supporting custom schemas."""
     assert expected_output == urljoin_with_custom_scheme(resolution_scope, scope)
+
+
+def test_validator_cache(testapp, db):
+    """Test caching of validators for schemas given by URL."""
+    state = testapp.extensions["invenio-records"]
+    state.invalidate_validators()
+    cache = state.validator_cache
+    hits, misses = cache.hits, cache.misses
+
+    data = {"$schema": "local://books.json#", "title": "The Hobbit"}
+    Record(data).validate()
+    Record(data).validate()
+    assert (cache.hits - hits, cache.misses - misses) == (1, 1)
+
+    # Errors are reported as without cache.
+    with pytest.raises(ValidationError) as exc_info:
+        Record({"$schema": "local://books.json#", "authors": [1]}).validate()
+    assert exc_info.value.message == "1 is not of type 'string'"
+    assert cache.hits - hits == 2
+
+    # Invalidation of a schema
+    state.invalidate_validators("local://books.json#")
+    Record(data).validate()
+    assert cache.misses - misses == 2
+    assert cache.info()["currsize"] == 1
@@ -6,10 +6,13 @@
 
 """Test for system fields."""
 
+import gc
+
 import pytest
 
 from invenio_records.api import Record
 from invenio_records.dumpers import SearchDumper
+from invenio_records.extensions import _legacy_hooks, _legacy_hooks_cache
 from invenio_records.systemfields import (
     ConstantField,
     DictField,
@@ -207,6 +210,32 @@ def test_attrname_injection(testapp, MyRecord):
     assert MyRecord.base.attr_name == "base"
 
 
+def test_field_overridden_key(testapp):
+    """Test the key path follows a key property overridden by a subclass."""
+
+    class MetadataField(SystemField):
+        @property
+        def key(self):
+            return f"metadata.{self.attr_name}"
+
+        def __get__(self, record, owner=None):
+            if record is None:
+                return self
+            return self.get_dictkey(record)
+
+        def __set__(self, record, value):
+            self.set_dictkey(record, value, create_if_missing=True)
+
+    class MetadataRecord(Record, SystemFieldsMixin):
+        title = MetadataField()
+
+    record = MetadataRecord({"metadata": {"title": "Test"}})
+    assert MetadataRecord.title.key_path.keys == ("metadata", "title")
+    assert record.title == "Test"
+    record.title = "New"
+    assert record == {"metadata": {"title": "New"}}
+
+
 def test_systemfields_mro(testapp):
     """Test overwriting of system fields according to MRO."""
 
@@ -284,6 +313,74 @@ def test_extension_post_load(testapp, db, ExtensionRecord):
     ]
 
 
+def test_extension_dispatch_table(testapp, ExtensionRecord):
+    """Test only fields overriding a hook are registered for it."""
+
+    class NoopField(SystemField):
+        def __set__(self, record, value):
+            self.values.append(value)
+
+    class DispatchRecord(ExtensionRecord):
+        noop = NoopField()
+
+    ext = DispatchRecord._extensions[-1]
+    assert set(ext.declared_fields) == {"ext", "noop"}
+    assert ext._hooks["pre_commit"] == [DispatchRecord.ext]
+    assert ext._hooks["post_init"] == [DispatchRecord.ext]
+
+    # Field data passed to the constructor is still set.
+    DispatchRecord.noop.values = []
+    DispatchRecord({})
+    DispatchRecord({}, noop="value")
+    assert DispatchRecord.noop.values == ["value"]
+
+
+def test_extension_deprecated_hook_signature(testapp, db):
+    """Test hooks without the data argument are still supported."""
+
+    class OldExtension(SystemField):
+        def __init__(self):
+            self.called = []
+            super().__init__()
+
+        def pre_dump(self, record, dumper=None):
+            self.called.append("pre_dump")
+
+        def post_load(self, record, loader=None):
+            self.called.append("post_load")
+
+    class OldRecord(Record, SystemFieldsMixin):
+        dumper = SearchDumper()
+        ext = OldExtension()
+
+    # The signature is only inspected once, but the warning is raised on
+    # each call.
+    for _ in range(2):
+        with pytest.warns(DeprecationWarning):
+            dump = OldRecord({}).dumps()
+        with pytest.warns(DeprecationWarning):
+            OldRecord.loads(dump)
+    assert OldRecord.ext.called == ["pre_dump", "post_load"] * 2
+    assert _legacy_hooks(OldExtension) == {"pre_dump", "post_load"}
+
+
+def test_extension_legacy_hooks_cache():
+    """Test the signatures of the hooks are cached per class."""
+
+    class DynamicExtension(SystemField):
+        def post_dump(self, record, dumper=None):
+            pass
+
+    assert _legacy_hooks(DynamicExtension) == {"post_dump"}
+    assert _legacy_hooks(SystemField) == set()
+    assert DynamicExtension in _legacy_hooks_cache
+
+    # The cache does not keep the classes alive.
+    del DynamicExtension
+    gc.collect()
+    assert not any(c.__name__ == "DynamicExtension" for c in _legacy_hooks_cache)
+
+
 def test_extension_commit(testapp, db, ExtensionRecord):
     """Test commit hooks."""
     rec = ExtensionRecord.create({})
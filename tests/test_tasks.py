@@ -0,0 +1,297 @@
+# SPDX-FileCopyrightText: 2026 CERN.
+# SPDX-License-Identifier: MIT
+
+"""Test the Celery tasks."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from invenio_records import Record
+from invenio_records.models import RecordMetadata
+from invenio_records.revisions import (
+    is_delta,
+    listen_delta,
+    prune_revisions,
+    select_pruned,
+)
+from invenio_records.systemfields.relations import RelatedRecordsCache
+from invenio_records.tasks.api import (
+    delete_records,
+    dispatch_records,
+)
+from invenio_records.tasks.api import prune_revisions as prune_revisions_task
+from invenio_records.tasks.api import (
+    reencode_records,
+    revalidate_records,
+    undelete_records,
+)
+
+
+def _edit(db, record, count):
+    """Commit changes to a record."""
+    for i in range(count):
+        record["title"] = f"{record['title']}-{i}"
+        record.commit()
+        db.session.commit()
+
+
+def test_select_pruned():
+    """Test the selection of the revisions to prune."""
+    day = datetime(2026, 1, 1, 12)
+    versions = [
+        (1, day),
+        (2, day + timedelta(hours=1)),
+        (3, day + timedelta(days=1)),
+        (4, day + timedelta(days=2)),
+        (5, day + timedelta(days=2, hours=1)),
+        (6, day + timedelta(days=2, hours=2)),
+    ]
+    assert select_pruned(versions, keep_last=2) == [1, 2, 3, 4]
+    assert select_pruned(versions, keep_last=0) == [1, 2, 3, 4, 5]
+    assert select_pruned(versions, keep_last=10) == []
+    assert select_pruned(versions, keep_last=2, keep_daily=True) == [1, 4]
+    assert select_pruned(versions, keep_last=1, keep_daily=True) == [1, 4, 5]
+    before = day + timedelta(days=1)
+    assert select_pruned(versions, keep_last=1, before=before) == [1, 2]
+
+
+def test_prune_revisions(testapp, database):
+    """Test pruning the revisions of records."""
+    db = database
+    record = Record.create({"title": "a"})
+    other = Record.create({"title": "b"})
+    db.session.commit()
+    _edit(db, record, 5)
+    _edit(db, other, 1)
+
+    batches = []
+    for stats in prune_revisions(keep_last=2, record_ids=[record.id, other.id]):
+        db.session.commit()
+        batches.append(stats)
+    assert len(batches) == 1
+    assert batches[0]["records"] == 1 and batches[0]["rows"] == 4
+    assert batches[0]["bytes"] > 0
+
+    versions = list(record.model.versions)
+    assert [v.version_id - 1 for v in versions] == [4, 5]
+    assert versions[0].end_transaction_id == versions[1].transaction_id
+    assert versions[1].end_transaction_id is None
+    assert [r["title"] for r in record.revisions] == ["a-0-1-2-3", "a-0-1-2-3-4"]
+    assert len(other.revisions) == 2
+
+    # The record can still be updated and reverted.
+    _edit(db, record, 1)
+    record = record.revert(4)
+    db.session.commit()
+    assert record["title"] == "a-0-1-2-3"
+
+
+def test_prune_revisions_delta(testapp, database):
+    """Test pruning the snapshot of revisions stored as patches."""
+    db = database
+    testapp.config["RECORDS_REVISIONS_DELTA"] = True
+    listen_delta()
+    try:
+        record = Record.create({"title": "a", "description": "x" * 1000})
+        db.session.commit()
+        _edit(db, record, 3)
+    finally:
+        testapp.config["RECORDS_REVISIONS_DELTA"] = False
+    assert [is_delta(v.json) for v in record.model.versions] == [
+        False,
+        True,
+        True,
+        True,
+    ]
+    expected = [dict(r) for r in record.revisions][2:]
+
+    list(prune_revisions(keep_last=2, record_ids=[record.id]))
+    db.session.commit()
+    assert [dict(r) for r in record.revisions] == expected
+    assert not any(is_delta(v.json) for v in record.model.versions)
+
+
+def test_prune_revisions_task(testapp, database):
+    """Test the Celery task pruning revisions."""
+    db = database
+    record = Record.create({"title": "a"})
+    db.session.commit()
+    _edit(db, record, 3)
+
+    result = prune_revisions_task.apply(
+        kwargs={
+            "model_cls": "invenio_records.models.RecordMetadata",
+            "keep_last": 1,
+            "record_ids": [str(record.id)],
+            "before": (datetime.utcnow() + timedelta(days=1)).isoformat(),
+        }
+    ).get()
+    assert result["records"] == 1 and result["rows"] == 3
+    assert [r.revision_id for r in record.revisions] == [3]
+
+
+def test_revalidate_records(testapp, database):
+    """Test the Celery task validating all the records."""
+    db = database
+    schema = {"type": "object", "properties": {"title": {"type": "string"}}}
+    valid = Record.create({"$schema": schema, "title": "a"})
+    invalid = Record.create({"$schema": schema, "title": "b"})
+    db.session.commit()
+    # E.g. the schema changed after the record was created.
+    invalid.model.json = {"$schema": schema, "title": 1}
+    db.session.commit()
+    valid_id, invalid_id = str(valid.id), str(invalid.id)
+
+    result = revalidate_records.apply(kwargs={"batch_size": 2}).get()
+    assert result["records"] >= 2
+    assert result["invalid"] == len(result["invalid_ids"]) >= 1
+    assert invalid_id in result["invalid_ids"]
+    assert valid_id not in result["invalid_ids"]
+
+    # Records which cannot be validated are counted as invalid.
+    unknown = Record.create({"title": "c"})
+    db.session.commit()
+    unknown.model.json = {"$schema": "local://unknown.json", "title": "c"}
+    db.session.commit()
+    unknown_id = str(unknown.id)
+    result = revalidate_records.apply(kwargs={"start_id": unknown_id}).get()
+    assert unknown_id in result["invalid_ids"]
+    unknown.delete(force=True)
+    db.session.commit()
+
+    # The returned IDs are capped, not the count.
+    result = revalidate_records.apply(kwargs={"max_invalid_ids": 0}).get()
+    assert result["invalid"] >= 1 and result["invalid_ids"] == []
+
+    # Range of IDs
+    start_id, end_id = sorted([valid_id, invalid_id])
+    result = revalidate_records.apply(
+        kwargs={"start_id": start_id, "end_id": end_id}
+    ).get()
+    assert result["invalid_ids"] == ([invalid_id] if start_id == invalid_id else [])
+    result = revalidate_records.apply(kwargs={"start_id": end_id}).get()
+    assert (invalid_id in result["invalid_ids"]) == (end_id == invalid_id)
+
+
+class WrapIntEncoder:
+    """Encoder storing the ``counter`` as an object."""
+
+    def encode(self, data):
+        """Wrap the counter."""
+        if isinstance(data.get("counter"), int):
+            data["counter"] = {"int": data["counter"]}
+        return data
+
+    def decode(self, data):
+        """Unwrap the counter (also supports the previous encoding)."""
+        if isinstance(data.get("counter"), dict):
+            data["counter"] = data["counter"]["int"]
+        return data
+
+
+def test_reencode_records(testapp, database):
+    """Test the Celery task re-encoding all the records."""
+    db = database
+    record = Record.create({"counter": 1})
+    other = Record.create({"title": "a"})
+    db.session.commit()
+    record_id, other_id = record.id, other.id
+    revision_id = other.revision_id
+
+    Record.model_cls.encoder = WrapIntEncoder()
+    try:
+        result = reencode_records.apply(kwargs={"batch_size": 2}).get()
+        assert result["updated"] == 1
+        assert result["records"] >= 2
+        record = Record.get_record(record_id)
+        assert record.model.json == {"counter": {"int": 1}}
+        assert record == {"counter": 1}
+        assert Record.get_record(other_id).revision_id == revision_id
+
+        result = reencode_records.apply().get()
+        assert result["updated"] == 0
+    finally:
+        Record.model_cls.encoder = None
+    record.delete(force=True)
+    db.session.commit()
+
+
+def test_reencode_records_cache(testapp, database):
+    """Test that re-encoding records invalidates the related records cache."""
+    db = database
+    record = Record.create({"counter": 1})
+    db.session.commit()
+    record_id = str(record.id)
+
+    state = testapp.extensions["invenio-records"]
+    cache = RelatedRecordsCache()
+    state.related_records_cache = cache
+    Record.model_cls.encoder = WrapIntEncoder()
+    try:
+        cache.set(Record, record_id, record)
+        # E.g. read by another request before the update.
+        db.session.expunge(record.model)
+        reencode_records.apply(kwargs={"start_id": record_id}).get()
+        assert cache.get(Record, record_id) is None
+        # The previous revision is not added again.
+        cache.set(Record, record_id, record)
+        assert cache.get(Record, record_id) is None
+    finally:
+        Record.model_cls.encoder = None
+        state.related_records_cache = None
+    Record.get_record(record_id).delete(force=True)
+    db.session.commit()
+
+
+def test_dispatch_records(testapp, database):
+    """Test splitting the records in ranges processed by parallel tasks."""
+    db = database
+    records = [Record.create({"counter": i}) for i in range(3)]
+    db.session.commit()
+    ids = [r.id for r in records]
+    total = db.session.query(RecordMetadata).count()
+
+    Record.model_cls.encoder = WrapIntEncoder()
+    try:
+        result = dispatch_records.apply(
+            args=("reencode_records",), kwargs={"chunk_size": 2, "batch_size": 1}
+        ).get()
+        assert len(result["tasks"]) == (total + 1) // 2
+        for record in Record.get_records(ids):
+            assert record.model.json == {"counter": {"int": record["counter"]}}
+
+        result = dispatch_records.apply(args=("revalidate_records",)).get()
+        assert len(result["tasks"]) == 1
+    finally:
+        Record.model_cls.encoder = None
+    for record in Record.get_records(ids):
+        record.delete(force=True)
+    db.session.commit()
+
+    with pytest.raises(ValueError):
+        dispatch_records.apply(args=("delete_records",)).get()
+
+
+def test_delete_undelete_records(testapp, database):
+    """Test the Celery tasks deleting and undeleting records by ID."""
+    db = database
+    records = [Record.create({"title": str(i)}) for i in range(5)]
+    db.session.commit()
+    ids = [str(r.id) for r in records]
+    unknown = "00000000-0000-0000-0000-000000000000"
+
+    result = delete_records.apply(args=(ids[:3] + [unknown],), kwargs={"batch_size": 2})
+    assert result.get() == {"processed": 4, "deleted": 3}
+    found = Record.get_records(ids, with_deleted=True, ordered=True)
+    assert [r.is_deleted for r in found] == [True, True, True, False, False]
+
+    # Already deleted and not deleted records are skipped.
+    result = undelete_records.apply(args=(ids[1:],), kwargs={"batch_size": 2})
+    assert result.get() == {"processed": 4, "undeleted": 2}
+    found = Record.get_records(ids, with_deleted=True, ordered=True)
+    assert [r.is_deleted for r in found] == [True, False, False, False, False]
+
+    result = delete_records.apply(args=(ids,), kwargs={"force": True})
+    assert result.get() == {"processed": 5, "deleted": 5}
+    assert Record.get_records(ids, with_deleted=True) == []